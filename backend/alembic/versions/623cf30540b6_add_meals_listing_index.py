@@ -0,0 +1,25 @@
+"""add meals listing index
+
+Revision ID: 623cf30540b6
+Revises: 7d13f5522f84
+Create Date: 2026-10-19 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '623cf30540b6'
+down_revision: Union[str, Sequence[str], None] = '7d13f5522f84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_dmt_meals_user_id_name_id', 'meals', ['user_id', 'name', 'id'], unique=False, schema='dmt')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_dmt_meals_user_id_name_id', table_name='meals', schema='dmt')
@@ -0,0 +1,33 @@
+"""add resource_versions
+
+Revision ID: a7d3e9c4b521
+Revises: f1a6c8d2e937
+Create Date: 2026-10-19 18:05:33.904126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a7d3e9c4b521'
+down_revision: Union[str, Sequence[str], None] = 'f1a6c8d2e937'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('resource_versions',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('resource', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['dmt.users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'resource'),
+    schema='dmt'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resource_versions', schema='dmt')
@@ -0,0 +1,44 @@
+"""add vehicle_fuel_stats
+
+Revision ID: b5e81c2f4d90
+Revises: 623cf30540b6
+Create Date: 2026-10-19 11:40:12.503614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b5e81c2f4d90'
+down_revision: Union[str, Sequence[str], None] = '623cf30540b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('vehicle_fuel_stats',
+    sa.Column('vehicle_id', sa.UUID(), nullable=False),
+    sa.Column('entries_count', sa.Integer(), nullable=False),
+    sa.Column('full_tank_count', sa.Integer(), nullable=False),
+    sa.Column('total_spent', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('total_liters', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('last_log_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_log_mileage', sa.Integer(), nullable=True),
+    sa.Column('last_full_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_full_mileage', sa.Integer(), nullable=True),
+    sa.Column('pending_liters', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('consumption_distance', sa.Integer(), nullable=False),
+    sa.Column('consumption_liters', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['dmt.vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('vehicle_id'),
+    schema='dmt'
+    )
+    # Existing vehicles are filled by `python -m app.db.scripts.rebuild_fuel_stats`
+    # or lazily on the first stats request.
+
+
+def downgrade() -> None:
+    op.drop_table('vehicle_fuel_stats', schema='dmt')
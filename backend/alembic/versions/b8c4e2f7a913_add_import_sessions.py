@@ -0,0 +1,51 @@
+"""add import_sessions
+
+Revision ID: b8c4e2f7a913
+Revises: a7d3e9c4b521
+Create Date: 2026-10-19 21:12:47.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b8c4e2f7a913'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9c4b521'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('import_sessions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('account_id', sa.UUID(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['dmt.accounts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['dmt.users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    schema='dmt'
+    )
+    op.create_index(op.f('ix_dmt_import_sessions_expires_at'), 'import_sessions', ['expires_at'], unique=False, schema='dmt')
+    op.create_table('import_session_rows',
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.UUID(), nullable=True),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('raw_hash', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['dmt.categories.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['session_id'], ['dmt.import_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id', 'position'),
+    schema='dmt'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_session_rows', schema='dmt')
+    op.drop_index(op.f('ix_dmt_import_sessions_expires_at'), table_name='import_sessions', schema='dmt')
+    op.drop_table('import_sessions', schema='dmt')
@@ -0,0 +1,43 @@
+"""add vehicle history indexes
+
+Revision ID: c3a9d7e215f4
+Revises: b5e81c2f4d90
+Create Date: 2026-10-19 13:05:48.220931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c3a9d7e215f4'
+down_revision: Union[str, Sequence[str], None] = 'b5e81c2f4d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes start with vehicle_id, so they also serve the FK cascades
+    # and lookups that used the single-column ones.
+    op.create_index('ix_dmt_fuel_logs_vehicle_id_date_mileage', 'fuel_logs', ['vehicle_id', 'date', 'mileage'], unique=False, schema='dmt')
+    op.create_index('ix_dmt_service_events_vehicle_id_service_date', 'service_events', ['vehicle_id', 'service_date', 'mileage_at_service'], unique=False, schema='dmt')
+    op.create_index('ix_dmt_technical_inspections_vehicle_id_inspection_date', 'technical_inspections', ['vehicle_id', 'inspection_date'], unique=False, schema='dmt')
+    op.create_index('ix_dmt_insurance_policies_vehicle_id_start_date', 'insurance_policies', ['vehicle_id', 'start_date'], unique=False, schema='dmt')
+
+    op.drop_index(op.f('ix_dmt_fuel_logs_vehicle_id'), table_name='fuel_logs', schema='dmt')
+    op.drop_index(op.f('ix_dmt_service_events_vehicle_id'), table_name='service_events', schema='dmt')
+    op.drop_index(op.f('ix_dmt_technical_inspections_vehicle_id'), table_name='technical_inspections', schema='dmt')
+    op.drop_index(op.f('ix_dmt_insurance_policies_vehicle_id'), table_name='insurance_policies', schema='dmt')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_dmt_insurance_policies_vehicle_id'), 'insurance_policies', ['vehicle_id'], unique=False, schema='dmt')
+    op.create_index(op.f('ix_dmt_technical_inspections_vehicle_id'), 'technical_inspections', ['vehicle_id'], unique=False, schema='dmt')
+    op.create_index(op.f('ix_dmt_service_events_vehicle_id'), 'service_events', ['vehicle_id'], unique=False, schema='dmt')
+    op.create_index(op.f('ix_dmt_fuel_logs_vehicle_id'), 'fuel_logs', ['vehicle_id'], unique=False, schema='dmt')
+
+    op.drop_index('ix_dmt_insurance_policies_vehicle_id_start_date', table_name='insurance_policies', schema='dmt')
+    op.drop_index('ix_dmt_technical_inspections_vehicle_id_inspection_date', table_name='technical_inspections', schema='dmt')
+    op.drop_index('ix_dmt_service_events_vehicle_id_service_date', table_name='service_events', schema='dmt')
+    op.drop_index('ix_dmt_fuel_logs_vehicle_id_date_mileage', table_name='fuel_logs', schema='dmt')
@@ -0,0 +1,52 @@
+"""add timeline_stale_months
+
+Revision ID: c6d1f3a8e024
+Revises: b8c4e2f7a913
+Create Date: 2026-10-20 09:14:37.402611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c6d1f3a8e024'
+down_revision: Union[str, Sequence[str], None] = 'b8c4e2f7a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('timeline_stale_months',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['dmt.users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'month'),
+    schema='dmt'
+    )
+    # The rollup was rebuilt per worker on read and may be stale, so every month with data is
+    # queued and recomputed on each user's next /timeline request.
+    op.execute("DELETE FROM dmt.timeline_monthly")
+    op.execute("""
+        INSERT INTO dmt.timeline_stale_months (user_id, month)
+        SELECT DISTINCT user_id, CAST(date_trunc('month', entry_date) AS date)
+        FROM (
+            SELECT a.user_id, t.date AS entry_date
+            FROM dmt.transactions t JOIN dmt.accounts a ON a.id = t.account_id
+            UNION ALL
+            SELECT l.user_id, p.paid_at FROM dmt.payments p JOIN dmt.loans l ON l.id = p.loan_id
+            UNION ALL
+            SELECT v.user_id, f.date FROM dmt.fuel_logs f JOIN dmt.vehicles v ON v.id = f.vehicle_id
+            UNION ALL
+            SELECT v.user_id, i.start_date FROM dmt.insurance_policies i JOIN dmt.vehicles v ON v.id = i.vehicle_id
+            UNION ALL
+            SELECT v.user_id, ti.inspection_date FROM dmt.technical_inspections ti JOIN dmt.vehicles v ON v.id = ti.vehicle_id
+            UNION ALL
+            SELECT v.user_id, e.service_date FROM dmt.service_events e JOIN dmt.vehicles v ON v.id = e.vehicle_id
+        ) entries
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('timeline_stale_months', schema='dmt')
@@ -0,0 +1,46 @@
+"""add deadline indexes and service_reminders
+
+Revision ID: d8f2b4a61c37
+Revises: c3a9d7e215f4
+Create Date: 2026-10-19 15:22:07.914552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd8f2b4a61c37'
+down_revision: Union[str, Sequence[str], None] = 'c3a9d7e215f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_dmt_insurance_policies_vehicle_id_end_date', 'insurance_policies', ['vehicle_id', 'end_date'], unique=False, schema='dmt')
+    op.create_index('ix_dmt_technical_inspections_vehicle_id_expiration_date', 'technical_inspections', ['vehicle_id', 'expiration_date'], unique=False, schema='dmt')
+
+    op.create_table('service_reminders',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('vehicle_id', sa.UUID(), nullable=False),
+    sa.Column('service_item_id', sa.UUID(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=False),
+    sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('due_mileage', sa.Integer(), nullable=True),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['service_item_id'], ['dmt.service_items.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['dmt.vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('service_item_id'),
+    schema='dmt'
+    )
+    op.create_index('ix_dmt_service_reminders_vehicle_id_due_date', 'service_reminders', ['vehicle_id', 'due_date'], unique=False, schema='dmt')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_dmt_service_reminders_vehicle_id_due_date', table_name='service_reminders', schema='dmt')
+    op.drop_table('service_reminders', schema='dmt')
+    op.drop_index('ix_dmt_technical_inspections_vehicle_id_expiration_date', table_name='technical_inspections', schema='dmt')
+    op.drop_index('ix_dmt_insurance_policies_vehicle_id_end_date', table_name='insurance_policies', schema='dmt')
@@ -0,0 +1,90 @@
+"""add loan_payment_totals
+
+Revision ID: e4c7a3b9f215
+Revises: d8f2b4a61c37
+Create Date: 2026-10-19 15:12:40.218337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e4c7a3b9f215'
+down_revision: Union[str, Sequence[str], None] = 'd8f2b4a61c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('loan_payment_totals',
+    sa.Column('loan_id', sa.UUID(), nullable=False),
+    sa.Column('payments_count', sa.Integer(), nullable=False),
+    sa.Column('total_installments_paid', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('total_prepayments', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('last_paid_at', sa.Date(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['loan_id'], ['dmt.loans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('loan_id'),
+    schema='dmt'
+    )
+    op.execute(sa.text("""
+        INSERT INTO dmt.loan_payment_totals
+            (loan_id, payments_count, total_installments_paid, total_prepayments, last_paid_at)
+        SELECT
+            loan_id,
+            COUNT(*),
+            COALESCE(SUM(amount) FILTER (WHERE type = 'installment'), 0),
+            COALESCE(SUM(amount) FILTER (WHERE type = 'prepayment'), 0),
+            MAX(paid_at)
+        FROM dmt.payments
+        GROUP BY loan_id;
+    """))
+    op.execute(sa.text("DROP VIEW IF EXISTS dmt.loan_status;"))
+    op.execute(sa.text("""
+        CREATE VIEW dmt.loan_status AS
+        SELECT
+            l.id AS loan_id,
+            l.user_id,
+            l.name,
+            l.total_amount,
+            l.installments_count,
+            l.installment_amount,
+            l.due_day,
+            COALESCE(t.total_installments_paid + t.total_prepayments, 0) AS total_paid,
+            l.total_amount - COALESCE(t.total_installments_paid + t.total_prepayments, 0) AS remaining,
+            COALESCE(t.total_installments_paid, 0) AS total_installments_paid,
+            COALESCE(t.total_prepayments, 0) AS total_prepayments
+        FROM dmt.loans l
+        LEFT JOIN dmt.loan_payment_totals t ON t.loan_id = l.id;
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP VIEW IF EXISTS dmt.loan_status;"))
+    op.execute(sa.text("""
+        CREATE VIEW dmt.loan_status AS
+        SELECT
+            l.id AS loan_id,
+            l.user_id,
+            l.name,
+            l.total_amount,
+            l.installments_count,
+            l.installment_amount,
+            l.due_day, 
+            COALESCE(SUM(p.amount), 0) AS total_paid,
+            l.total_amount - COALESCE(SUM(p.amount), 0) AS remaining,
+            COALESCE(
+                SUM(CASE WHEN p.type = 'installment' THEN p.amount END),
+                0
+            ) AS total_installments_paid,
+            COALESCE(
+                SUM(CASE WHEN p.type = 'prepayment' THEN p.amount END),
+                0
+            ) AS total_prepayments
+        FROM dmt.loans l
+        LEFT JOIN dmt.payments p ON p.loan_id = l.id
+        GROUP BY l.id;
+    """))
+    op.drop_table('loan_payment_totals', schema='dmt')
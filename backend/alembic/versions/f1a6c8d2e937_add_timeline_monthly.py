@@ -0,0 +1,38 @@
+"""add timeline_monthly
+
+Revision ID: f1a6c8d2e937
+Revises: e4c7a3b9f215
+Create Date: 2026-10-19 16:48:05.771902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f1a6c8d2e937'
+down_revision: Union[str, Sequence[str], None] = 'e4c7a3b9f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('timeline_monthly',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('category', sa.String(length=255), nullable=False),
+    sa.Column('income', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('expense', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('entries', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['dmt.users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'month', 'source', 'category'),
+    schema='dmt'
+    )
+    # Rows are built per user on the first /timeline request.
+
+
+def downgrade() -> None:
+    op.drop_table('timeline_monthly', schema='dmt')
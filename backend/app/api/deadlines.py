@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.deps import get_db, get_current_user
+from app.db.repositories.deadline import DeadlineRepository
+from app.db.models.reminder import DeadlineRead
+
+router = APIRouter(prefix="/deadlines", tags=["Deadlines"])
+
+@router.get("/", response_model=list[DeadlineRead])
+async def list_upcoming_deadlines(
+    days: int = Query(30, ge=0, le=366),
+    km: int = Query(1000, ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    until = datetime.now(timezone.utc) + timedelta(days=days)
+    return await DeadlineRepository.get_upcoming(db, current_user.id, until, km)
@@ -1,22 +1,28 @@
 import uuid
 from typing import List, Optional
 from decimal import Decimal
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy import select, extract, func, case
+from sqlalchemy.exc import IntegrityError
 
+from app.core.config import get_settings
+from app.core.responses import trusted_response
 from app.services.finance_service import FinanceService
-from app.db.deps import get_db, get_current_user
+from app.services.http_cache import check_not_modified, CATEGORIES, RULES
+from app.db.deps import get_db, get_current_user, track_resource_writes
 from app.db.models.user import User
 from app.db.models.finance import (
     Account, AccountCreate, AccountRead,
     Category, CategoryCreate, CategoryRead,
     ImportRule, ImportRuleCreate, ImportRuleRead, 
+    ImportSession, ImportPreview, ImportConfirm,
     Transaction, TransactionRead, TransactionCategoryUpdate
 )
 from app.db.repositories.finance import FinanceRepository
+from app.db.repositories.timeline import TimelineRepository
 
 router = APIRouter(prefix="/finance", tags=["Finance"])
 
@@ -72,12 +78,17 @@ async def delete_account(
 
 @router.get("/categories", response_model=List[CategoryRead])
 async def get_categories(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    not_modified = await check_not_modified(request, response, db, current_user.id, CATEGORIES)
+    if not_modified:
+        return not_modified
     return await FinanceRepository.get_user_categories(db, current_user.id)
 
-@router.post("/categories", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
+@router.post("/categories", response_model=CategoryRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(track_resource_writes(CATEGORIES))])
 async def create_category(
     data: CategoryCreate,
     db: AsyncSession = Depends(get_db),
@@ -86,7 +97,7 @@ async def create_category(
     category = Category(user_id=current_user.id, name=data.name)
     return await FinanceRepository.create_category(db, category)
 
-@router.put("/categories/{category_id}", response_model=CategoryRead)
+@router.put("/categories/{category_id}", response_model=CategoryRead, dependencies=[Depends(track_resource_writes(CATEGORIES))])
 async def update_category(
     category_id: uuid.UUID,
     data: CategoryCreate,
@@ -97,12 +108,13 @@ async def update_category(
     if not category or category.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Category not found")
     
+    await TimelineRepository.mark_buckets_stale(db, current_user.id, ["finance"], category.name)
     category.name = data.name
     await db.commit()
     await db.refresh(category)
     return category
 
-@router.delete("/categories/{category_id}")
+@router.delete("/categories/{category_id}", dependencies=[Depends(track_resource_writes(CATEGORIES))])
 async def delete_category(
     category_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -129,14 +141,19 @@ async def delete_category(
 @router.get("/rules/{account_id}", response_model=List[ImportRuleRead])
 async def get_rules(
     account_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if not await FinanceRepository.is_account_owner(db, account_id, current_user.id):
         raise HTTPException(status_code=403, detail="Access denied")
+    not_modified = await check_not_modified(request, response, db, current_user.id, RULES)
+    if not_modified:
+        return not_modified
     return await FinanceRepository.get_account_rules(db, account_id)
 
-@router.post("/rules", response_model=ImportRuleRead, status_code=status.HTTP_201_CREATED)
+@router.post("/rules", response_model=ImportRuleRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(track_resource_writes(RULES))])
 async def create_rule(
     data: ImportRuleCreate,
     db: AsyncSession = Depends(get_db),
@@ -152,7 +169,7 @@ async def create_rule(
     )
     return await FinanceRepository.create_import_rule(db, rule)
 
-@router.put("/rules/{rule_id}", response_model=ImportRuleRead)
+@router.put("/rules/{rule_id}", response_model=ImportRuleRead, dependencies=[Depends(track_resource_writes(RULES))])
 async def update_rule(
     rule_id: uuid.UUID,
     data: ImportRuleCreate,
@@ -176,7 +193,7 @@ async def update_rule(
     await db.refresh(rule)
     return rule
 
-@router.delete("/rules/{rule_id}")
+@router.delete("/rules/{rule_id}", dependencies=[Depends(track_resource_writes(RULES))])
 async def delete_rule(
     rule_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -212,7 +229,7 @@ async def apply_rule(
     if not rule: 
         raise HTTPException(status_code=404, detail="Rule not found")
     
-    count = await FinanceRepository.apply_rule_to_existing_transactions(db, rule)
+    count = await FinanceRepository.apply_rule_to_existing_transactions(db, rule, current_user.id)
     return {"message": f"Updated {count} transactions"}
 
 # --- TRANSACTIONS ---
@@ -229,7 +246,8 @@ async def get_transactions(
 ):
     if not await FinanceRepository.is_account_owner(db, account_id, current_user.id):
         raise HTTPException(status_code=403, detail="Access denied")
-    return await FinanceRepository.get_monthly_transactions(db, account_id, month, year, limit, offset)
+    transactions = await FinanceRepository.get_monthly_transactions(db, account_id, month, year, limit, offset)
+    return trusted_response(TransactionRead, transactions)
 
 @router.patch("/transactions/{transaction_id}/category", response_model=TransactionRead)
 async def update_transaction_category(
@@ -243,9 +261,11 @@ async def update_transaction_category(
         Account.user_id == current_user.id
     )
     tx_res = await db.execute(tx_query)
-    if not tx_res.scalars().first(): 
+    transaction = tx_res.scalars().first()
+    if not transaction: 
         raise HTTPException(status_code=404, detail="Transaction not found")
     
+    await TimelineRepository.mark_stale(db, current_user.id, [transaction.date])
     await FinanceRepository.update_transaction_category(db, transaction_id, data.category_id)
     
     res = await db.execute(
@@ -339,7 +359,7 @@ async def get_yearly_stats(
 
     return {"year": year, "data": yearly_data}
 
-@router.post("/import/preview/{account_id}")
+@router.post("/import/preview/{account_id}", response_model=ImportPreview)
 async def import_preview(
     account_id: uuid.UUID,
     file: UploadFile = File(...),
@@ -365,9 +385,50 @@ async def import_preview(
         raise HTTPException(status_code=400, detail=f"Parsing error: {str(e)}")
 
     rules = await FinanceRepository.get_account_rules(db, account_id)
-    return FinanceService.match_categories(transactions, rules)
+    transactions = FinanceService.match_categories(transactions, rules)
 
-@router.post("/import/confirm/{account_id}")
+    # The parsed rows stay on the server, so confirming only needs the token and the user's changes.
+    import_session = ImportSession(
+        user_id=current_user.id,
+        account_id=account_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=get_settings().import_session_ttl_minutes),
+    )
+    rows = [{**tx, "position": position} for position, tx in enumerate(transactions)]
+    await FinanceRepository.create_import_session(db, import_session, rows)
+    return {"token": import_session.id, "expires_at": import_session.expires_at, "transactions": rows}
+
+@router.post("/import/sessions/{token}/confirm")
+async def import_session_confirm(
+    token: uuid.UUID,
+    data: Optional[ImportConfirm] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Saves the rows staged by the preview, with the per-row category changes and skips applied."""
+    import_session = await FinanceRepository.get_import_session(db, token, current_user.id)
+    if not import_session:
+        raise HTTPException(status_code=404, detail="Import session not found or expired.")
+
+    overrides = data.overrides if data else []
+    rows_count = await FinanceRepository.count_import_rows(db, token)
+    if any(not 0 <= o.position < rows_count for o in overrides):
+        raise HTTPException(status_code=400, detail="Unknown row position.")
+
+    categories = {o.position: o.category_id for o in overrides if not o.skip}
+    if any(categories.values()):
+        own = {c.id for c in await FinanceRepository.get_user_categories(db, current_user.id)}
+        if any(c and c not in own for c in categories.values()):
+            raise HTTPException(status_code=400, detail="Invalid category.")
+
+    skipped = [o.position for o in overrides if o.skip]
+    try:
+        saved = await FinanceRepository.confirm_import_session(db, import_session, categories, skipped)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Import failed (possible duplicates).")
+    return {"message": f"Successfully imported {saved} transactions"}
+
+@router.post("/import/confirm/{account_id}", deprecated=True)
 async def import_confirm(
     account_id: uuid.UUID,
     transactions_data: List[dict], 
@@ -391,6 +452,7 @@ async def import_confirm(
         to_save.append(tx)
     
     try:
+        await TimelineRepository.mark_stale(db, current_user.id, [tx.date for tx in to_save])
         await FinanceRepository.save_transactions(db, to_save)
         return {"message": f"Successfully imported {len(to_save)} transactions"}
     except Exception:
@@ -1,12 +1,15 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.deps import get_db, get_current_user
 from app.db.repositories.vehicle import VehicleRepository
+from app.db.repositories.timeline import TimelineRepository
 from app.db.repositories.fuel import FuelRepository
-from app.db.models.fuel import FuelLog, FuelLogCreate, FuelLogUpdate, FuelLogRead
+from app.db.models.fuel import FuelLog, FuelLogCreate, FuelLogUpdate, FuelLogRead, FuelStatsRead
 from app.services.fuel_service import FuelService
+from app.services.service_projection import service_projection_cache
 
 router = APIRouter(prefix="/vehicles/{vehicle_id}/fuel", tags=["Fuel"])
 
@@ -22,7 +25,9 @@ async def add_fuel_log(
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
     fuel_log = FuelLog(**data.model_dump())
+    await TimelineRepository.mark_stale(db, current_user.id, [fuel_log.date])
     new_log = await FuelRepository.create(db, fuel_log)
+    service_projection_cache.invalidate(vehicle_id)
     return {"message": "Fuel log added", "id": new_log.id}
 
 @router.get("/", response_model=list[FuelLogRead])
@@ -43,6 +48,9 @@ async def list_fuel_logs(
 async def get_fuel_consumption(
     vehicle_id: uuid.UUID,
     fuel_type: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+    window: int = Query(3, ge=1, le=50),
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user),
 ):
@@ -50,7 +58,19 @@ async def get_fuel_consumption(
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
     
-    return await FuelService.calculate_consumption(db, vehicle_id, fuel_type)
+    return await FuelService.calculate_consumption(db, vehicle_id, fuel_type, date_from, date_to, window)
+
+@router.get("/stats", response_model=FuelStatsRead)
+async def get_fuel_stats(
+    vehicle_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    vehicle = await VehicleRepository.get_by_id(db, vehicle_id, current_user.id)
+    if not vehicle:
+        raise HTTPException(status_code=404, detail="Vehicle not found")
+
+    return await FuelService.get_fuel_stats(db, vehicle_id)
 
 @router.patch("/{log_id}", status_code=status.HTTP_200_OK)
 async def update_fuel_log(
@@ -72,7 +92,9 @@ async def update_fuel_log(
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
+    await TimelineRepository.mark_stale(db, current_user.id, [fuel_log.date, update_data.get("date")])
     updated_log = await FuelRepository.update(db, fuel_log, update_data)
+    service_projection_cache.invalidate(vehicle_id)
     
     return {
         "message": "Fuel log updated successfully",
@@ -92,5 +114,7 @@ async def delete_fuel_log(
     if not vehicle or not log or log.vehicle_id != vehicle.id:
         raise HTTPException(status_code=404, detail="Log not found")
 
+    await TimelineRepository.mark_stale(db, current_user.id, [log.date])
     await FuelRepository.delete(db, log)
+    service_projection_cache.invalidate(vehicle_id)
     return {"message": "Log deleted"}
\ No newline at end of file
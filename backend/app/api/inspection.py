@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.deps import get_db, get_current_user
 from app.db.repositories.vehicle import VehicleRepository
+from app.db.repositories.timeline import TimelineRepository
 from app.db.repositories.inspection import InspectionRepository
 from app.db.models.inspection import TechnicalInspection, InspectionCreate, InspectionUpdate, InspectionRead
 
@@ -21,6 +22,7 @@ async def add_inspection(
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
     inspection = TechnicalInspection(**data.model_dump())
+    await TimelineRepository.mark_stale(db, current_user.id, [inspection.inspection_date])
     new_inspection = await InspectionRepository.create(db, inspection)
     return {"message": "Inspection added", "id": new_inspection.id}
 
@@ -56,6 +58,7 @@ async def update_inspection(
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
+    await TimelineRepository.mark_stale(db, current_user.id, [inspection.inspection_date, update_data.get("inspection_date")])
     updated_inspection = await InspectionRepository.update(db, inspection, update_data)
     
     return {
@@ -76,5 +79,6 @@ async def delete_inspection(
     if not inspection or not vehicle or inspection.vehicle_id != vehicle.id:
         raise HTTPException(status_code=404, detail="Inspection not found")
 
+    await TimelineRepository.mark_stale(db, current_user.id, [inspection.inspection_date])
     await InspectionRepository.delete(db, inspection)
     return {"message": "Inspection deleted"}
\ No newline at end of file
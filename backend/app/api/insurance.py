@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.deps import get_db, get_current_user
 from app.db.repositories.vehicle import VehicleRepository
+from app.db.repositories.timeline import TimelineRepository
 from app.db.repositories.insurance import InsuranceRepository
 from app.db.models.insurance import InsurancePolicy, InsuranceCreate, InsuranceUpdate, InsuranceRead
 
@@ -24,6 +25,7 @@ async def create_policy(
     policy_data["vehicle_id"] = vehicle_id
     
     policy = InsurancePolicy(**policy_data)
+    await TimelineRepository.mark_stale(db, current_user.id, [policy.start_date])
     new_policy = await InsuranceRepository.create(db, policy)
     return {"message": "Policy created", "id": new_policy.id}
 
@@ -54,6 +56,7 @@ async def update_policy(
         raise HTTPException(status_code=404, detail="Policy not found")
 
     update_data = data.model_dump(exclude_unset=True)
+    await TimelineRepository.mark_stale(db, current_user.id, [policy.start_date, update_data.get("start_date")])
     await InsuranceRepository.update(db, policy, update_data)
     return {"message": "Policy updated"}
     
@@ -73,6 +76,7 @@ async def delete_policy(
     if not policy or policy.vehicle_id != vehicle.id:
         raise HTTPException(status_code=404, detail="Policy not found or access denied")
 
+    await TimelineRepository.mark_stale(db, current_user.id, [policy.start_date])
     await InsuranceRepository.delete(db, policy)
     
     return {"message": "Insurance policy deleted successfully"}
\ No newline at end of file
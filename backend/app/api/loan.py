@@ -3,7 +3,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.deps import get_db, get_current_user
 from app.db.repositories.loan import LoanRepository
-from app.db.models.loan import Loan, LoanCreate, LoanUpdate
+from app.db.repositories.timeline import TimelineRepository
+from app.db.models.loan import Loan, LoanCreate, LoanUpdate, LoanStatusRead, LoanSchedule, LoanWhatIf, LoanWhatIfRequest
+from app.services.loan_service import LoanService, loan_schedule_cache
 from datetime import datetime, timezone
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import text
@@ -50,11 +52,52 @@ async def delete_loan(
         )
 
     await LoanRepository.delete(db, loan)
+    loan_schedule_cache.invalidate(loan_id)
     
     return {"message": "Loan deleted successfully"}
 
+@router.get("/status", response_model=list[LoanStatusRead])
+async def get_loan_status(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return await LoanRepository.get_status(db, current_user.id)
+
+@router.get("/schedules", response_model=list[LoanSchedule])
+async def get_loan_schedules(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return await LoanService.get_schedules(db, current_user.id)
+
+@router.get("/{loan_id}/schedule", response_model=LoanSchedule)
+async def get_loan_schedule(
+    loan_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    schedule = await LoanService.get_schedule(db, current_user.id, loan_id)
+    if not schedule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Loan not found")
+    return schedule
+
+@router.post("/{loan_id}/what-if", response_model=LoanWhatIf)
+async def simulate_loan_payoff(
+    loan_id: uuid.UUID,
+    data: LoanWhatIfRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    result = await LoanService.what_if(db, current_user.id, loan_id, data)
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Loan not found")
+    return result
+
 @router.get("/loan_status/{user_id}", response_model=None)
 async def get_user_loan_status(user_id: uuid.UUID, db: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)):
+    """Kept for existing clients, new code should use /loans/status."""
+    if user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You can only view your own loans")
     result = await db.execute(
         text("SELECT * FROM dmt.loan_status WHERE user_id = :user_id"),
         {"user_id": str(user_id)}
@@ -86,7 +129,10 @@ async def update_loan(
             detail="No fields to update"
         )
     
+    if "name" in update_data:
+        await TimelineRepository.mark_buckets_stale(db, current_user.id, ["loans"], loan.name)
     updated_loan = await LoanRepository.update(db, loan, update_data)
+    loan_schedule_cache.invalidate(loan_id)
     
     return {
         "message": "Loan updated successfully",
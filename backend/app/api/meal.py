@@ -1,15 +1,18 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.core.responses import DefaultJSONResponse
 from app.db.deps import get_db, get_current_user
-from app.db.repositories.meal import MealRepository
+from app.db.repositories.meal import MealRepository, MEAL_LIST_FIELDS
 from app.db.models.meal import (
     Meal, MealCreate, MealUpdate, 
-    ProteinType, BaseType, DictCreate, DictUpdate
+    ProteinType, BaseType, DictCreate, DictRead, DictUpdate
 )
 from app.services.meal_service import generate_default_user_data
+from app.services.dictionary_cache import dictionary_cache, PROTEINS, BASES
 
 router = APIRouter(prefix="/meals", tags=["Meals & Nutrition"])
 
@@ -31,8 +34,43 @@ async def create_meal(
     return {"message": "Meal created", "id": new_meal.id}
 
 @router.get("/", status_code=status.HTTP_200_OK)
-async def list_meals(db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
-    return await MealRepository.get_all_by_user(db, current_user.id)
+async def list_meals(
+    protein_id: Optional[uuid.UUID] = None,
+    base_id: Optional[uuid.UUID] = None,
+    is_weekend_dish: Optional[bool] = None,
+    name: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return, e.g. id,name"),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Lists the user's meals ordered by name. With `limit` set, the response is one page and
+    the cursor for the next one is returned in the X-Next-Cursor header.
+    """
+    selected = MEAL_LIST_FIELDS
+    if fields:
+        selected = tuple(f.strip() for f in fields.split(",") if f.strip())
+        unknown = [f for f in selected if f not in MEAL_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    try:
+        items, next_cursor = await MealRepository.list_meals(
+            db, current_user.id, selected,
+            protein_id=protein_id,
+            base_id=base_id,
+            is_weekend_dish=is_weekend_dish,
+            name=name,
+            limit=limit,
+            cursor=cursor,
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return DefaultJSONResponse(content=items, headers=headers)
 
 @router.get("/simple-list", status_code=status.HTTP_200_OK)
 async def list_meals_simple(
@@ -42,11 +80,8 @@ async def list_meals_simple(
     """
     Returns a list of the user's meals limited to ID and name only.
     """
-    query = select(Meal.id, Meal.name).where(Meal.user_id == current_user.id)
-    result = await db.execute(query)
-    
-    meals = result.all()
-    return [{"id": m.id, "name": m.name} for m in meals]
+    items, _ = await MealRepository.list_meals(db, current_user.id, ("id", "name"))
+    return items
     
 @router.get("/{meal_id}", status_code=status.HTTP_200_OK)
 async def get_meal_details(
@@ -86,15 +121,18 @@ async def delete_meal(meal_id: uuid.UUID, db: AsyncSession = Depends(get_db), cu
     await MealRepository.delete(db, meal)
     return {"message": "Deleted"}
 
-@router.get("/proteins/all")
-async def get_proteins(db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
-    return await MealRepository.get_protein_types(db)
+@router.get("/proteins/all", response_model=List[DictRead])
+async def get_proteins(request: Request, db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
+    return await dictionary_cache.respond(
+        request, PROTEINS, lambda: MealRepository.get_protein_types(db), DictRead
+    )
 
 @router.post("/proteins/")
 async def create_protein(data: DictCreate, db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
     protein = ProteinType(**data.model_dump())
     db.add(protein)
     await db.commit()
+    await dictionary_cache.invalidate(db, PROTEINS)
     return protein
     
 @router.patch("/proteins/{p_id}")
@@ -113,6 +151,7 @@ async def update_protein(
     
     await db.commit()
     await db.refresh(protein)
+    await dictionary_cache.invalidate(db, PROTEINS)
     return protein
 
 @router.delete("/proteins/{p_id}")
@@ -125,17 +164,21 @@ async def delete_protein(p_id: uuid.UUID, db: AsyncSession = Depends(get_db), cu
     if res:
         await db.delete(res)
         await db.commit()
+        await dictionary_cache.invalidate(db, PROTEINS)
     return {"message": "Deleted"}
 
-@router.get("/bases/all")
-async def get_bases(db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
-    return await MealRepository.get_base_types(db)
+@router.get("/bases/all", response_model=List[DictRead])
+async def get_bases(request: Request, db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
+    return await dictionary_cache.respond(
+        request, BASES, lambda: MealRepository.get_base_types(db), DictRead
+    )
 
 @router.post("/bases/")
 async def create_base(data: DictCreate, db: AsyncSession = Depends(get_db), current_user = Depends(get_current_user)):
     base = BaseType(**data.model_dump())
     db.add(base)
     await db.commit()
+    await dictionary_cache.invalidate(db, BASES)
     return base
     
 @router.patch("/bases/{b_id}")
@@ -154,6 +197,7 @@ async def update_base(
     
     await db.commit()
     await db.refresh(base)
+    await dictionary_cache.invalidate(db, BASES)
     return base
 
 @router.delete("/bases/{b_id}")
@@ -166,6 +210,7 @@ async def delete_base(b_id: uuid.UUID, db: AsyncSession = Depends(get_db), curre
     if res:
         await db.delete(res)
         await db.commit()
+        await dictionary_cache.invalidate(db, BASES)
     return {"message": "Deleted"}
 
 @router.get("/search", status_code=status.HTTP_200_OK)
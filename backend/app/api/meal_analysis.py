@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.responses import DefaultJSONResponse
 from app.db.deps import get_db, get_current_user
 from datetime import date
 
@@ -13,4 +14,4 @@ async def get_shopping_list(
 ):
     from app.db.repositories.meal_analysis import MealAnalysisRepository
     repo = MealAnalysisRepository(db)
-    return await repo.get_shopping_list(current_user.id, start_date)
\ No newline at end of file
+    return DefaultJSONResponse(content=await repo.get_shopping_list(current_user.id, start_date))
@@ -1,15 +1,17 @@
 import uuid
 from datetime import date, timedelta
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.deps import get_db, get_current_user
+from app.core.responses import DefaultJSONResponse
+from app.db.deps import get_db, get_current_user, track_resource_writes
 from app.db.repositories.meals_planner import MealPlanningRepository
 from app.db.models.meal_planner import WeekMealCreate, WeekPlanRead
 from app.services.meal_planner import MealPlannerService
+from app.services.http_cache import check_not_modified, WEEK_PLANS
 
-router = APIRouter(prefix="/planning", tags=["Meal Planning"])
+router = APIRouter(prefix="/planning", tags=["Meal Planning"], dependencies=[Depends(track_resource_writes(WEEK_PLANS))])
 
 @router.post("/add-meal", status_code=status.HTTP_201_CREATED)
 async def add_meal_to_schedule(
@@ -34,9 +36,14 @@ async def add_meal_to_schedule(
 @router.get("/week/{monday_date}", response_model=WeekPlanRead)
 async def get_weekly_plan(
     monday_date: date,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
+    not_modified = await check_not_modified(request, response, db, current_user.id, WEEK_PLANS)
+    if not_modified:
+        return not_modified
     repo = MealPlanningRepository(db)
     plan = await repo.get_or_create_week_plan(current_user.id, monday_date)
     return plan
@@ -150,8 +157,8 @@ async def get_monthly_overview(
             "note": getattr(m, 'note', '')
         })
         
-    return {
+    return DefaultJSONResponse(content={
         "year": year,
         "month": month,
         "days": calendar_data
-    }
\ No newline at end of file
+    })
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.deps import get_db, get_current_user
 from app.db.models.user import User
@@ -7,6 +7,7 @@ from app.db.models.meal_ingredients import (
     IngredientCreate, IngredientRead, 
     MealIngredientCreate, MealIngredientRead, MealIngredientUpdate
 )
+from app.services.dictionary_cache import dictionary_cache, INGREDIENTS
 import uuid
 from typing import List
 
@@ -15,12 +16,14 @@ router = APIRouter(prefix="/meals/ingredients", tags=["Meal Ingredients"])
 @router.post("/", response_model=IngredientRead)
 async def create_dictionary_ingredient(data: IngredientCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     repo = MealIngredientsRepository(db)
-    return await repo.create_ingredient(data.model_dump())
+    ingredient = await repo.create_ingredient(data.model_dump())
+    await dictionary_cache.invalidate(db, INGREDIENTS)
+    return ingredient
 
 @router.get("/", response_model=List[IngredientRead])
-async def list_dictionary_ingredients(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def list_dictionary_ingredients(request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     repo = MealIngredientsRepository(db)
-    return await repo.get_all_ingredients()
+    return await dictionary_cache.respond(request, INGREDIENTS, repo.get_all_ingredients, IngredientRead)
 
 @router.post("/{id_meal}", response_model=MealIngredientRead)
 async def add_ingredient_to_meal(
@@ -0,0 +1,27 @@
+import ipaddress
+from functools import lru_cache
+from typing import Tuple
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+from app.core.config import get_settings
+from app.core.metrics import registry
+
+router = APIRouter(tags=["Monitoring"])
+
+@lru_cache
+def _networks(allowlist: Tuple[str, ...]) -> tuple:
+    return tuple(ipaddress.ip_network(entry, strict=False) for entry in allowlist)
+
+def is_metrics_client(host: str | None) -> bool:
+    try:
+        address = ipaddress.ip_address(host or "")
+    except ValueError:
+        return False
+    return any(address in network for network in _networks(tuple(get_settings().metrics_allowlist)))
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(request: Request):
+    """Prometheus scrape endpoint with this worker's request and database metrics, for allowlisted clients only."""
+    if not is_metrics_client(request.client.host if request.client else None):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
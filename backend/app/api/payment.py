@@ -1,16 +1,19 @@
 import uuid
 from datetime import date
 from decimal import Decimal
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
 
 from app.db.deps import get_db, get_current_user
 from app.db.models.payment import Payment, PaymentType
 from app.db.models.loan import Loan
 from app.db.repositories.payment import PaymentRepository
+from app.db.repositories.timeline import TimelineRepository
+from app.services.loan_service import loan_schedule_cache, first_due_date
+from app.services.payment_service import PaymentService
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
@@ -40,6 +43,36 @@ class PaymentUpdate(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+MAX_BULK_PAYMENTS = 5000
+
+class PaymentBulkResult(BaseModel):
+    inserted: int
+    skipped: int
+    payment_ids: List[uuid.UUID]
+
+async def insert_payments(db: AsyncSession, payments: List[PaymentCreate], user_id: uuid.UUID) -> PaymentBulkResult:
+    """Checks that all referenced loans belong to the user in one query, then inserts the batch."""
+    if len(payments) > MAX_BULK_PAYMENTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_PAYMENTS} payments per request")
+
+    loan_ids = {p.loan_id for p in payments}
+    result = await db.execute(select(Loan.id).where(Loan.id.in_(loan_ids), Loan.user_id == user_id))
+    if loan_ids - set(result.scalars().all()):
+        raise HTTPException(status_code=404, detail="Loan not found")
+
+    # An explicit "paid_at": null skips the default_factory, so fill in today before matching duplicates.
+    today = date.today()
+    payments = [p if p.paid_at else p.model_copy(update={"paid_at": today}) for p in payments]
+    lines = [p.model_dump() for p in PaymentService.dedupe(payments)]
+    await TimelineRepository.mark_stale(db, user_id, (line["paid_at"] for line in lines))
+    payment_ids, skipped = await PaymentRepository.bulk_create(db, lines)
+    for loan_id in loan_ids:
+        loan_schedule_cache.invalidate(loan_id)
+
+    return PaymentBulkResult(
+        inserted=len(payment_ids), skipped=skipped + len(payments) - len(lines), payment_ids=payment_ids
+    )
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_payment(
     payment_in: PaymentCreate, 
@@ -47,23 +80,24 @@ async def create_payment(
     current_user=Depends(get_current_user)
 ):
     loan_check = await db.execute(
-        select(Loan.id).where(Loan.id == payment_in.loan_id)
+        select(Loan.user_id).where(Loan.id == payment_in.loan_id)
     )
-    if not loan_check.scalar_one_or_none():
+    loan_owner_id = loan_check.scalar_one_or_none()
+    if not loan_owner_id:
         raise HTTPException(status_code=404, detail="Loan not found")
 
     new_payment = Payment(
         **payment_in.model_dump()
     )
 
-    db.add(new_payment)
     try:
-        await db.commit()
-        await db.refresh(new_payment)
+        await TimelineRepository.mark_stale(db, loan_owner_id, [new_payment.paid_at or date.today()])
+        new_payment = await PaymentRepository.create(db, new_payment)
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=500, detail="Database error")
 
+    loan_schedule_cache.invalidate(new_payment.loan_id)
     return {
         "message": "Payment added successfully",
         "payment_id": str(new_payment.id),
@@ -114,7 +148,10 @@ async def delete_payment(
             detail="You don't have permission to delete this payment"
         )
 
+    loan_id = payment.loan_id
+    await TimelineRepository.mark_stale(db, current_user.id, [payment.paid_at])
     await PaymentRepository.delete(db, payment)
+    loan_schedule_cache.invalidate(loan_id)
     
     return {"message": "Payment deleted successfully"}
 
@@ -146,9 +183,75 @@ async def update_payment(
             detail="No fields to update"
         )
     
+    await TimelineRepository.mark_stale(db, current_user.id, [payment.paid_at, update_data.get("paid_at")])
     updated_payment = await PaymentRepository.update(db, payment, update_data)
+    loan_schedule_cache.invalidate(updated_payment.loan_id)
     
     return {
         "message": "Payment updated successfully",
         "payment_id": updated_payment.id
-    }
\ No newline at end of file
+    }
+
+@router.post("/bulk", response_model=PaymentBulkResult, status_code=status.HTTP_201_CREATED)
+async def create_payments_bulk(
+    payments: List[PaymentCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return await insert_payments(db, payments, current_user.id)
+
+@router.post("/bulk/csv", response_model=PaymentBulkResult, status_code=status.HTTP_201_CREATED)
+async def import_payments_csv(
+    file: UploadFile = File(...),
+    loan_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    content_bytes = await file.read()
+    try:
+        content = content_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        content = content_bytes.decode('cp1250')
+
+    payments = []
+    try:
+        for row in PaymentService.parse_csv(content, str(loan_id) if loan_id else None):
+            line = row.pop("line")
+            try:
+                payments.append(PaymentCreate.model_validate(row))
+            except ValidationError as e:
+                raise ValueError(f"Line {line}: {e.errors()[0]['loc'][0]} - {e.errors()[0]['msg']}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Parsing error: {str(e)}")
+
+    return await insert_payments(db, payments, current_user.id)
+
+@router.post("/loan/{loan_id}/missed-installments", response_model=PaymentBulkResult, status_code=status.HTTP_201_CREATED)
+async def record_missed_installments(
+    loan_id: uuid.UUID,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Records an installment on every due date (from `since`, by default the loan start, up to
+    `until`, by default today) in a month that has no installment yet.
+    """
+    result = await db.execute(select(Loan).where(Loan.id == loan_id, Loan.user_id == current_user.id))
+    loan = result.scalar_one_or_none()
+    if not loan:
+        raise HTTPException(status_code=404, detail="Loan not found")
+
+    dates = PaymentService.missed_installment_dates(
+        first_due_date(since or loan.created_at.date(), loan.due_day),
+        loan.due_day,
+        loan.installments_count,
+        await PaymentRepository.get_installment_months(db, loan_id),
+        until or date.today(),
+    )
+    payments = [
+        PaymentCreate(loan_id=loan_id, amount=loan.installment_amount, type=PaymentType.installment, paid_at=due)
+        for due in dates
+    ]
+    return await insert_payments(db, payments, current_user.id)
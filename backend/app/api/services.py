@@ -1,25 +1,29 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, delete
-from sqlalchemy.orm import selectinload
-from app.db.deps import get_db, get_current_user
-from app.db.models.service_event import ServiceEvent, ServiceEventCreate, ServiceEventUpdate, ServiceEventRead
+from sqlalchemy import select, delete
+from app.db.deps import get_db, get_current_user, track_resource_writes
+from app.db.models.service_event import ServiceEvent, ServiceEventCreate, ServiceEventUpdate, ServiceEventRead, ServiceEventWithItemsCreate, ServiceYearSummary
 from app.db.models.service_item import ServiceItem, ServiceItemCreate, ServiceItemUpdate, ServiceItemRead
 from app.db.models.vehicle import Vehicle
 from app.db.repositories.service import ServiceRepository
+from app.db.repositories.deadline import DeadlineRepository
+from app.db.repositories.timeline import TimelineRepository
+from app.db.models.reminder import ServiceDueRead
+from app.services.service_projection import ServiceProjectionService, service_projection_cache
+from app.services.http_cache import VEHICLES
 
-router = APIRouter(prefix="/services", tags=["Service Events"])
+# Service events move the vehicle's mileage and last service, which the vehicle list shows.
+router = APIRouter(
+    prefix="/services",
+    tags=["Service Events"],
+    dependencies=[Depends(track_resource_writes(VEHICLES))],
+)
 
-@router.post("/events", status_code=status.HTTP_201_CREATED)
-async def create_service_event(
-    data: ServiceEventCreate,
-    db: AsyncSession = Depends(get_db),
-    current_user = Depends(get_current_user),
-):
+async def get_vehicle_for_service(db: AsyncSession, data: ServiceEventCreate, user_id: uuid.UUID) -> Vehicle:
     vehicle_res = await db.execute(
-        select(Vehicle).where(Vehicle.id == data.vehicle_id, Vehicle.user_id == current_user.id)
+        select(Vehicle).where(Vehicle.id == data.vehicle_id, Vehicle.user_id == user_id)
     )
     vehicle = vehicle_res.scalar_one_or_none()
     if not vehicle:
@@ -30,6 +34,15 @@ async def create_service_event(
             status_code=400, 
             detail=f"Mileage at service cannot be lower than current vehicle mileage ({vehicle.current_mileage})"
         )
+    return vehicle
+
+@router.post("/events", status_code=status.HTTP_201_CREATED)
+async def create_service_event(
+    data: ServiceEventCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    vehicle = await get_vehicle_for_service(db, data, current_user.id)
 
     if data.mileage_at_service > vehicle.current_mileage:
         vehicle.current_mileage = data.mileage_at_service
@@ -42,25 +55,83 @@ async def create_service_event(
         total_cost=0
     )
     
+    await TimelineRepository.mark_stale(db, current_user.id, [new_event.service_date])
     event = await ServiceRepository.create_event(db, new_event)
     await db.commit() 
+    service_projection_cache.invalidate(event.vehicle_id)
 
     return {"message": "Service event created and vehicle mileage updated", "event_id": event.id}
 
+@router.post("/events/with-items", status_code=status.HTTP_201_CREATED)
+async def create_service_event_with_items(
+    data: ServiceEventWithItemsCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    vehicle = await get_vehicle_for_service(db, data, current_user.id)
+
+    if data.mileage_at_service > vehicle.current_mileage:
+        vehicle.current_mileage = data.mileage_at_service
+
+    new_event = ServiceEvent(
+        vehicle_id=data.vehicle_id,
+        service_date=data.service_date,
+        mileage_at_service=data.mileage_at_service,
+        notes=data.notes,
+    )
+    await TimelineRepository.mark_stale(db, current_user.id, [new_event.service_date])
+    event, item_ids = await ServiceRepository.create_event_with_items(db, new_event, data.items)
+    await DeadlineRepository.refresh_service_reminders(db, event.vehicle_id)
+    service_projection_cache.invalidate(event.vehicle_id)
+
+    return {
+        "message": "Service event created with items",
+        "event_id": event.id,
+        "item_ids": item_ids,
+        "total_cost": event.total_cost,
+    }
+
+@router.get("/due", response_model=List[ServiceDueRead])
+async def get_services_due(
+    vehicle_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return await ServiceProjectionService.get_due(db, current_user.id, vehicle_id)
+
 @router.get("/vehicle/{vehicle_id}", response_model=List[ServiceEventRead])
 async def get_vehicle_history(
     vehicle_id: uuid.UUID,
+    response: Response,
+    item_type: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    result = await db.execute(
-        select(ServiceEvent)
-        .where(ServiceEvent.vehicle_id == vehicle_id)
-        .options(selectinload(ServiceEvent.items)) 
-        .order_by(ServiceEvent.service_date.desc())
-    )
-    events = result.scalars().all()
+    """
+    Service history of one of the user's vehicles, newest first. With `limit` set, the response
+    is one page and the cursor for the next one is returned in the X-Next-Cursor header.
+    """
+    try:
+        events, next_cursor = await ServiceRepository.get_history(
+            db, vehicle_id, current_user.id, item_type=item_type, limit=limit, cursor=cursor
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return events
+
+@router.get("/vehicle/{vehicle_id}/yearly", response_model=List[ServiceYearSummary])
+async def get_vehicle_yearly_costs(
+    vehicle_id: uuid.UUID,
+    item_type: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    return await ServiceRepository.get_yearly_costs(db, vehicle_id, current_user.id, item_type)
     
 @router.patch("/events/{event_id}")
 async def update_service_event(
@@ -78,12 +149,15 @@ async def update_service_event(
         raise HTTPException(status_code=404, detail="Service event not found")
 
     update_data = data.model_dump(exclude_unset=True)
+    await TimelineRepository.mark_stale(db, current_user.id, [event.service_date, update_data.get("service_date")])
     for key, value in update_data.items():
         setattr(event, key, value)
 
-    await db.commit()
-    
+    await db.flush()
     await ServiceRepository.sync_vehicle_cache(db, event.vehicle_id)
+    await db.commit()
+    await DeadlineRepository.refresh_service_reminders(db, event.vehicle_id)
+    service_projection_cache.invalidate(event.vehicle_id)
     
     return {"message": "Service event updated and vehicle cache synced"}
 
@@ -102,13 +176,16 @@ async def delete_service_event(
         raise HTTPException(status_code=404, detail="Service event not found")
 
     vehicle_id = event.vehicle_id
+    await TimelineRepository.mark_stale(db, current_user.id, [event.service_date])
     
     await db.execute(delete(ServiceItem).where(ServiceItem.service_event_id == event_id))
     
     await db.delete(event)
-    await db.commit()
-
+    await db.flush()
     await ServiceRepository.sync_vehicle_cache(db, vehicle_id)
+    await db.commit()
+    await DeadlineRepository.refresh_service_reminders(db, vehicle_id)
+    service_projection_cache.invalidate(vehicle_id)
     
     return {"message": "Service event and items deleted, vehicle cache updated"}
 
@@ -128,15 +205,14 @@ async def add_service_item(
 
     new_item = ServiceItem(**data.model_dump())
     db.add(new_item)
+    await TimelineRepository.mark_stale(db, current_user.id, [event.service_date])
     
     await db.flush()
-    
-    cost_res = await db.execute(
-        select(func.sum(ServiceItem.cost)).where(ServiceItem.service_event_id == event.id)
-    )
-    event.total_cost = cost_res.scalar() or 0
+    await ServiceRepository.add_to_total_cost(db, event.id, new_item.cost)
     
     await db.commit()
+    await DeadlineRepository.refresh_service_reminders(db, event.vehicle_id)
+    service_projection_cache.invalidate(event.vehicle_id)
     return {"message": "Service item added", "item_id": new_item.id} 
 
 @router.delete("/items/{item_id}")
@@ -150,30 +226,24 @@ async def delete_service_item(
         .join(ServiceEvent, ServiceEvent.id == ServiceItem.service_event_id)
         .join(Vehicle, Vehicle.id == ServiceEvent.vehicle_id)
         .where(ServiceItem.id == item_id, Vehicle.user_id == current_user.id)
+        .add_columns(ServiceEvent.vehicle_id, ServiceEvent.service_date)
+        .with_for_update(of=ServiceItem)
     )
-    item = result.scalar_one_or_none()
+    row = result.one_or_none()
     
-    if not item:
+    if not row:
         raise HTTPException(status_code=404, detail="Service item not found")
 
-    event_id = item.service_event_id
-    vehicle_id = None
-
-    event_res = await db.execute(select(ServiceEvent).where(ServiceEvent.id == event_id))
-    event = event_res.scalar_one()
-    vehicle_id = event.vehicle_id
-
+    item, vehicle_id, service_date = row
+    await TimelineRepository.mark_stale(db, current_user.id, [service_date])
+    # Items do not change the event date or mileage, so the vehicle cache stays valid.
     await db.delete(item)
     await db.flush()
-
-    cost_res = await db.execute(
-        select(func.sum(ServiceItem.cost)).where(ServiceItem.service_event_id == event_id)
-    )
-    event.total_cost = cost_res.scalar() or 0
+    await ServiceRepository.add_to_total_cost(db, item.service_event_id, -item.cost)
     
     await db.commit()
-    
-    await ServiceRepository.sync_vehicle_cache(db, vehicle_id)
+    await DeadlineRepository.refresh_service_reminders(db, vehicle_id)
+    service_projection_cache.invalidate(vehicle_id)
     
     return {"message": "Item deleted and total cost updated"}
 
@@ -189,29 +259,26 @@ async def update_service_item(
         .join(ServiceEvent, ServiceEvent.id == ServiceItem.service_event_id)
         .join(Vehicle, Vehicle.id == ServiceEvent.vehicle_id)
         .where(ServiceItem.id == item_id, Vehicle.user_id == current_user.id)
+        .add_columns(ServiceEvent.vehicle_id, ServiceEvent.service_date)
+        .with_for_update(of=ServiceItem)
     )
-    item = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not item:
+    if not row:
         raise HTTPException(status_code=404, detail="Service item not found")
 
+    item, vehicle_id, service_date = row
+    await TimelineRepository.mark_stale(db, current_user.id, [service_date])
+    old_cost = item.cost
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(item, key, value)
 
     await db.flush()
-
-    event_id = item.service_event_id
-    cost_res = await db.execute(
-        select(func.sum(ServiceItem.cost))
-        .where(ServiceItem.service_event_id == event_id)
-    )
-    event_res = await db.execute(
-        select(ServiceEvent).where(ServiceEvent.id == event_id)
-    )
-    event = event_res.scalar_one()
-    event.total_cost = cost_res.scalar() or 0
+    await ServiceRepository.add_to_total_cost(db, item.service_event_id, item.cost - old_cost)
 
     await db.commit()
+    await DeadlineRepository.refresh_service_reminders(db, vehicle_id)
+    service_projection_cache.invalidate(vehicle_id)
 
     return {"message": "Service item updated and total cost recalculated"}
\ No newline at end of file
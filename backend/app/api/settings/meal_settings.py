@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.deps import get_db, get_current_user
+from app.db.deps import get_db, get_current_user, track_resource_writes
 from app.db.repositories.settings.meal_settings import MealSettingsRepository
 from app.services.meal_service import generate_default_user_data
+from app.services.http_cache import check_not_modified, MEAL_SETTINGS
 from pydantic import BaseModel, Field
 from typing import Optional
 import uuid
@@ -17,14 +18,19 @@ class MealSettingsUpdate(BaseModel):
 
 @router.get("/")
 async def get_meal_settings(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Retrieves meal planner settings for the current user."""
+    not_modified = await check_not_modified(request, response, db, current_user.id, MEAL_SETTINGS)
+    if not_modified:
+        return not_modified
     repo = MealSettingsRepository(db)
     return await repo.get_config(current_user.id)
 
-@router.patch("/")
+@router.patch("/", dependencies=[Depends(track_resource_writes(MEAL_SETTINGS))])
 async def update_meal_settings(
     data: MealSettingsUpdate,
     db: AsyncSession = Depends(get_db),
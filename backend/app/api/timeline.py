@@ -0,0 +1,24 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.deps import get_db, get_current_user
+from app.db.models.timeline import TimelineRead, TIMELINE_SOURCES
+from app.services.timeline_service import TimelineService
+
+router = APIRouter(prefix="/timeline", tags=["Timeline"])
+
+@router.get("/", response_model=TimelineRead)
+async def get_timeline(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    sources: Optional[List[str]] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Monthly income and costs across finance, loans and vehicles, e.g. for multi-year charts."""
+    unknown = set(sources or []) - set(TIMELINE_SOURCES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sources: {', '.join(sorted(unknown))}")
+    return await TimelineService.get_timeline(db, current_user.id, date_from, date_to, sources)
@@ -1,13 +1,22 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from datetime import datetime, timezone
 
-from app.db.deps import get_db, get_current_user
+from app.db.deps import get_db, get_current_user, get_session_factory, track_resource_writes
 from app.db.repositories.vehicle import VehicleRepository
-from app.db.models.vehicle import Vehicle, VehicleCreate, VehicleUpdate 
+from app.db.repositories.timeline import TimelineRepository
+from app.db.models.vehicle import Vehicle, VehicleCreate, VehicleUpdate, VehicleDashboard, VehicleOverview
+from app.db.models.timeline import VEHICLE_SOURCES
+from app.services.vehicle_service import VehicleService
+from app.services.service_projection import service_projection_cache
+from app.services.http_cache import check_not_modified, VEHICLES
 
-router = APIRouter(prefix="/vehicles", tags=["Vehicles"])
+router = APIRouter(
+    prefix="/vehicles",
+    tags=["Vehicles"],
+    dependencies=[Depends(track_resource_writes(VEHICLES))],
+)
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_vehicle(
@@ -36,12 +45,24 @@ async def create_vehicle(
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def list_user_vehicles(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user),
 ):
+    not_modified = await check_not_modified(request, response, db, current_user.id, VEHICLES)
+    if not_modified:
+        return not_modified
     vehicles = await VehicleRepository.get_all_by_user(db, current_user.id)
     return vehicles
 
+@router.get("/overview", response_model=list[VehicleOverview])
+async def get_vehicles_overview(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return await VehicleService.get_overview(db, current_user.id)
+
 @router.get("/{vehicle_id}", status_code=status.HTTP_200_OK)
 async def get_vehicle(
     vehicle_id: uuid.UUID,
@@ -56,6 +77,22 @@ async def get_vehicle(
         )
     return vehicle
 
+@router.get("/{vehicle_id}/dashboard", response_model=VehicleDashboard)
+async def get_vehicle_dashboard(
+    vehicle_id: uuid.UUID,
+    recent_services: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    current_user = Depends(get_current_user),
+):
+    vehicle = await VehicleRepository.get_by_id(db, vehicle_id, current_user.id)
+    if not vehicle:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Vehicle not found"
+        )
+    return await VehicleService.get_dashboard(session_factory, vehicle, recent_services)
+
 @router.patch("/{vehicle_id}", status_code=status.HTTP_200_OK)
 async def update_vehicle(
     vehicle_id: uuid.UUID,
@@ -77,7 +114,11 @@ async def update_vehicle(
             detail="No fields to update"
         )
     
+    # The timeline buckets vehicle costs under "<brand> <model>", so a rename regroups them.
+    if {"brand", "model"} & update_data.keys():
+        await TimelineRepository.mark_buckets_stale(db, current_user.id, VEHICLE_SOURCES, f"{vehicle.brand} {vehicle.model}")
     updated_vehicle = await VehicleRepository.update(db, vehicle, update_data)
+    service_projection_cache.invalidate(vehicle_id)
     return {
         "message": "Vehicle updated successfully",
         "vehicle_id": updated_vehicle.id
@@ -96,5 +137,7 @@ async def delete_vehicle(
             detail="Vehicle not found"
         )
 
+    await TimelineRepository.mark_buckets_stale(db, current_user.id, VEHICLE_SOURCES, f"{vehicle.brand} {vehicle.model}")
     await VehicleRepository.delete(db, vehicle)
+    service_projection_cache.invalidate(vehicle_id)
     return {"message": "Vehicle deleted successfully"}
\ No newline at end of file
@@ -21,7 +21,25 @@ class Settings(BaseSettings):
 
     cors_origins: Union[str, List[str]] = ""
 
-    @field_validator("cors_origins", mode="before")
+    # Responses smaller than this are sent uncompressed.
+    compression_minimum_size: int = 1024
+
+    # Prepared statements kept per asyncpg connection (0 disables the cache).
+    db_statement_cache_size: int = 500
+
+    # How long a previewed import waits for confirmation.
+    import_session_ttl_minutes: int = 30
+
+    slow_query_ms: int = 200
+    n_plus_one_threshold: int = 5
+    # Lets admins request a pyinstrument profile by sending this token in the X-Profile header
+    # (needs pyinstrument). Without a token profiling stays off.
+    profiling_enabled: bool = False
+    profiling_token: str = ""
+    # Client addresses or networks (e.g. 10.0.0.0/8) allowed to scrape /metrics.
+    metrics_allowlist: Union[str, List[str]] = ["127.0.0.1", "::1"]
+
+    @field_validator("cors_origins", "metrics_allowlist", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: Any) -> List[str]:
         if isinstance(v, str):
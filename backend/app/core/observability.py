@@ -0,0 +1,137 @@
+import hmac
+import logging
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import REQUEST_LATENCY, REQUEST_DB_QUERIES, REQUEST_DB_TIME, N_PLUS_ONE, SLOW_QUERIES
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # optional, profiling is unavailable without it
+    Profiler = None
+
+logger = logging.getLogger("domator.performance")
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_ROLE = "ADMIN"
+
+@dataclass
+class RequestStats:
+    route: str = "unmatched"
+    queries: int = 0
+    db_time: float = 0.0
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+# Set by the middleware for the duration of a request; SQLAlchemy's greenlets inherit the context,
+# so the cursor events below see the same object.
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+def instrument_sql(slow_query_ms: int) -> None:
+    """Counts and times every statement, on all engines, against the request that issued it."""
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+            stats.statements[statement] += 1
+
+        if elapsed * 1000 >= slow_query_ms:
+            SLOW_QUERIES.inc(stats.route if stats else "background")
+            logger.warning("Slow query (%.0f ms): %s", elapsed * 1000, " ".join(statement.split())[:500])
+
+class ObservabilityMiddleware:
+    """
+    Records latency, query count and database time per route, warns about repeated statements
+    (a likely N+1), and for admins who send `X-Profile: <profiling token>` returns a pyinstrument
+    profile instead of the response when profiling is enabled. The token is checked before the
+    profiler starts, so other clients cannot make requests pay for it.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int = 5, profiling_enabled: bool = False, profiling_token: str = ""):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.profiling_enabled = profiling_enabled and bool(profiling_token) and Profiler is not None
+        self.profiling_token = profiling_token.encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        profiler = None
+        buffered = []
+
+        requested = dict(scope["headers"]).get(PROFILE_HEADER, b"")
+        if self.profiling_enabled and hmac.compare_digest(requested, self.profiling_token):
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            if profiler is not None:
+                buffered.append(message)
+            else:
+                await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_stats.reset(token)
+            self._record(scope, stats, status_code, elapsed)
+
+        if profiler is not None:
+            profiler.stop()
+            user = scope.get("state", {}).get("user")
+            if user is not None and user.role == ADMIN_ROLE:
+                await self._send_profile(send, profiler.output_html())
+            else:
+                for message in buffered:
+                    await send(message)
+
+    def _record(self, scope, stats: RequestStats, status_code: int, elapsed: float) -> None:
+        route = scope.get("route")
+        stats.route = getattr(route, "path", "unmatched")
+        method = scope["method"]
+
+        REQUEST_LATENCY.observe(elapsed, method, stats.route, str(status_code))
+        REQUEST_DB_QUERIES.observe(stats.queries, method, stats.route)
+        REQUEST_DB_TIME.observe(stats.db_time, method, stats.route)
+
+        if stats.statements:
+            statement, repeats = stats.statements.most_common(1)[0]
+            if repeats >= self.n_plus_one_threshold:
+                N_PLUS_ONE.inc(method, stats.route)
+                logger.warning(
+                    "Possible N+1 in %s %s: statement ran %d times: %s",
+                    method, stats.route, repeats, " ".join(statement.split())[:300],
+                )
+
+    @staticmethod
+    async def _send_profile(send, html: str) -> None:
+        body = html.encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/html; charset=utf-8"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
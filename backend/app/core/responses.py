@@ -0,0 +1,95 @@
+import uuid
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple, Type, get_args
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from brotli_asgi import BrotliMiddleware
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used without it
+    orjson = None
+
+def _orjson_default(value: Any) -> Any:
+    # Same as jsonable_encoder, which FastAPI uses for endpoints without a response model.
+    if isinstance(value, Decimal):
+        return float(value)
+    # asyncpg returns its own UUID subclass, which orjson does not pick up natively.
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+class DefaultJSONResponse(JSONResponse):
+    """
+    Application-wide response class, rendered with orjson when it is installed. Endpoints that
+    build plain dicts can return it directly to skip jsonable_encoder, orjson handles UUID,
+    date and datetime natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+def add_compression(app: FastAPI, minimum_size: int = 1024) -> None:
+    """Brotli for clients that accept it, GZip for older ones."""
+    app.add_middleware(BrotliMiddleware, minimum_size=minimum_size, gzip_fallback=True)
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model inside Optional[...] / List[...] annotations, if there is one."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+@lru_cache
+def _model_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Optional[Type[BaseModel]]], ...]:
+    return tuple((name, _nested_model(field.annotation)) for name, field in schema.model_fields.items())
+
+def trusted_dict(schema: Type[BaseModel], obj: Any) -> dict:
+    """
+    Reads the schema's fields from an ORM object without validating them. Only for objects
+    loaded from the database whose column types already match the schema.
+    """
+    values = {}
+    for name, nested in _model_fields(schema):
+        value = getattr(obj, name, None)
+        if nested is not None and value is not None:
+            if isinstance(value, (list, tuple)):
+                value = [trusted_dict(nested, item) for item in value]
+            else:
+                value = trusted_dict(nested, value)
+        values[name] = value
+    return values
+
+def _pydantic_default(value: Any) -> Any:
+    # Pydantic's JSON mode writes Decimal as a string, unlike jsonable_encoder.
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+@lru_cache
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+def trusted_response(schema: Type[BaseModel], rows: Iterable[Any], **kwargs) -> Response:
+    """
+    Serializes trusted ORM rows straight to JSON bytes, skipping the from_attributes validation
+    FastAPI runs for `response_model`, with the same output. Schemas with computed fields, or
+    a missing orjson, go through the regular validation.
+    """
+    if orjson is None or schema.model_computed_fields:
+        adapter = _list_adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+    else:
+        body = orjson.dumps(
+            [trusted_dict(schema, row) for row in rows], default=_pydantic_default, option=orjson.OPT_UTC_Z
+        )
+    return Response(content=body, media_type="application/json", **kwargs)
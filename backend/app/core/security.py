@@ -1,21 +1,45 @@
 import secrets
 import hashlib
 from datetime import datetime, timedelta, UTC
-from jose import jwt
-from passlib.context import CryptContext
+from functools import lru_cache
 from app.core.config import get_settings
 
-settings = get_settings()
+# passlib, argon2 and jose are imported on first use; the lifespan calls warm_up() so that
+# the first login does not pay for it, while scripts and test collection never do.
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+@lru_cache
+def get_password_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["argon2"], deprecated="auto")
+
+def _encode(payload: dict) -> str:
+    from jose import jwt
+
+    settings = get_settings()
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+def decode_token(token: str) -> dict | None:
+    """The token's claims, or None when it is malformed, tampered with or expired."""
+    from jose import jwt, JWTError
+
+    settings = get_settings()
+    try:
+        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    except JWTError:
+        return None
+
+def warm_up() -> None:
+    get_password_context().handler("argon2").get_backend()
+    _encode({"sub": "warm-up"})
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_password_context().hash(password)
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+    return get_password_context().verify(password, password_hash)
 
 def create_access_token(subject: str) -> str:
+    settings = get_settings()
     expire = datetime.now(UTC) + timedelta(
         minutes=settings.access_token_expire_minutes
     )
@@ -24,9 +48,10 @@ def create_access_token(subject: str) -> str:
         "exp": expire,
         "jti": secrets.token_hex(16)
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode(payload)
 
 def create_refresh_token(subject: str) -> str:
+    settings = get_settings()
     expire = datetime.now(UTC) + timedelta(
         days=settings.refresh_token_expire_days
     )
@@ -36,7 +61,7 @@ def create_refresh_token(subject: str) -> str:
         "type": "refresh",
         "jti": secrets.token_hex(16)
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode(payload)
 
 def hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
@@ -1,12 +1,15 @@
 from app.db.models.user import User
 from app.db.models.loan import Loan
-from app.db.models.payment import Payment
+from app.db.models.payment import Payment, LoanPaymentTotals
 from app.db.models.vehicle import Vehicle
-from app.db.models.fuel import FuelLog
+from app.db.models.fuel import FuelLog, VehicleFuelStats
 from app.db.models.insurance import InsurancePolicy
 from app.db.models.inspection import TechnicalInspection
 from app.db.models.service_event import ServiceEvent
 from app.db.models.service_item import ServiceItem
+from app.db.models.reminder import ServiceReminder
+from app.db.models.timeline import TimelineMonthly, TimelineStaleMonth
+from app.db.models.resource_version import ResourceVersion
 from app.db.models.meal import Meal, ProteinType, BaseType
 from app.db.models.meal_ingredients import Ingredient, MealIngredient
 from app.db.models.meal_planner import WeekPlan, WeekMeal
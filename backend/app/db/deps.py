@@ -1,21 +1,25 @@
 from collections.abc import AsyncGenerator
-from app.db.session import AsyncSessionLocal
-from fastapi import Depends, HTTPException, status
+from app.db.session import get_sessionmaker
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
-from jose import jwt, JWTError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.db.repositories.user import UserRepository
-from app.core.config import get_settings
-
-settings = get_settings()
+from app.core.security import decode_token
+from app.services.http_cache import SAFE_METHODS
+from app.db.repositories.resource_version import ResourceVersionRepository
 
 bearer_scheme = HTTPBearer()
 
 async def get_db() -> AsyncGenerator:
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
 
+def get_session_factory() -> async_sessionmaker:
+    """For endpoints that run independent queries concurrently, each on its own pooled session."""
+    return get_sessionmaker()
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db),
 ):
@@ -25,15 +29,30 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_token(token)
+    user_id: str = payload.get("sub") if payload else None
+    if user_id is None:
         raise credentials_exception
 
     user = await UserRepository.get_by_id(db, user_id)
     if user is None:
         raise credentials_exception
-    return user
\ No newline at end of file
+    # Read by the observability middleware to allow profiling for admins.
+    request.state.user = user
+    return user
+
+def track_resource_writes(*resources: str):
+    """
+    Dependency that bumps the version of the given cached resources after a successful write.
+    It runs after the endpoint has committed, so a reader can never pair old rows with a new tag.
+    """
+    async def bump_versions(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        current_user = Depends(get_current_user),
+    ):
+        yield
+        if request.method not in SAFE_METHODS:
+            await ResourceVersionRepository.bump(db, current_user.id, resources)
+
+    return bump_versions
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import String, DateTime, func, ForeignKey, Numeric, UniqueConstraint, case
+from sqlalchemy import String, DateTime, Integer, func, ForeignKey, Numeric, UniqueConstraint, case
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
@@ -53,6 +53,27 @@ class TransactionRead(BaseModel):
 class TransactionCategoryUpdate(BaseModel):
     category_id: uuid.UUID
 
+class ImportPreviewRow(BaseModel):
+    position: int
+    date: datetime
+    title: str
+    amount: float
+    raw_hash: str
+    category_id: Optional[uuid.UUID]
+
+class ImportPreview(BaseModel):
+    token: uuid.UUID
+    expires_at: datetime
+    transactions: List[ImportPreviewRow]
+
+class ImportRowOverride(BaseModel):
+    position: int
+    category_id: Optional[uuid.UUID] = None
+    skip: bool = False
+
+class ImportConfirm(BaseModel):
+    overrides: List[ImportRowOverride] = []
+
 class Account(Base):
     __tablename__ = "accounts"
     __table_args__ = {"schema": "dmt"}
@@ -102,4 +123,29 @@ class Transaction(Base):
     raw_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    category: Mapped[Optional["Category"]] = relationship("Category")
\ No newline at end of file
+    category: Mapped[Optional["Category"]] = relationship("Category")
+
+class ImportSession(Base):
+    """A parsed bank statement staged by the import preview until the user confirms it."""
+    __tablename__ = "import_sessions"
+    __table_args__ = {"schema": "dmt"}
+
+    # The id is the token handed to the client.
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.users.id", ondelete="CASCADE"), nullable=False)
+    account_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.accounts.id", ondelete="CASCADE"), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+class ImportSessionRow(Base):
+    __tablename__ = "import_session_rows"
+    __table_args__ = {"schema": "dmt"}
+
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.import_sessions.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.categories.id", ondelete="SET NULL"), nullable=True)
+
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    raw_hash: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Boolean, Integer, DateTime, Numeric, Text, ForeignKey, func
+from sqlalchemy import String, Boolean, Integer, DateTime, Numeric, Text, ForeignKey, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import BaseModel, ConfigDict, Field, model_validator, computed_field
@@ -10,10 +10,10 @@ from app.db.base import Base
 
 class FuelLog(Base):
     __tablename__ = "fuel_logs"
-    __table_args__ = {"schema": "dmt"}
+    __table_args__ = (Index("ix_dmt_fuel_logs_vehicle_id_date_mileage", "vehicle_id", "date", "mileage"), {"schema": "dmt"})
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False)
     
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     mileage: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -23,6 +23,30 @@ class FuelLog(Base):
     total_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     is_full: Mapped[bool] = mapped_column(Boolean, default=True)
 
+class VehicleFuelStats(Base):
+    """Per-vehicle fuel summary kept up to date by FuelRepository on every log write."""
+    __tablename__ = "vehicle_fuel_stats"
+    __table_args__ = {"schema": "dmt"}
+
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), primary_key=True)
+
+    entries_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    full_tank_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_spent: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    total_liters: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+
+    last_log_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    last_log_mileage: Mapped[Optional[int]] = mapped_column(Integer)
+    last_full_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    last_full_mileage: Mapped[Optional[int]] = mapped_column(Integer)
+
+    # Liters of partial refuels since the last full tank, added to the next full-tank segment.
+    pending_liters: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    consumption_distance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    consumption_liters: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
 class FuelLogCreate(BaseModel):
     vehicle_id: uuid.UUID
     date: datetime
@@ -61,4 +85,24 @@ class FuelLogUpdate(BaseModel):
 
     @model_validator(mode='after')
     def recalculate_on_update(self) -> 'FuelLogUpdate':
-        return self
\ No newline at end of file
+        return self
+
+class FuelStatsRead(BaseModel):
+    vehicle_id: uuid.UUID
+    entries_count: int
+    full_tank_count: int
+    total_spent: float
+    total_liters: float
+    last_full_date: Optional[datetime]
+    last_full_mileage: Optional[int]
+    consumption_distance: int
+    consumption_liters: float
+
+    @computed_field
+    @property
+    def average_consumption(self) -> Optional[float]:
+        if not self.consumption_distance:
+            return None
+        return round(self.consumption_liters / self.consumption_distance * 100, 2)
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, Numeric, Text, ForeignKey, func
+from sqlalchemy import String, Integer, DateTime, Numeric, Text, ForeignKey, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -10,10 +10,14 @@ from app.db.base import Base
 
 class TechnicalInspection(Base):
     __tablename__ = "technical_inspections"
-    __table_args__ = {"schema": "dmt"}
+    __table_args__ = (
+        Index("ix_dmt_technical_inspections_vehicle_id_inspection_date", "vehicle_id", "inspection_date"),
+        Index("ix_dmt_technical_inspections_vehicle_id_expiration_date", "vehicle_id", "expiration_date"),
+        {"schema": "dmt"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False)
     
     inspection_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expiration_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -2,18 +2,31 @@ import uuid
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Boolean, Integer, DateTime, Numeric, Text, ForeignKey, func
+from sqlalchemy import String, Boolean, Integer, DateTime, Numeric, Text, ForeignKey, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 from app.db.base import Base
 
+def days_until(value: datetime | date) -> int:
+    target_date = value.date() if isinstance(value, datetime) else value
+    return (target_date - date.today()).days
+
+def expiry_status(days: int) -> str:
+    if days < 0: return "EXPIRED"
+    if days <= 30: return "EXPIRING_SOON"
+    return "ACTIVE"
+
 class InsurancePolicy(Base):
     __tablename__ = "insurance_policies"
-    __table_args__ = {"schema": "dmt"}
+    __table_args__ = (
+        Index("ix_dmt_insurance_policies_vehicle_id_start_date", "vehicle_id", "start_date"),
+        Index("ix_dmt_insurance_policies_vehicle_id_end_date", "vehicle_id", "end_date"),
+        {"schema": "dmt"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False)
     
     policy_number: Mapped[str] = mapped_column(String(100), nullable=False)
     insurer_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -47,17 +60,12 @@ class InsuranceRead(InsuranceCreate):
     @computed_field
     @property
     def days_to_expiry(self) -> int:
-        target_date = self.end_date.date() if isinstance(self.end_date, datetime) else self.end_date
-        delta = target_date - date.today()
-        return delta.days
+        return days_until(self.end_date)
 
     @computed_field
     @property
     def status(self) -> str:
-        days = self.days_to_expiry
-        if days < 0: return "EXPIRED"
-        if days <= 30: return "EXPIRING_SOON"
-        return "ACTIVE"
+        return expiry_status(self.days_to_expiry)
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,9 +1,11 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
 from sqlalchemy import String, Integer, Numeric, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.db.base import Base
 
 class Loan(Base):
@@ -32,4 +34,52 @@ class LoanUpdate(BaseModel):
     total_amount: float | None = Field(None, gt=0)
     installments_count: int | None = Field(None, gt=0)
     due_day: int | None = Field(None, ge=1, le=31)
-    installment_amount: float | None = Field(None, gt=0)
\ No newline at end of file
+    installment_amount: float | None = Field(None, gt=0)
+
+class LoanStatusRead(BaseModel):
+    loan_id: uuid.UUID
+    name: str
+    total_amount: Decimal
+    installments_count: int
+    installment_amount: Decimal
+    due_day: int
+    total_paid: Decimal
+    remaining: Decimal
+    total_installments_paid: Decimal
+    total_prepayments: Decimal
+    last_paid_at: Optional[date]
+
+    model_config = ConfigDict(from_attributes=True)
+
+class LoanInstallment(BaseModel):
+    number: int
+    due_date: date
+    amount: Decimal
+    paid: Decimal
+    status: str  # PAID, PARTIAL, OVERDUE, UPCOMING
+
+class LoanSchedule(BaseModel):
+    loan_id: uuid.UUID
+    name: str
+    total_amount: Decimal
+    installment_amount: Decimal
+    total_paid: Decimal
+    remaining_amount: Decimal
+    paid_installments: int
+    remaining_installments: int
+    installments_saved: int
+    overdue_amount: Decimal
+    next_due_date: Optional[date]
+    next_due_amount: Optional[Decimal]
+    payoff_date: Optional[date]
+    schedule: List[LoanInstallment]
+
+class LoanWhatIfRequest(BaseModel):
+    prepayment: Decimal = Field(Decimal("0"), ge=0, max_digits=12, decimal_places=2)
+    monthly_extra: Decimal = Field(Decimal("0"), ge=0, max_digits=12, decimal_places=2)
+
+class LoanWhatIf(BaseModel):
+    baseline: LoanSchedule
+    scenario: LoanSchedule
+    installments_saved: int
+    months_earlier: int
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Boolean, DateTime, func, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, func, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from pydantic import BaseModel, ConfigDict
@@ -35,7 +35,10 @@ class BaseType(Base):
 
 class Meal(Base):
     __tablename__ = "meals"
-    __table_args__ = {"schema": "dmt"}
+    __table_args__ = (
+        Index("ix_dmt_meals_user_id_name_id", "user_id", "name", "id"),
+        {"schema": "dmt"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
@@ -88,6 +91,10 @@ class DictBase(BaseModel):
 class DictCreate(DictBase):
     pass
 
+class DictRead(DictBase):
+    id: uuid.UUID
+    model_config = ConfigDict(from_attributes=True)
+
 class DictUpdate(DictBase):
     name: Optional[str] = None
     category: Optional[str] = None
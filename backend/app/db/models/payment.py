@@ -1,8 +1,9 @@
 import uuid
 import enum
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from sqlalchemy import Numeric, Date, Enum, ForeignKey
+from typing import Optional
+from sqlalchemy import Integer, Numeric, Date, DateTime, Enum, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
@@ -38,4 +39,16 @@ class Payment(Base):
         Date, 
         nullable=False,
         default=date.today
-    )
\ No newline at end of file
+    )
+
+class LoanPaymentTotals(Base):
+    """Per-loan payment totals kept up to date by PaymentRepository on every payment write."""
+    __tablename__ = "loan_payment_totals"
+    __table_args__ = {"schema": "dmt"}
+
+    loan_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.loans.id", ondelete="CASCADE"), primary_key=True)
+    payments_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_installments_paid: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    total_prepayments: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    last_paid_at: Mapped[Optional[date]] = mapped_column(Date)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
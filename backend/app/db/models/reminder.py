@@ -0,0 +1,81 @@
+import uuid
+from datetime import datetime, date
+from typing import Optional
+from sqlalchemy import String, Integer, DateTime, ForeignKey, func, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from pydantic import BaseModel, ConfigDict, computed_field
+from app.db.base import Base
+
+class ServiceReminder(Base):
+    """Next due date/mileage of every recurring service item, refilled by the reminders job."""
+    __tablename__ = "service_reminders"
+    __table_args__ = (Index("ix_dmt_service_reminders_vehicle_id_due_date", "vehicle_id", "due_date"), {"schema": "dmt"})
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False)
+    service_item_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.service_items.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
+    description: Mapped[str] = mapped_column(String(255), nullable=False)
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    due_mileage: Mapped[Optional[int]] = mapped_column(Integer)
+
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+class DeadlineRead(BaseModel):
+    kind: str
+    vehicle_id: uuid.UUID
+    source_id: uuid.UUID
+    title: str
+    due_date: Optional[datetime]
+    due_mileage: Optional[int]
+    current_mileage: int
+
+    @computed_field
+    @property
+    def days_remaining(self) -> Optional[int]:
+        if self.due_date is None:
+            return None
+        return (self.due_date.date() - date.today()).days
+
+    @computed_field
+    @property
+    def km_remaining(self) -> Optional[int]:
+        if self.due_mileage is None:
+            return None
+        return self.due_mileage - self.current_mileage
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ServiceDueRead(BaseModel):
+    vehicle_id: uuid.UUID
+    service_item_id: uuid.UUID
+    type: str
+    description: str
+    last_service_date: datetime
+    last_service_mileage: int
+    interval_km: Optional[int]
+    interval_months: Optional[int]
+    current_mileage: int
+    km_per_day: Optional[float]
+    due_mileage: Optional[int]
+    due_date: Optional[datetime]
+    projected_mileage_date: Optional[datetime]
+    projected_due_date: Optional[datetime]
+
+    @computed_field
+    @property
+    def days_remaining(self) -> Optional[int]:
+        if self.projected_due_date is None:
+            return None
+        return (self.projected_due_date.date() - date.today()).days
+
+    @computed_field
+    @property
+    def km_remaining(self) -> Optional[int]:
+        if self.due_mileage is None:
+            return None
+        return self.due_mileage - self.current_mileage
+
+    model_config = ConfigDict(from_attributes=True)
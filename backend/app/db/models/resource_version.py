@@ -0,0 +1,16 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import String, BigInteger, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+class ResourceVersion(Base):
+    """Per-user change counter of a cached resource, bumped after every write to it."""
+    __tablename__ = "resource_versions"
+    __table_args__ = {"schema": "dmt"}
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.users.id", ondelete="CASCADE"), primary_key=True)
+    resource: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -3,22 +3,22 @@ from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Integer, Text, Numeric, func, ForeignKey
+from sqlalchemy import DateTime, Integer, Text, Numeric, func, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from pydantic import BaseModel, Field, ConfigDict
 from app.db.base import Base
-from app.db.models.service_item import ServiceItemRead
+from app.db.models.service_item import ServiceItemRead, ServiceItemLine
 
 if TYPE_CHECKING:
     from app.db.models.service_item import ServiceItem
 
 class ServiceEvent(Base):
     __tablename__ = "service_events"
-    __table_args__ = {"schema": "dmt"}
+    __table_args__ = (Index("ix_dmt_service_events_vehicle_id_service_date", "vehicle_id", "service_date", "mileage_at_service"), {"schema": "dmt"})
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.vehicles.id", ondelete="CASCADE"), nullable=False)
     service_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     mileage_at_service: Mapped[int] = mapped_column(Integer, nullable=False)
     total_cost: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True, default=0)
@@ -65,6 +65,16 @@ class ServiceEventCreate(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+class ServiceEventWithItemsCreate(ServiceEventCreate):
+    items: List[ServiceItemLine] = Field(default_factory=list, max_length=200)
+
+class ServiceYearSummary(BaseModel):
+    year: int
+    events_count: int
+    total_cost: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
+
 class ServiceEventUpdate(BaseModel):
     service_date: Optional[datetime] = None
     mileage_at_service: Optional[int] = Field(None, ge=0)
@@ -53,8 +53,7 @@ class ServiceItemRead(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
     
-class ServiceItemCreate(BaseModel):
-    service_event_id: uuid.UUID
+class ServiceItemLine(BaseModel):
     type: str
     description: str
     cost: Decimal = Field(..., ge=0, decimal_places=2)
@@ -64,6 +63,9 @@ class ServiceItemCreate(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+class ServiceItemCreate(ServiceItemLine):
+    service_event_id: uuid.UUID
+
 class ServiceItemUpdate(BaseModel):
     type: Optional[str] = None
     description: Optional[str] = None
@@ -0,0 +1,58 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+from sqlalchemy import String, Integer, Date, DateTime, Numeric, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from pydantic import BaseModel
+from app.db.base import Base
+
+TIMELINE_SOURCES = ("finance", "loans", "fuel", "insurance", "inspection", "service")
+# Sources bucketed per vehicle, under "<brand> <model>".
+VEHICLE_SOURCES = ("fuel", "insurance", "inspection", "service")
+
+class TimelineMonthly(Base):
+    """Monthly income and expense per source and category, recomputed month by month by TimelineRepository."""
+    __tablename__ = "timeline_monthly"
+    __table_args__ = {"schema": "dmt"}
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.users.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    source: Mapped[str] = mapped_column(String(20), primary_key=True)
+    category: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    income: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    expense: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    entries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+class TimelineStaleMonth(Base):
+    """A month of the user's rollup that a write has invalidated; it is recomputed on the next read."""
+    __tablename__ = "timeline_stale_months"
+    __table_args__ = {"schema": "dmt"}
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("dmt.users.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+
+class TimelineBucket(BaseModel):
+    source: str
+    category: str
+    income: Decimal
+    expense: Decimal
+    entries: int
+
+class TimelineMonth(BaseModel):
+    month: date
+    income: Decimal
+    expense: Decimal
+    net: Decimal
+    cumulative_net: Decimal
+    buckets: List[TimelineBucket]
+
+class TimelineRead(BaseModel):
+    income: Decimal
+    expense: Decimal
+    net: Decimal
+    months: List[TimelineMonth]
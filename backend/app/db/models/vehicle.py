@@ -1,12 +1,17 @@
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy import String, Integer, Boolean, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
-from pydantic import BaseModel, ConfigDict, Field
+from decimal import Decimal
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.db.base import Base
+from app.db.models.fuel import FuelStatsRead
+from app.db.models.insurance import InsuranceRead, days_until, expiry_status
+from app.db.models.inspection import InspectionRead
+from app.db.models.service_event import ServiceEventRead
 
 class Vehicle(Base):
     __tablename__ = "vehicles"
@@ -53,4 +58,48 @@ class VehicleUpdate(BaseModel):
     last_service_mileage: Optional[int] = None
     is_active: Optional[bool] = None
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class VehicleRead(VehicleCreate):
+    id: uuid.UUID
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class VehicleDashboard(BaseModel):
+    vehicle: VehicleRead
+    fuel_stats: FuelStatsRead
+    insurance: Optional[InsuranceRead]
+    inspection: Optional[InspectionRead]
+    recent_services: List[ServiceEventRead]
+
+class VehicleOverview(VehicleRead):
+    insurance_end_date: Optional[datetime] = None
+    inspection_expiration_date: Optional[datetime] = None
+    last_refuel_date: Optional[datetime] = None
+    last_refuel_mileage: Optional[int] = None
+    ytd_fuel_spent: Decimal = Decimal("0")
+    ytd_service_spent: Decimal = Decimal("0")
+    ytd_inspection_spent: Decimal = Decimal("0")
+    ytd_insurance_spent: Decimal = Decimal("0")
+
+    @computed_field
+    @property
+    def insurance_status(self) -> Optional[str]:
+        if self.insurance_end_date is None:
+            return None
+        return expiry_status(days_until(self.insurance_end_date))
+
+    @computed_field
+    @property
+    def inspection_days_to_expiry(self) -> Optional[int]:
+        if self.inspection_expiration_date is None:
+            return None
+        return days_until(self.inspection_expiration_date)
+
+    @computed_field
+    @property
+    def ytd_spent(self) -> Decimal:
+        return self.ytd_fuel_spent + self.ytd_service_spent + self.ytd_inspection_spent + self.ytd_insurance_spent
@@ -0,0 +1,137 @@
+import uuid
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text, literal, null, cast, exists, case, func, or_, Integer, Row
+from sqlalchemy.orm import aliased
+from app.db.models.insurance import InsurancePolicy
+from app.db.models.inspection import TechnicalInspection
+from app.db.models.reminder import ServiceReminder
+from app.db.models.vehicle import Vehicle
+
+# The most recent recurring item of each type per vehicle decides when that service is due next.
+REFRESH_SERVICE_REMINDERS = text("""
+    INSERT INTO dmt.service_reminders (id, vehicle_id, service_item_id, type, description, due_date, due_mileage, computed_at)
+    SELECT DISTINCT ON (e.vehicle_id, i.type)
+        gen_random_uuid(), e.vehicle_id, i.id, i.type, i.description,
+        e.service_date + make_interval(months => i.interval_months),
+        e.mileage_at_service + i.interval_km,
+        now()
+    FROM dmt.service_items i
+    JOIN dmt.service_events e ON e.id = i.service_event_id
+    WHERE i.is_recurring
+      AND (i.interval_km IS NOT NULL OR i.interval_months IS NOT NULL)
+      AND (CAST(:vehicle_id AS uuid) IS NULL OR e.vehicle_id = CAST(:vehicle_id AS uuid))
+    ORDER BY e.vehicle_id, i.type, e.service_date DESC, e.mileage_at_service DESC
+""")
+
+CLEAR_SERVICE_REMINDERS = text("""
+    DELETE FROM dmt.service_reminders
+    WHERE CAST(:vehicle_id AS uuid) IS NULL OR vehicle_id = CAST(:vehicle_id AS uuid)
+""")
+
+class DeadlineRepository:
+    @staticmethod
+    async def refresh_service_reminders(db: AsyncSession, vehicle_id: uuid.UUID | None = None) -> bool:
+        """
+        Rebuilds the reminder queue for one vehicle or, without `vehicle_id`, for all of them.
+        Refreshes are serialized through an advisory lock, so two of them never insert the same
+        item. A full refresh is skipped (returns False) while another one holds the lock, a
+        per-vehicle refresh after a write waits for it instead.
+        """
+        params = {"vehicle_id": vehicle_id}
+        if vehicle_id is None:
+            locked = await db.execute(text("SELECT pg_try_advisory_xact_lock(hashtext('dmt.service_reminders'))"))
+            if not locked.scalar_one():
+                await db.rollback()
+                return False
+        else:
+            await db.execute(text("SELECT pg_advisory_xact_lock(hashtext('dmt.service_reminders'))"))
+        await db.execute(CLEAR_SERVICE_REMINDERS, params)
+        await db.execute(REFRESH_SERVICE_REMINDERS, params)
+        await db.commit()
+        return True
+
+    @staticmethod
+    async def get_upcoming(db: AsyncSession, user_id: uuid.UUID, until: datetime, km: int) -> list[Row]:
+        """
+        Insurance, inspection and service deadlines of the user's active vehicles as one stream,
+        most urgent first. Policies and inspections replaced by a newer one are skipped, overdue
+        ones that were not renewed are kept.
+        """
+        newer_policy = aliased(InsurancePolicy)
+        insurance = (
+            select(
+                literal("insurance").label("kind"),
+                InsurancePolicy.vehicle_id,
+                InsurancePolicy.id.label("source_id"),
+                func.concat(InsurancePolicy.policy_type, " ", InsurancePolicy.insurer_name).label("title"),
+                InsurancePolicy.end_date.label("due_date"),
+                cast(null(), Integer).label("due_mileage"),
+                Vehicle.current_mileage,
+            )
+            .join(Vehicle, Vehicle.id == InsurancePolicy.vehicle_id)
+            .where(
+                Vehicle.user_id == user_id,
+                Vehicle.is_active,
+                InsurancePolicy.end_date <= until,
+                ~exists().where(
+                    newer_policy.vehicle_id == InsurancePolicy.vehicle_id,
+                    newer_policy.start_date > InsurancePolicy.start_date,
+                ),
+            )
+        )
+
+        newer_inspection = aliased(TechnicalInspection)
+        inspection = (
+            select(
+                literal("inspection").label("kind"),
+                TechnicalInspection.vehicle_id,
+                TechnicalInspection.id.label("source_id"),
+                literal("Technical inspection").label("title"),
+                TechnicalInspection.expiration_date.label("due_date"),
+                cast(null(), Integer).label("due_mileage"),
+                Vehicle.current_mileage,
+            )
+            .join(Vehicle, Vehicle.id == TechnicalInspection.vehicle_id)
+            .where(
+                Vehicle.user_id == user_id,
+                Vehicle.is_active,
+                TechnicalInspection.expiration_date <= until,
+                ~exists().where(
+                    newer_inspection.vehicle_id == TechnicalInspection.vehicle_id,
+                    newer_inspection.inspection_date > TechnicalInspection.inspection_date,
+                ),
+            )
+        )
+
+        service = (
+            select(
+                literal("service").label("kind"),
+                ServiceReminder.vehicle_id,
+                ServiceReminder.service_item_id.label("source_id"),
+                ServiceReminder.description.label("title"),
+                ServiceReminder.due_date,
+                ServiceReminder.due_mileage,
+                Vehicle.current_mileage,
+            )
+            .join(Vehicle, Vehicle.id == ServiceReminder.vehicle_id)
+            .where(
+                Vehicle.user_id == user_id,
+                Vehicle.is_active,
+                or_(
+                    ServiceReminder.due_date <= until,
+                    ServiceReminder.due_mileage - Vehicle.current_mileage <= km,
+                ),
+            )
+        )
+
+        deadlines = insurance.union_all(inspection, service).subquery()
+        # A service that is close on mileage is due now, whatever its date says.
+        urgency = case(
+            (deadlines.c.due_mileage - deadlines.c.current_mileage <= km, func.least(deadlines.c.due_date, func.now())),
+            else_=deadlines.c.due_date,
+        )
+        result = await db.execute(
+            select(deadlines).order_by(urgency, deadlines.c.kind, deadlines.c.source_id)
+        )
+        return list(result.all())
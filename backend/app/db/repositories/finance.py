@@ -1,17 +1,19 @@
 import uuid
 from typing import Sequence, List, Optional
-from sqlalchemy import select, delete, extract, func, case, update
+from sqlalchemy import lambda_stmt, select, delete, extract, func, case, update, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import joinedload
-from app.db.models.finance import Account, Category, ImportRule, Transaction
+from app.db.models.finance import Account, Category, ImportRule, ImportSession, ImportSessionRow, Transaction
+from app.db.repositories.timeline import TimelineRepository
 
 class FinanceRepository:
     @staticmethod
     async def is_account_owner(session: AsyncSession, account_id: uuid.UUID, user_id: uuid.UUID) -> bool:
-        result = await session.execute(
-            select(Account).where(Account.id == account_id, Account.user_id == user_id)
-        )
-        return result.scalars().first() is not None
+        result = await session.execute(lambda_stmt(
+            lambda: select(Account.id).where(Account.id == account_id, Account.user_id == user_id)
+        ))
+        return result.scalar_one_or_none() is not None
 
     @staticmethod
     async def create_account(session: AsyncSession, account: Account) -> Account:
@@ -82,6 +84,69 @@ class FinanceRepository:
         session.add_all(transactions)
         await session.commit()
 
+    @staticmethod
+    async def create_import_session(session: AsyncSession, import_session: ImportSession, rows: List[dict]) -> ImportSession:
+        session.add(import_session)
+        await session.flush()
+        if rows:
+            # render_nulls keeps rows with and without a category in one executemany instead of alternating batches.
+            await session.execute(
+                insert(ImportSessionRow).execution_options(render_nulls=True),
+                [{**row, "session_id": import_session.id} for row in rows],
+            )
+        await session.commit()
+        return import_session
+
+    @staticmethod
+    async def get_import_session(session: AsyncSession, token: uuid.UUID, user_id: uuid.UUID) -> Optional[ImportSession]:
+        result = await session.execute(
+            select(ImportSession).where(
+                ImportSession.id == token,
+                ImportSession.user_id == user_id,
+                ImportSession.expires_at > func.now(),
+            )
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def count_import_rows(session: AsyncSession, token: uuid.UUID) -> int:
+        result = await session.execute(select(func.count()).where(ImportSessionRow.session_id == token))
+        return result.scalar_one()
+
+    @staticmethod
+    async def confirm_import_session(
+        session: AsyncSession, import_session: ImportSession, categories: dict, skipped: List[int]
+    ) -> int:
+        """
+        Copies the staged rows into the account's transactions inside the database and drops the session.
+        `categories` maps row positions to their overridden category; positions in `skipped` are left out.
+        """
+        if categories:
+            await session.execute(update(ImportSessionRow), [
+                {"session_id": import_session.id, "position": position, "category_id": category_id}
+                for position, category_id in categories.items()
+            ])
+
+        rows = select(
+            func.gen_random_uuid(),
+            literal(import_session.account_id, UUID(as_uuid=True)),
+            ImportSessionRow.category_id,
+            ImportSessionRow.date,
+            ImportSessionRow.amount,
+            ImportSessionRow.title,
+            ImportSessionRow.raw_hash,
+        ).where(ImportSessionRow.session_id == import_session.id)
+        if skipped:
+            rows = rows.where(ImportSessionRow.position.not_in(skipped))
+        await TimelineRepository.mark_stale_from(session, import_session.user_id, rows.with_only_columns(ImportSessionRow.date))
+
+        result = await session.execute(
+            insert(Transaction).from_select(["id", "account_id", "category_id", "date", "amount", "title", "raw_hash"], rows)
+        )
+        await session.execute(delete(ImportSession).where(ImportSession.id == import_session.id))
+        await session.commit()
+        return result.rowcount
+
     @staticmethod
     async def get_monthly_transactions(
         session: AsyncSession, account_id: uuid.UUID, month: int, year: int, limit: int = 50, offset: int = 0
@@ -110,16 +175,14 @@ class FinanceRepository:
         return transaction
 
     @staticmethod
-    async def apply_rule_to_existing_transactions(session: AsyncSession, rule: ImportRule) -> int:
-        stmt = (
-            update(Transaction)
-            .where(
-                Transaction.account_id == rule.account_id,
-                Transaction.category_id == None,
-                Transaction.title.ilike(f"%{rule.keyword}%")
-            )
-            .values(category_id=rule.category_id)
+    async def apply_rule_to_existing_transactions(session: AsyncSession, rule: ImportRule, user_id: uuid.UUID) -> int:
+        matching = (
+            Transaction.account_id == rule.account_id,
+            Transaction.category_id == None,
+            Transaction.title.ilike(f"%{rule.keyword}%")
         )
+        await TimelineRepository.mark_stale_from(session, user_id, select(Transaction.date).where(*matching))
+        stmt = update(Transaction).where(*matching).values(category_id=rule.category_id)
         result = await session.execute(stmt)
         await session.commit()
         return result.rowcount
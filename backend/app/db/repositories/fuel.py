@@ -1,12 +1,19 @@
 import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.db.models.fuel import FuelLog
+from sqlalchemy import select, Row
+from sqlalchemy.dialects.postgresql import insert
+from app.db.models.fuel import FuelLog, VehicleFuelStats
 
 class FuelRepository:
     @staticmethod
     async def create(db: AsyncSession, fuel_log: FuelLog) -> FuelLog:
         db.add(fuel_log)
+        await db.flush()
+        await db.refresh(fuel_log)
+        await FuelRepository.apply_to_stats(db, fuel_log)
         await db.commit()
         await db.refresh(fuel_log)
         return fuel_log
@@ -34,9 +41,123 @@ class FuelRepository:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def stream_history(
+        db: AsyncSession,
+        vehicle_id: uuid.UUID,
+        fuel_type: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Row]:
+        """Yields the whole (optionally filtered) refuel history in chronological order, batch by batch."""
+        query = (
+            select(FuelLog.date, FuelLog.mileage, FuelLog.liters, FuelLog.total_price, FuelLog.is_full, FuelLog.fuel_type)
+            .where(FuelLog.vehicle_id == vehicle_id)
+        )
+        if fuel_type:
+            query = query.where(FuelLog.fuel_type == fuel_type)
+        if date_from:
+            query = query.where(FuelLog.date >= date_from)
+        if date_to:
+            query = query.where(FuelLog.date <= date_to)
+
+        result = await db.stream(
+            query.order_by(FuelLog.date, FuelLog.mileage).execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    @staticmethod
+    async def get_stats(db: AsyncSession, vehicle_id: uuid.UUID) -> VehicleFuelStats | None:
+        result = await db.execute(
+            select(VehicleFuelStats).where(VehicleFuelStats.vehicle_id == vehicle_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def _lock_stats(db: AsyncSession, vehicle_id: uuid.UUID) -> VehicleFuelStats:
+        """Returns the summary row locked for the rest of the transaction, creating it if needed."""
+        await db.execute(
+            insert(VehicleFuelStats)
+            .values(vehicle_id=vehicle_id)
+            .on_conflict_do_nothing(index_elements=[VehicleFuelStats.vehicle_id])
+        )
+        result = await db.execute(
+            select(VehicleFuelStats)
+            .where(VehicleFuelStats.vehicle_id == vehicle_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    def _add_log(stats: VehicleFuelStats, log) -> None:
+        """Folds one refuel into the summary; logs must arrive in (date, mileage) order."""
+        stats.entries_count += 1
+        stats.total_spent += log.total_price
+        stats.total_liters += log.liters
+        stats.last_log_date = log.date
+        stats.last_log_mileage = log.mileage
+
+        if log.is_full:
+            if stats.last_full_mileage is not None:
+                distance = log.mileage - stats.last_full_mileage
+                if distance > 0:
+                    stats.consumption_distance += distance
+                    stats.consumption_liters += log.liters + stats.pending_liters
+                stats.pending_liters = Decimal("0")
+            stats.full_tank_count += 1
+            stats.last_full_mileage = log.mileage
+            stats.last_full_date = log.date
+        elif stats.last_full_mileage is not None:
+            stats.pending_liters += log.liters
+
+    @staticmethod
+    async def apply_to_stats(db: AsyncSession, fuel_log: FuelLog) -> None:
+        """
+        Updates the summary for a newly added log. Appending to the end of the history is O(1);
+        a back-dated log changes the segments after it, so the vehicle is recomputed instead.
+        """
+        stats = await FuelRepository._lock_stats(db, fuel_log.vehicle_id)
+        is_latest = stats.last_log_date is None or (fuel_log.date, fuel_log.mileage) >= (
+            stats.last_log_date, stats.last_log_mileage
+        )
+        if stats.entries_count and not is_latest:
+            await FuelRepository.rebuild_stats(db, fuel_log.vehicle_id)
+            return
+
+        FuelRepository._add_log(stats, fuel_log)
+        await db.flush()
+
+    @staticmethod
+    async def rebuild_stats(db: AsyncSession, vehicle_id: uuid.UUID) -> VehicleFuelStats:
+        """Recomputes the summary from the full history in one streaming pass. Does not commit."""
+        stats = await FuelRepository._lock_stats(db, vehicle_id)
+        stats.entries_count = 0
+        stats.full_tank_count = 0
+        stats.total_spent = Decimal("0")
+        stats.total_liters = Decimal("0")
+        stats.last_log_date = None
+        stats.last_log_mileage = None
+        stats.last_full_date = None
+        stats.last_full_mileage = None
+        stats.pending_liters = Decimal("0")
+        stats.consumption_distance = 0
+        stats.consumption_liters = Decimal("0")
+
+        async for log in FuelRepository.stream_history(db, vehicle_id):
+            FuelRepository._add_log(stats, log)
+
+        await db.flush()
+        return stats
+
     @staticmethod
     async def delete(db: AsyncSession, fuel_log: FuelLog) -> None:
+        vehicle_id = fuel_log.vehicle_id
         await db.delete(fuel_log)
+        await db.flush()
+        await FuelRepository.rebuild_stats(db, vehicle_id)
         await db.commit()
 
     @staticmethod
@@ -45,6 +166,8 @@ class FuelRepository:
             if hasattr(fuel_log, key) and value is not None:
                 setattr(fuel_log, key, value)
         
+        await db.flush()
+        await FuelRepository.rebuild_stats(db, fuel_log.vehicle_id)
         await db.commit()
         await db.refresh(fuel_log)
         return fuel_log
\ No newline at end of file
@@ -28,6 +28,16 @@ class InspectionRepository:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_latest(db: AsyncSession, vehicle_id: uuid.UUID) -> TechnicalInspection | None:
+        result = await db.execute(
+            select(TechnicalInspection)
+            .where(TechnicalInspection.vehicle_id == vehicle_id)
+            .order_by(TechnicalInspection.inspection_date.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def delete(db: AsyncSession, inspection: TechnicalInspection) -> None:
         await db.delete(inspection)
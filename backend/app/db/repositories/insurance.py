@@ -28,6 +28,17 @@ class InsuranceRepository:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_current(db: AsyncSession, vehicle_id: uuid.UUID, at: datetime) -> InsurancePolicy | None:
+        """The most recently started policy as of `at`; its status tells whether it still covers the car."""
+        result = await db.execute(
+            select(InsurancePolicy)
+            .where(InsurancePolicy.vehicle_id == vehicle_id, InsurancePolicy.start_date <= at)
+            .order_by(InsurancePolicy.start_date.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def delete(db: AsyncSession, policy: InsurancePolicy) -> None:
         await db.delete(policy)
@@ -1,8 +1,8 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.loan import Loan
-from app.db.models.payment import Payment
-from sqlalchemy import select, exists
+from app.db.models.payment import Payment, LoanPaymentTotals
+from sqlalchemy import select, exists, func, Row
 from datetime import datetime, timezone
 
 class LoanRepository:
@@ -23,6 +23,57 @@ class LoanRepository:
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_ids_by_user(db: AsyncSession, user_id: uuid.UUID) -> list[uuid.UUID]:
+        result = await db.execute(
+            select(Loan.id).where(Loan.user_id == user_id).order_by(Loan.created_at, Loan.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_with_payment_totals(
+        db: AsyncSession, user_id: uuid.UUID, loan_ids: list[uuid.UUID] | None = None
+    ) -> list[Row]:
+        """(Loan, installments paid, prepayments paid) for the user's loans, read from the maintained totals."""
+        query = (
+            select(
+                Loan,
+                func.coalesce(LoanPaymentTotals.total_installments_paid, 0),
+                func.coalesce(LoanPaymentTotals.total_prepayments, 0),
+            )
+            .outerjoin(LoanPaymentTotals, LoanPaymentTotals.loan_id == Loan.id)
+            .where(Loan.user_id == user_id)
+        )
+        if loan_ids is not None:
+            query = query.where(Loan.id.in_(loan_ids))
+        result = await db.execute(query)
+        return list(result.all())
+
+    @staticmethod
+    async def get_status(db: AsyncSession, user_id: uuid.UUID) -> list[Row]:
+        """Loan status rows for the user: an index lookup on loans joined to the totals by primary key."""
+        installments = func.coalesce(LoanPaymentTotals.total_installments_paid, 0)
+        prepayments = func.coalesce(LoanPaymentTotals.total_prepayments, 0)
+        result = await db.execute(
+            select(
+                Loan.id.label("loan_id"),
+                Loan.name,
+                Loan.total_amount,
+                Loan.installments_count,
+                Loan.installment_amount,
+                Loan.due_day,
+                (installments + prepayments).label("total_paid"),
+                (Loan.total_amount - installments - prepayments).label("remaining"),
+                installments.label("total_installments_paid"),
+                prepayments.label("total_prepayments"),
+                LoanPaymentTotals.last_paid_at,
+            )
+            .outerjoin(LoanPaymentTotals, LoanPaymentTotals.loan_id == Loan.id)
+            .where(Loan.user_id == user_id)
+            .order_by(Loan.created_at, Loan.id)
+        )
+        return list(result.all())
+
     @staticmethod
     async def has_payments(db: AsyncSession, loan_id: int) -> bool:
         result = await db.execute(
@@ -1,11 +1,30 @@
 import uuid
-from typing import List, Optional
+import json
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, tuple_
 from sqlalchemy.orm import joinedload
 from datetime import datetime
 from app.db.models.meal import Meal, ProteinType, BaseType
 
+MEAL_COLUMNS = {
+    "id": Meal.id,
+    "user_id": Meal.user_id,
+    "id_protein_type": Meal.id_protein_type,
+    "id_base_type": Meal.id_base_type,
+    "name": Meal.name,
+    "description": Meal.description,
+    "is_weekend_dish": Meal.is_weekend_dish,
+    "created_at": Meal.created_at,
+    "updated_at": Meal.updated_at,
+}
+MEAL_RELATIONS = {
+    "protein_type": (ProteinType, Meal.id_protein_type),
+    "base_type": (BaseType, Meal.id_base_type),
+}
+MEAL_LIST_FIELDS = tuple(MEAL_COLUMNS) + tuple(MEAL_RELATIONS)
+
 class MealRepository:
     
     @staticmethod
@@ -25,14 +44,78 @@ class MealRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_all_by_user(db: AsyncSession, user_id: uuid.UUID) -> List[Meal]:
-        result = await db.execute(
-            select(Meal)
-            .options(joinedload(Meal.protein_type), joinedload(Meal.base_type))
-            .where(Meal.user_id == user_id)
-            .order_by(Meal.name)
-        )
-        return list(result.scalars().all())
+    def encode_cursor(name: str, meal_id: uuid.UUID) -> str:
+        return base64.urlsafe_b64encode(json.dumps([name, str(meal_id)]).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[str, uuid.UUID]:
+        name, meal_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return name, uuid.UUID(meal_id)
+
+    @staticmethod
+    async def list_meals(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        fields: Sequence[str] = MEAL_LIST_FIELDS,
+        protein_id: Optional[uuid.UUID] = None,
+        base_id: Optional[uuid.UUID] = None,
+        is_weekend_dish: Optional[bool] = None,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Lists the user's meals ordered by (name, id), selecting only the requested columns.
+        Pages are addressed with an opaque cursor holding the last (name, id) pair.
+        """
+        columns = [MEAL_COLUMNS[f].label(f) for f in fields if f in MEAL_COLUMNS and f not in ("id", "name")]
+        query = select(Meal.id.label("id"), Meal.name.label("name"), *columns)
+
+        for field, (model, fk) in MEAL_RELATIONS.items():
+            if field in fields:
+                query = query.join(model, model.id == fk).add_columns(
+                    model.id.label(f"{field}__id"),
+                    model.name.label(f"{field}__name"),
+                    model.category.label(f"{field}__category"),
+                )
+
+        query = query.where(Meal.user_id == user_id)
+        if protein_id is not None:
+            query = query.where(Meal.id_protein_type == protein_id)
+        if base_id is not None:
+            query = query.where(Meal.id_base_type == base_id)
+        if is_weekend_dish is not None:
+            query = query.where(Meal.is_weekend_dish == is_weekend_dish)
+        if name:
+            query = query.where(Meal.name.ilike(f"%{name}%"))
+        if cursor:
+            last_name, last_id = MealRepository.decode_cursor(cursor)
+            query = query.where(tuple_(Meal.name, Meal.id) > tuple_(last_name, last_id))
+
+        query = query.order_by(Meal.name, Meal.id)
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        rows = (await db.execute(query)).mappings().all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = MealRepository.encode_cursor(rows[-1]["name"], rows[-1]["id"])
+
+        items = []
+        for row in rows:
+            item = {f: row[f] for f in fields if f in MEAL_COLUMNS}
+            for field in MEAL_RELATIONS:
+                if field in fields:
+                    item[field] = {
+                        "id": row[f"{field}__id"],
+                        "name": row[f"{field}__name"],
+                        "category": row[f"{field}__category"],
+                    }
+            items.append(item)
+
+        return items, next_cursor
 
     @staticmethod
     async def update(db: AsyncSession, meal: Meal, update_data: dict) -> Meal:
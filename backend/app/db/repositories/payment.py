@@ -1,7 +1,10 @@
 import uuid
+from collections import defaultdict
+from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.db.models.payment import Payment
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+from app.db.models.payment import Payment, PaymentType, LoanPaymentTotals
 from app.db.models.loan import Loan
 
 class PaymentRepository:
@@ -23,18 +26,118 @@ class PaymentRepository:
             )
         )
         return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def _upsert_totals(db: AsyncSession, deltas: list[dict]) -> None:
+        """Adds per-loan deltas to the totals, creating missing rows, in one multi-row upsert."""
+        stmt = insert(LoanPaymentTotals).values(deltas)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[LoanPaymentTotals.loan_id],
+            set_={
+                "payments_count": LoanPaymentTotals.payments_count + stmt.excluded.payments_count,
+                "total_installments_paid": LoanPaymentTotals.total_installments_paid + stmt.excluded.total_installments_paid,
+                "total_prepayments": LoanPaymentTotals.total_prepayments + stmt.excluded.total_prepayments,
+                "last_paid_at": func.greatest(LoanPaymentTotals.last_paid_at, stmt.excluded.last_paid_at),
+                "updated_at": func.now(),
+            },
+        ))
+
+    @staticmethod
+    async def apply_to_totals(db: AsyncSession, payment: Payment, sign: int = 1) -> None:
+        """Adds (or with sign=-1 removes) one payment to the loan totals."""
+        amount = Decimal(payment.amount) * sign
+        is_installment = PaymentType(payment.type) == PaymentType.installment
+        await PaymentRepository._upsert_totals(db, [{
+            "loan_id": payment.loan_id,
+            "payments_count": sign,
+            "total_installments_paid": amount if is_installment else 0,
+            "total_prepayments": 0 if is_installment else amount,
+            "last_paid_at": payment.paid_at if sign > 0 else None,
+        }])
+
+    @staticmethod
+    async def _refresh_last_paid_at(db: AsyncSession, loan_id: uuid.UUID) -> None:
+        """A removed or back-dated payment can move the latest date backwards, so it is looked up again."""
+        await db.flush()
+        await db.execute(
+            update(LoanPaymentTotals)
+            .where(LoanPaymentTotals.loan_id == loan_id)
+            .values(last_paid_at=select(func.max(Payment.paid_at)).where(Payment.loan_id == loan_id).scalar_subquery())
+        )
+
+    @staticmethod
+    async def create(db: AsyncSession, payment: Payment) -> Payment:
+        db.add(payment)
+        await db.flush()
+        await PaymentRepository.apply_to_totals(db, payment)
+        await db.commit()
+        await db.refresh(payment)
+        return payment
     
+    @staticmethod
+    async def bulk_create(db: AsyncSession, lines: list[dict]) -> tuple[list[uuid.UUID], int]:
+        """
+        Inserts the lines that are not recorded yet, matched on (loan_id, paid_at, amount, type),
+        with one multi-row INSERT and one totals upsert. Returns the new ids and the skipped count.
+        """
+        if not lines:
+            return [], 0
+
+        def key(loan_id, paid_at, amount, payment_type):
+            return loan_id, paid_at, Decimal(amount), PaymentType(payment_type)
+
+        existing = await db.execute(
+            select(Payment.loan_id, Payment.paid_at, Payment.amount, Payment.type).where(
+                Payment.loan_id.in_({line["loan_id"] for line in lines}),
+                Payment.paid_at.between(min(line["paid_at"] for line in lines), max(line["paid_at"] for line in lines)),
+            )
+        )
+        recorded = {key(*row) for row in existing.all()}
+        new_lines = [
+            line for line in lines
+            if key(line["loan_id"], line["paid_at"], line["amount"], line["type"]) not in recorded
+        ]
+        if not new_lines:
+            return [], len(lines)
+
+        result = await db.scalars(insert(Payment).returning(Payment.id, sort_by_parameter_order=True), new_lines)
+        payment_ids = list(result.all())
+
+        deltas = defaultdict(lambda: {"payments_count": 0, "total_installments_paid": Decimal("0"), "total_prepayments": Decimal("0"), "last_paid_at": None})
+        for line in new_lines:
+            delta = deltas[line["loan_id"]]
+            delta["payments_count"] += 1
+            column = "total_installments_paid" if PaymentType(line["type"]) == PaymentType.installment else "total_prepayments"
+            delta[column] += Decimal(line["amount"])
+            delta["last_paid_at"] = max(filter(None, [delta["last_paid_at"], line["paid_at"]]))
+        await PaymentRepository._upsert_totals(db, [{"loan_id": loan_id, **delta} for loan_id, delta in deltas.items()])
+
+        await db.commit()
+        return payment_ids, len(lines) - len(new_lines)
+
+    @staticmethod
+    async def get_installment_months(db: AsyncSession, loan_id: uuid.UUID) -> set[tuple[int, int]]:
+        result = await db.execute(
+            select(Payment.paid_at).where(Payment.loan_id == loan_id, Payment.type == PaymentType.installment)
+        )
+        return {(paid_at.year, paid_at.month) for paid_at in result.scalars().all()}
+
     @staticmethod
     async def delete(db: AsyncSession, payment: Payment) -> None:
+        await PaymentRepository.apply_to_totals(db, payment, sign=-1)
         await db.delete(payment)
+        await PaymentRepository._refresh_last_paid_at(db, payment.loan_id)
         await db.commit()
 
     @staticmethod
     async def update(db: AsyncSession, payment: Payment, update_data: dict) -> Payment:
+        await PaymentRepository.apply_to_totals(db, payment, sign=-1)
         for key, value in update_data.items():
             if value is not None:
                 setattr(payment, key, value)
-        
+
+        await PaymentRepository.apply_to_totals(db, payment)
+        await PaymentRepository._refresh_last_paid_at(db, payment.loan_id)
         await db.commit()
         await db.refresh(payment)
-        return payment
\ No newline at end of file
+        return payment
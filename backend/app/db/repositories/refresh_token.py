@@ -1,5 +1,5 @@
 from datetime import datetime, UTC
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.refresh_token import RefreshToken
 
@@ -11,13 +11,14 @@ class RefreshTokenRepository:
         session: AsyncSession,
         token_hash: str,
     ) -> RefreshToken | None:
-        result = await session.execute(
-            select(RefreshToken).where(
+        now = datetime.now(UTC)
+        result = await session.execute(lambda_stmt(
+            lambda: select(RefreshToken).where(
                 RefreshToken.token_hash == token_hash,
                 RefreshToken.revoked_at.is_(None),
-                RefreshToken.expires_at > datetime.now(UTC),
+                RefreshToken.expires_at > now,
             )
-        )
+        ))
         return result.scalar_one_or_none()
 
     @staticmethod
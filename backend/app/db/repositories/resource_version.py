@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from app.db.models.resource_version import ResourceVersion
+
+class ResourceVersionRepository:
+    @staticmethod
+    async def get(db: AsyncSession, user_id: uuid.UUID, resource: str) -> Tuple[int, Optional[datetime]]:
+        """(version, updated_at); a resource that was never written is at version 0."""
+        result = await db.execute(
+            select(ResourceVersion.version, ResourceVersion.updated_at).where(
+                ResourceVersion.user_id == user_id, ResourceVersion.resource == resource
+            )
+        )
+        row = result.first()
+        return (row.version, row.updated_at) if row else (0, None)
+
+    @staticmethod
+    async def bump(db: AsyncSession, user_id: uuid.UUID, resources: Iterable[str]) -> None:
+        stmt = insert(ResourceVersion).values([{"user_id": user_id, "resource": r} for r in resources])
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[ResourceVersion.user_id, ResourceVersion.resource],
+            set_={"version": ResourceVersion.version + 1, "updated_at": func.now()},
+        ))
+        await db.commit()
@@ -1,30 +1,53 @@
 import uuid
+import json
+import base64
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, Tuple
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update
+from sqlalchemy import select, func, update, insert, exists, extract, tuple_, Row
+from sqlalchemy.orm import selectinload
 from app.db.models.service_event import ServiceEvent
-from app.db.models.service_item import ServiceItem
+from app.db.models.service_item import ServiceItem, ServiceItemLine
 from app.db.models.vehicle import Vehicle
 
 class ServiceRepository:
     @staticmethod
     async def sync_vehicle_cache(db: AsyncSession, vehicle_id: uuid.UUID):
-        result = await db.execute(
-            select(ServiceEvent)
+        """
+        Copies the latest service onto the vehicle in a single UPDATE ... FROM, inside the caller's
+        transaction. Without any service events the vehicle is left as it is.
+        """
+        latest = (
+            select(ServiceEvent.vehicle_id, ServiceEvent.service_date, ServiceEvent.mileage_at_service)
             .where(ServiceEvent.vehicle_id == vehicle_id)
             .order_by(ServiceEvent.service_date.desc(), ServiceEvent.mileage_at_service.desc())
             .limit(1)
+            .subquery()
+        )
+        await db.execute(
+            update(Vehicle)
+            .where(Vehicle.id == latest.c.vehicle_id)
+            .values(
+                current_mileage=func.greatest(Vehicle.current_mileage, latest.c.mileage_at_service),
+                last_service_date=latest.c.service_date,
+                last_service_mileage=latest.c.mileage_at_service,
+            )
+            .execution_options(synchronize_session="fetch")
         )
-        latest_service = result.scalar_one_or_none()
-
-        vehicle_result = await db.execute(select(Vehicle).where(Vehicle.id == vehicle_id))
-        vehicle = vehicle_result.scalar_one_or_none()
 
-        if vehicle and latest_service:
-            vehicle.current_mileage = max(vehicle.current_mileage, latest_service.mileage_at_service)
-            vehicle.last_service_date = latest_service.service_date
-            vehicle.last_service_mileage = latest_service.mileage_at_service
-            await db.commit()
+    @staticmethod
+    async def add_to_total_cost(db: AsyncSession, event_id: uuid.UUID, delta: Decimal):
+        """Shifts the event total by the cost change of one item instead of re-summing all of them."""
+        if not delta:
+            return
+        await db.execute(
+            update(ServiceEvent)
+            .where(ServiceEvent.id == event_id)
+            .values(total_cost=func.coalesce(ServiceEvent.total_cost, 0) + delta)
+            .execution_options(synchronize_session="fetch")
+        )
 
     @staticmethod
     async def update_event_total_cost(db: AsyncSession, event_id: uuid.UUID):
@@ -43,12 +66,128 @@ class ServiceRepository:
     @staticmethod
     async def create_event(db: AsyncSession, event: ServiceEvent) -> ServiceEvent:
         db.add(event)
+        await db.flush()
+        await ServiceRepository.sync_vehicle_cache(db, event.vehicle_id)
         await db.commit()
         await db.refresh(event)
-        await ServiceRepository.sync_vehicle_cache(db, event.vehicle_id)
         return event
 
     @staticmethod
     async def get_event_by_id(db: AsyncSession, event_id: uuid.UUID):
         result = await db.execute(select(ServiceEvent).where(ServiceEvent.id == event_id))
-        return result.scalar_one_or_none()
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_recent_events(db: AsyncSession, vehicle_id: uuid.UUID, limit: int = 5) -> list[ServiceEvent]:
+        result = await db.execute(
+            select(ServiceEvent)
+            .where(ServiceEvent.vehicle_id == vehicle_id)
+            .options(selectinload(ServiceEvent.items))
+            .order_by(ServiceEvent.service_date.desc(), ServiceEvent.mileage_at_service.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def create_event_with_items(
+        db: AsyncSession, event: ServiceEvent, items: list[ServiceItemLine]
+    ) -> tuple[ServiceEvent, list[uuid.UUID]]:
+        """Inserts the event and all of its items in one transaction, with the total computed up front."""
+        event.total_cost = sum((item.cost for item in items), Decimal("0"))
+        db.add(event)
+        await db.flush()
+
+        item_ids = []
+        if items:
+            result = await db.scalars(
+                insert(ServiceItem).returning(ServiceItem.id, sort_by_parameter_order=True),
+                [{**item.model_dump(), "service_event_id": event.id} for item in items],
+            )
+            item_ids = list(result.all())
+
+        await ServiceRepository.sync_vehicle_cache(db, event.vehicle_id)
+        await db.commit()
+        await db.refresh(event)
+        return event, item_ids
+
+    @staticmethod
+    def encode_cursor(service_date: datetime, event_id: uuid.UUID) -> str:
+        return base64.urlsafe_b64encode(json.dumps([service_date.isoformat(), str(event_id)]).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        service_date, event_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(service_date), uuid.UUID(event_id)
+
+    @staticmethod
+    async def get_history(
+        db: AsyncSession,
+        vehicle_id: uuid.UUID,
+        user_id: uuid.UUID,
+        item_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[list[ServiceEvent], Optional[str]]:
+        """
+        Service events of the user's vehicle, newest first, paged by an opaque (service_date, id)
+        cursor. With `item_type` only events containing such items are returned, and only those
+        items are loaded.
+        """
+        items = ServiceEvent.items
+        query = (
+            select(ServiceEvent)
+            .join(Vehicle, Vehicle.id == ServiceEvent.vehicle_id)
+            .where(ServiceEvent.vehicle_id == vehicle_id, Vehicle.user_id == user_id)
+        )
+        if item_type:
+            items = items.and_(ServiceItem.type == item_type)
+            query = query.where(
+                exists().where(ServiceItem.service_event_id == ServiceEvent.id, ServiceItem.type == item_type)
+            ).execution_options(populate_existing=True)
+        if cursor:
+            last_date, last_id = ServiceRepository.decode_cursor(cursor)
+            query = query.where(tuple_(ServiceEvent.service_date, ServiceEvent.id) < tuple_(last_date, last_id))
+
+        query = query.options(selectinload(items)).order_by(ServiceEvent.service_date.desc(), ServiceEvent.id.desc())
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        events = list((await db.execute(query)).scalars().all())
+
+        next_cursor = None
+        if limit is not None and len(events) > limit:
+            events = events[:limit]
+            next_cursor = ServiceRepository.encode_cursor(events[-1].service_date, events[-1].id)
+        return events, next_cursor
+
+    @staticmethod
+    async def get_yearly_costs(
+        db: AsyncSession, vehicle_id: uuid.UUID, user_id: uuid.UUID, item_type: Optional[str] = None
+    ) -> list[Row]:
+        """Per-year totals computed in SQL from the maintained event totals, or from items of one type."""
+        year = extract("year", ServiceEvent.service_date)
+        if item_type:
+            query = (
+                select(
+                    year.label("year"),
+                    func.count(func.distinct(ServiceEvent.id)).label("events_count"),
+                    func.coalesce(func.sum(ServiceItem.cost), 0).label("total_cost"),
+                )
+                .select_from(ServiceEvent)
+                .join(ServiceItem, ServiceItem.service_event_id == ServiceEvent.id)
+                .where(ServiceItem.type == item_type)
+            )
+        else:
+            query = select(
+                year.label("year"),
+                func.count(ServiceEvent.id).label("events_count"),
+                func.coalesce(func.sum(ServiceEvent.total_cost), 0).label("total_cost"),
+            ).select_from(ServiceEvent)
+
+        result = await db.execute(
+            query.join(Vehicle, Vehicle.id == ServiceEvent.vehicle_id)
+            .where(ServiceEvent.vehicle_id == vehicle_id, Vehicle.user_id == user_id)
+            .group_by(year)
+            .order_by(year.desc())
+        )
+        return list(result.all())
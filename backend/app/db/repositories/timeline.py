@@ -0,0 +1,152 @@
+import uuid
+from datetime import date, datetime
+from typing import Iterable, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Date, cast, select, delete, exists, func, literal, text, Row, Select
+from sqlalchemy.dialects.postgresql import UUID, insert
+from app.db.models.timeline import TimelineMonthly, TimelineStaleMonth
+
+# Finance transactions are signed; everything else recorded for loans and vehicles is a cost.
+# Vehicle costs are bucketed per vehicle, loan payments per loan, transactions per category.
+# Only the given months are read, each source through its date range so the date indexes apply.
+REBUILD_MONTHS = text("""
+    WITH months AS (
+        SELECT month, month + interval '1 month' AS next_month
+        FROM unnest(CAST(:months AS date[])) AS month
+    )
+    INSERT INTO dmt.timeline_monthly (user_id, month, source, category, income, expense, entries, computed_at)
+    SELECT CAST(:user_id AS uuid), month, source, category,
+           SUM(GREATEST(amount, 0)), SUM(GREATEST(-amount, 0)), COUNT(*), now()
+    FROM (
+        SELECT m.month, 'finance' AS source, COALESCE(c.name, 'Uncategorized') AS category, t.amount
+        FROM dmt.transactions t
+        JOIN dmt.accounts a ON a.id = t.account_id
+        JOIN months m ON t.date >= m.month AND t.date < m.next_month
+        LEFT JOIN dmt.categories c ON c.id = t.category_id
+        WHERE a.user_id = CAST(:user_id AS uuid)
+        UNION ALL
+        SELECT m.month, 'loans', l.name, -p.amount
+        FROM dmt.payments p
+        JOIN dmt.loans l ON l.id = p.loan_id
+        JOIN months m ON p.paid_at >= m.month AND p.paid_at < m.next_month
+        WHERE l.user_id = CAST(:user_id AS uuid)
+        UNION ALL
+        SELECT m.month, 'fuel', v.brand || ' ' || v.model, -f.total_price
+        FROM dmt.fuel_logs f
+        JOIN dmt.vehicles v ON v.id = f.vehicle_id
+        JOIN months m ON f.date >= m.month AND f.date < m.next_month
+        WHERE v.user_id = CAST(:user_id AS uuid)
+        UNION ALL
+        SELECT m.month, 'insurance', v.brand || ' ' || v.model, -i.total_cost
+        FROM dmt.insurance_policies i
+        JOIN dmt.vehicles v ON v.id = i.vehicle_id
+        JOIN months m ON i.start_date >= m.month AND i.start_date < m.next_month
+        WHERE v.user_id = CAST(:user_id AS uuid)
+        UNION ALL
+        SELECT m.month, 'inspection', v.brand || ' ' || v.model, -ti.cost
+        FROM dmt.technical_inspections ti
+        JOIN dmt.vehicles v ON v.id = ti.vehicle_id
+        JOIN months m ON ti.inspection_date >= m.month AND ti.inspection_date < m.next_month
+        WHERE v.user_id = CAST(:user_id AS uuid)
+        UNION ALL
+        SELECT m.month, 'service', v.brand || ' ' || v.model, -COALESCE(e.total_cost, 0)
+        FROM dmt.service_events e
+        JOIN dmt.vehicles v ON v.id = e.vehicle_id
+        JOIN months m ON e.service_date >= m.month AND e.service_date < m.next_month
+        WHERE v.user_id = CAST(:user_id AS uuid)
+    ) entries
+    GROUP BY month, source, category
+""")
+
+class TimelineRepository:
+    @staticmethod
+    async def mark_stale(db: AsyncSession, user_id: uuid.UUID, dates: Iterable[date | datetime | None]) -> None:
+        """
+        Queues the months of the given dates for recomputation. Callers pass the dates a write
+        touches (old and new) before committing it, so the mark commits together with the write.
+        """
+        months = {
+            (value.date() if isinstance(value, datetime) else value).replace(day=1)
+            for value in dates if value is not None
+        }
+        if months:
+            await db.execute(
+                insert(TimelineStaleMonth)
+                .values([{"user_id": user_id, "month": month} for month in months])
+                .on_conflict_do_nothing()
+            )
+
+    @staticmethod
+    async def mark_stale_from(db: AsyncSession, user_id: uuid.UUID, dates: Select) -> None:
+        """Like mark_stale, for writes that touch many rows; `dates` selects their date column."""
+        dates = dates.subquery()
+        column = next(iter(dates.c))
+        months = select(literal(user_id, UUID(as_uuid=True)), cast(func.date_trunc("month", column), Date)).distinct()
+        await db.execute(
+            insert(TimelineStaleMonth).from_select(["user_id", "month"], months).on_conflict_do_nothing()
+        )
+
+    @staticmethod
+    async def mark_buckets_stale(
+        db: AsyncSession, user_id: uuid.UUID, sources: Sequence[str], category: Optional[str] = None
+    ) -> None:
+        """Queues every month the given buckets appear in, for renames and deletes that regroup them."""
+        query = select(TimelineMonthly.month).where(
+            TimelineMonthly.user_id == user_id, TimelineMonthly.source.in_(sources)
+        )
+        if category is not None:
+            query = query.where(TimelineMonthly.category == category)
+        await TimelineRepository.mark_stale_from(db, user_id, query)
+
+    @staticmethod
+    async def has_stale_months(db: AsyncSession, user_id: uuid.UUID) -> bool:
+        result = await db.execute(select(exists().where(TimelineStaleMonth.user_id == user_id)))
+        return result.scalar_one()
+
+    @staticmethod
+    async def rebuild_stale(db: AsyncSession, user_id: uuid.UUID) -> None:
+        """
+        Recomputes the queued months of the user's rollup in the caller's transaction. The advisory
+        lock keeps concurrent rebuilds from colliding; a write committed meanwhile leaves its own
+        mark behind, so it is picked up by the next rebuild.
+        """
+        params = {"user_id": str(user_id)}
+        await db.execute(text("SELECT pg_advisory_xact_lock(hashtext(CAST(:user_id AS text)))"), params)
+        result = await db.execute(
+            delete(TimelineStaleMonth).where(TimelineStaleMonth.user_id == user_id).returning(TimelineStaleMonth.month)
+        )
+        months = list(result.scalars().all())
+        if not months:
+            return
+
+        await db.execute(
+            delete(TimelineMonthly).where(TimelineMonthly.user_id == user_id, TimelineMonthly.month.in_(months))
+        )
+        await db.execute(REBUILD_MONTHS, {**params, "months": months})
+
+    @staticmethod
+    async def get_months(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> list[Row]:
+        query = select(
+            TimelineMonthly.month,
+            TimelineMonthly.source,
+            TimelineMonthly.category,
+            TimelineMonthly.income,
+            TimelineMonthly.expense,
+            TimelineMonthly.entries,
+        ).where(TimelineMonthly.user_id == user_id)
+
+        if date_from:
+            query = query.where(TimelineMonthly.month >= date_from.replace(day=1))
+        if date_to:
+            query = query.where(TimelineMonthly.month <= date_to)
+        if sources:
+            query = query.where(TimelineMonthly.source.in_(sources))
+
+        result = await db.execute(query.order_by(TimelineMonthly.month, TimelineMonthly.source, TimelineMonthly.category))
+        return list(result.all())
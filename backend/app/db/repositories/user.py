@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import select, or_, delete
+from sqlalchemy import lambda_stmt, select, or_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.user import User
 from app.db.models.refresh_token import RefreshToken
@@ -11,14 +11,9 @@ class UserRepository:
         session: AsyncSession,
         identifier: str,
     ) -> User | None:
-        result = await session.execute(
-            select(User).where(
-                or_(
-                    User.email == identifier,
-                    User.login == identifier,
-                )
-            )
-        )
+        result = await session.execute(lambda_stmt(
+            lambda: select(User).where(or_(User.email == identifier, User.login == identifier))
+        ))
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -1,8 +1,12 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, func, true, Row
 from datetime import datetime
 from app.db.models.vehicle import Vehicle
+from app.db.models.fuel import FuelLog
+from app.db.models.insurance import InsurancePolicy
+from app.db.models.inspection import TechnicalInspection
+from app.db.models.service_event import ServiceEvent
 
 class VehicleRepository:
     @staticmethod
@@ -14,12 +18,10 @@ class VehicleRepository:
 
     @staticmethod
     async def get_by_id(db: AsyncSession, vehicle_id: uuid.UUID, user_id: uuid.UUID) -> Vehicle | None:
-        result = await db.execute(
-            select(Vehicle).where(
-                Vehicle.id == vehicle_id,
-                Vehicle.user_id == user_id
-            )
-        )
+        # Lambda statements are built and cached once; later calls only bind the new parameters.
+        result = await db.execute(lambda_stmt(
+            lambda: select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == user_id)
+        ))
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -29,6 +31,63 @@ class VehicleRepository:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_overview(db: AsyncSession, user_id: uuid.UUID, since: datetime) -> list[Row]:
+        """
+        Every vehicle of the user with its latest policy, inspection and refuel plus the spend since
+        `since`, in a single statement. The lateral subqueries read one row each through the
+        (vehicle_id, date) indexes, so the cost grows with the number of vehicles, not their history.
+        """
+        policy = (
+            select(InsurancePolicy.end_date)
+            .where(InsurancePolicy.vehicle_id == Vehicle.id, InsurancePolicy.start_date <= func.now())
+            .order_by(InsurancePolicy.start_date.desc())
+            .limit(1)
+            .lateral("policy")
+        )
+        inspection = (
+            select(TechnicalInspection.expiration_date)
+            .where(TechnicalInspection.vehicle_id == Vehicle.id)
+            .order_by(TechnicalInspection.inspection_date.desc())
+            .limit(1)
+            .lateral("inspection")
+        )
+        refuel = (
+            select(FuelLog.date, FuelLog.mileage)
+            .where(FuelLog.vehicle_id == Vehicle.id)
+            .order_by(FuelLog.date.desc(), FuelLog.mileage.desc())
+            .limit(1)
+            .lateral("refuel")
+        )
+
+        def spent_since(amount, vehicle_id, date):
+            return (
+                select(func.coalesce(func.sum(amount), 0))
+                .where(vehicle_id == Vehicle.id, date >= since)
+                .scalar_subquery()
+            )
+
+        result = await db.execute(
+            select(
+                Vehicle,
+                policy.c.end_date.label("insurance_end_date"),
+                inspection.c.expiration_date.label("inspection_expiration_date"),
+                refuel.c.date.label("last_refuel_date"),
+                refuel.c.mileage.label("last_refuel_mileage"),
+                spent_since(FuelLog.total_price, FuelLog.vehicle_id, FuelLog.date).label("ytd_fuel_spent"),
+                spent_since(ServiceEvent.total_cost, ServiceEvent.vehicle_id, ServiceEvent.service_date).label("ytd_service_spent"),
+                spent_since(TechnicalInspection.cost, TechnicalInspection.vehicle_id, TechnicalInspection.inspection_date).label("ytd_inspection_spent"),
+                spent_since(InsurancePolicy.total_cost, InsurancePolicy.vehicle_id, InsurancePolicy.start_date).label("ytd_insurance_spent"),
+            )
+            .select_from(Vehicle)
+            .outerjoin(policy, true())
+            .outerjoin(inspection, true())
+            .outerjoin(refuel, true())
+            .where(Vehicle.user_id == user_id)
+            .order_by(Vehicle.created_at, Vehicle.id)
+        )
+        return list(result.all())
+
     @staticmethod
     async def delete(db: AsyncSession, vehicle: Vehicle) -> None:
         await db.delete(vehicle)
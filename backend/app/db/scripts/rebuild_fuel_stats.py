@@ -0,0 +1,32 @@
+"""
+Recomputes dmt.vehicle_fuel_stats from the fuel log history.
+
+Usage:
+    python -m app.db.scripts.rebuild_fuel_stats                 # every vehicle
+    python -m app.db.scripts.rebuild_fuel_stats <vehicle_id>... # selected vehicles
+"""
+import asyncio
+import sys
+import uuid
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models.vehicle import Vehicle
+from app.db.repositories.fuel import FuelRepository
+
+async def rebuild(vehicle_ids: list[uuid.UUID] | None = None) -> int:
+    async with AsyncSessionLocal() as db:
+        if not vehicle_ids:
+            vehicle_ids = list((await db.execute(select(Vehicle.id))).scalars().all())
+
+        # One transaction per vehicle keeps the row locks short on a live database.
+        for vehicle_id in vehicle_ids:
+            await FuelRepository.rebuild_stats(db, vehicle_id)
+            await db.commit()
+
+    await engine.dispose()
+    return len(vehicle_ids)
+
+if __name__ == "__main__":
+    ids = [uuid.UUID(arg) for arg in sys.argv[1:]]
+    count = asyncio.run(rebuild(ids))
+    print(f"Rebuilt fuel stats for {count} vehicle(s)")
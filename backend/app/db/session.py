@@ -1,14 +1,30 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from functools import lru_cache
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from app.core.config import get_settings
 
-settings = get_settings()
+# Creating the engine loads the asyncpg dialect, so it is built on first use (normally in the
+# application lifespan) rather than when this module is imported.
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-)
+@lru_cache
+def get_engine() -> AsyncEngine:
+    settings = get_settings()
+    return create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+    )
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    expire_on_commit=False,
-)
+@lru_cache
+def get_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=get_engine(),
+        expire_on_commit=False,
+    )
+
+def __getattr__(name: str):
+    # Keeps `from app.db.session import engine, AsyncSessionLocal` working for scripts.
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import get_settings
+from app.core.responses import DefaultJSONResponse, add_compression
+from app.core.observability import ObservabilityMiddleware, instrument_sql
 from app.api.auth import router as auth_router
 from app.api.loan import router as loan_router
 from app.api.payment import router as payment_router
@@ -16,24 +18,40 @@ from app.api.settings.meal_settings import router as meal_settings_router
 from app.api.meals_ingredients import router as meals_ingredients_router
 from app.api.meal_analysis import router as meal_analysis_router
 from app.api.finance import router as finance_router
+from app.api.deadlines import router as deadlines_router
+from app.api.timeline import router as timeline_router
+from app.api.metrics import router as metrics_router
 from app.services.cleanup import periodic_cleanup
+from app.services.reminders import periodic_reminder_refresh
+from app.services.dictionary_cache import dictionary_cache
+from app.services.meal_service import load_default_dataset
+from app.core.security import warm_up as warm_up_security
+from app.db.session import get_engine
 import asyncio
 
 settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Work kept out of import time, done once before the first request instead.
+    load_default_dataset()
+    engine = get_engine()
+    warm_up_security()
     cleanup_task = asyncio.create_task(periodic_cleanup())
+    dictionary_listener_task = asyncio.create_task(dictionary_cache.listen())
+    reminders_task = asyncio.create_task(periodic_reminder_refresh())
     
     yield
     
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    for task in (cleanup_task, dictionary_listener_task, reminders_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await engine.dispose()
 
-app = FastAPI(title=settings.app_name, lifespan=lifespan)
+app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=DefaultJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -41,7 +59,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+add_compression(app, minimum_size=settings.compression_minimum_size)
+app.add_middleware(
+    ObservabilityMiddleware,
+    n_plus_one_threshold=settings.n_plus_one_threshold,
+    profiling_enabled=settings.profiling_enabled,
+    profiling_token=settings.profiling_token,
+)
+instrument_sql(settings.slow_query_ms)
 
 app.include_router(auth_router)
 app.include_router(loan_router)
@@ -65,6 +92,9 @@ app.include_router(
 )
 app.include_router(meals_ingredients_router)
 app.include_router(finance_router)
+app.include_router(deadlines_router)
+app.include_router(timeline_router)
+app.include_router(metrics_router)
 
 @app.get("/health")
 async def health():
@@ -1,7 +1,10 @@
 import asyncio
+import logging
 from sqlalchemy import text
 from app.db.deps import get_db
 
+logger = logging.getLogger("domator.cleanup")
+
 async def cleanup_refresh_tokens():
     async for db in get_db():
         await db.execute(text("""
@@ -13,11 +16,19 @@ async def cleanup_refresh_tokens():
         await db.commit()
         break
 
+async def cleanup_import_sessions():
+    async for db in get_db():
+        # Staged rows go with their session (ON DELETE CASCADE).
+        await db.execute(text("DELETE FROM dmt.import_sessions WHERE expires_at < NOW()"))
+        await db.commit()
+        break
+
 async def periodic_cleanup():
     while True:
         try:
             await cleanup_refresh_tokens()
-            print("Cleanup: The database has been cleaned up of old tokens.")
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
+            await cleanup_import_sessions()
+            logger.info("The database has been cleaned up of old tokens and import sessions.")
+        except Exception:
+            logger.exception("Error during cleanup")
         await asyncio.sleep(3600)
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PROTEINS = "proteins"
+BASES = "bases"
+INGREDIENTS = "ingredients"
+
+logger = logging.getLogger("domator.dictionary_cache")
+
+class DictionaryCache:
+    """
+    Read-through cache for the small global dictionaries (protein types, base types, ingredients).
+
+    Every entry keeps the serialized payload together with its ETag, so a client that sends
+    a matching If-None-Match gets a 304 without touching the database. Writes invalidate the
+    entry locally and broadcast the change with NOTIFY, which the listener started in the
+    application lifespan relays to the other workers.
+    """
+
+    CHANNEL = "dmt_dictionaries"
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[str, bytes]] = {}
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    async def get(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[List[Any]]],
+        schema: Type[BaseModel],
+    ) -> Tuple[str, bytes]:
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+
+        generation = self._generations.get(name, 0)
+        rows = await loader()
+        payload = [schema.model_validate(row).model_dump(mode="json") for row in rows]
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entry = (self.make_etag(body), body)
+
+        # An invalidation that arrived while loading means the rows may already be stale.
+        if self._generations.get(name, 0) == generation:
+            self._entries[name] = entry
+        return entry
+
+    async def respond(
+        self,
+        request: Request,
+        name: str,
+        loader: Callable[[], Awaitable[List[Any]]],
+        schema: Type[BaseModel],
+    ) -> Response:
+        etag, body = await self.get(name, loader, schema)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def invalidate_local(self, name: Optional[str] = None):
+        names = [name] if name else list(set(self._entries) | set(self._generations))
+        for key in names:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        self.invalidate_local()
+
+    async def invalidate(self, db: AsyncSession, *names: str):
+        """Drops the entries in this worker and notifies the others after the write is committed."""
+        for name in names:
+            self.invalidate_local(name)
+            await db.execute(text("SELECT pg_notify(:channel, :name)"), {"channel": self.CHANNEL, "name": name})
+        await db.commit()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        self.invalidate_local(payload or None)
+
+    async def listen(self, reconnect_delay: int = 5):
+        """Keeps a LISTEN connection open for the lifetime of the app and reconnects when it drops."""
+        from app.db.session import get_engine
+
+        engine = get_engine()
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    lost = asyncio.Event()
+
+                    await driver.add_listener(self.CHANNEL, self._on_notify)
+                    driver.add_termination_listener(lambda _: lost.set())
+                    # Notifications sent while we were disconnected are gone, start from scratch.
+                    self.clear()
+                    try:
+                        await lost.wait()
+                    finally:
+                        if not driver.is_closed():
+                            await driver.remove_listener(self.CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Dictionary cache listener error")
+            await asyncio.sleep(reconnect_delay)
+
+dictionary_cache = DictionaryCache()
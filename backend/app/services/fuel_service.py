@@ -1,42 +1,54 @@
 import uuid
+from collections import deque
+from datetime import datetime
 from decimal import Decimal
 from sqlalchemy import Boolean
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.repositories.fuel import FuelRepository
-from app.db.models.fuel import FuelLog
+from app.db.models.fuel import FuelLog, FuelStatsRead
 
 class FuelService:
     @staticmethod
-    async def calculate_consumption(db: AsyncSession, vehicle_id: uuid.UUID, fuel_type: str = None):
-        logs = await FuelRepository.get_all_by_vehicle(db, vehicle_id)
-        
-        if fuel_type:
-            logs = [log for log in logs if log.fuel_type == fuel_type]
-            
-        logs.sort(key=lambda x: x.date)
-
-        if len(logs) < 2:
-            return {"message": "Not enough data to calculate consumption (min. 2 refuelings)."}
-
+    async def calculate_consumption(
+        db: AsyncSession,
+        vehicle_id: uuid.UUID,
+        fuel_type: str = None,
+        date_from: datetime = None,
+        date_to: datetime = None,
+        window: int = 3,
+    ):
+        """
+        Full-tank-to-full-tank consumption over the complete history, computed in one pass
+        over the stream. Partial refuels are added to the next full-tank segment.
+        """
         consumptions = []
-        
+        recent = deque(maxlen=window)
+
+        logs_count = 0
         last_full_log = None
         temp_liters = Decimal("0.0")
+        total_distance = 0
+        total_liters = Decimal("0.0")
 
-        for log in logs:
+        async for log in FuelRepository.stream_history(db, vehicle_id, fuel_type, date_from, date_to):
+            logs_count += 1
             if log.is_full:
                 if last_full_log is not None:
                     distance = log.mileage - last_full_log.mileage
                     
                     if distance > 0:
-                        total_liters = log.liters + temp_liters
-                        consumption = (total_liters / Decimal(distance)) * 100
+                        segment_liters = log.liters + temp_liters
+                        consumption = (segment_liters / Decimal(distance)) * 100
+                        recent.append(consumption)
+                        total_distance += distance
+                        total_liters += segment_liters
                         
                         consumptions.append({
                             "date": log.date,
                             "distance": distance,
-                            "liters": float(total_liters),
+                            "liters": float(segment_liters),
                             "consumption": round(float(consumption), 2),
+                            "rolling_average": round(float(sum(recent) / len(recent)), 2),
                             "fuel_type": log.fuel_type
                         })
                     
@@ -47,6 +59,9 @@ class FuelService:
                 if last_full_log is not None:
                     temp_liters += log.liters
 
+        if logs_count < 2:
+            return {"message": "Not enough data to calculate consumption (min. 2 refuelings)."}
+
         if not consumptions:
             return {"message": "Not enough full refuelings."}
 
@@ -55,18 +70,20 @@ class FuelService:
         return {
             "vehicle_id": vehicle_id,
             "average_consumption": round(avg_consumption, 2),
+            "weighted_average_consumption": round(float(total_liters / Decimal(total_distance) * 100), 2),
+            "rolling_average_consumption": consumptions[-1]["rolling_average"],
+            "rolling_window": window,
+            "total_distance": total_distance,
+            "total_liters": float(total_liters),
+            "segments_count": len(consumptions),
             "history": consumptions
         }
 
     @staticmethod
-    async def get_fuel_stats(db: AsyncSession, vehicle_id: uuid.UUID):
-        logs = await FuelRepository.get_all_by_vehicle(db, vehicle_id)
-        
-        total_cost = sum(log.total_price for log in logs)
-        total_liters = sum(log.liters for log in logs)
-        
-        return {
-            "total_spent": float(total_cost),
-            "total_liters": float(total_liters),
-            "entries_count": len(logs)
-        }
\ No newline at end of file
+    async def get_fuel_stats(db: AsyncSession, vehicle_id: uuid.UUID) -> FuelStatsRead:
+        """Reads the maintained summary; vehicles without one yet are backfilled on first access."""
+        stats = await FuelRepository.get_stats(db, vehicle_id)
+        if stats is None:
+            stats = await FuelRepository.rebuild_stats(db, vehicle_id)
+            await db.commit()
+        return FuelStatsRead.model_validate(stats)
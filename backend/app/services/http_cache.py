@@ -0,0 +1,66 @@
+import hashlib
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.repositories.resource_version import ResourceVersionRepository
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+CATEGORIES = "finance.categories"
+RULES = "finance.rules"
+VEHICLES = "vehicles"
+WEEK_PLANS = "planning.weeks"
+MEAL_SETTINGS = "settings.meals"
+
+# Last-Modified has one-second precision, a write in the second it names cannot be told apart.
+DATE_PRECISION = timedelta(seconds=1)
+
+def make_etag(user_id: uuid.UUID, resource: str, version: int) -> str:
+    # The user is part of the tag, so a browser shared by two accounts never gets the other's 304.
+    digest = hashlib.sha256(f"{user_id}:{resource}:{version}".encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def _settled(updated_at: Optional[datetime]) -> bool:
+    """Whether the second of `updated_at` is over, so no later write can share its Last-Modified."""
+    return updated_at is not None and updated_at <= datetime.now(timezone.utc) - DATE_PRECISION
+
+def _not_modified_since(if_modified_since: str, updated_at: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return updated_at.replace(microsecond=0) <= since
+
+async def check_not_modified(
+    request: Request, response: Response, db: AsyncSession, user_id: uuid.UUID, resource: str
+) -> Optional[Response]:
+    """
+    Compares the request's validators with the resource's version counter, a single primary key
+    lookup. Returns the 304 to send, or None after putting ETag / Last-Modified on `response`
+    for the full answer. Dates are only used once the resource has been unchanged for a second,
+    until then the ETag alone decides.
+    """
+    version, updated_at = await ResourceVersionRepository.get(db, user_id, resource)
+    headers = {"ETag": make_etag(user_id, resource, version), "Cache-Control": "private, no-cache"}
+    if _settled(updated_at):
+        headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match:
+        fresh = etag_matches(if_none_match, headers["ETag"])
+    else:
+        fresh = bool(if_modified_since and _settled(updated_at) and _not_modified_since(if_modified_since, updated_at))
+
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,182 @@
+import calendar
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.loan import LoanInstallment, LoanSchedule, LoanWhatIf, LoanWhatIfRequest
+from app.db.repositories.loan import LoanRepository
+from app.services.ttl_cache import TTLCache
+
+ZERO = Decimal("0")
+# Longest schedule ever projected (100 years), keeps due dates in range and the loop short.
+MAX_INSTALLMENTS = 1200
+
+def add_months(start: date, months: int, day: int) -> date:
+    """The `day` of the month `months` after `start`, clamped to the length of that month."""
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+def first_due_date(start: date, due_day: int) -> date:
+    """The first `due_day` on or after `start`."""
+    candidate = add_months(start, 0, due_day)
+    return candidate if candidate >= start else add_months(start, 1, due_day)
+
+@dataclass(frozen=True)
+class LoanSnapshot:
+    """The loan terms together with its payment totals, everything the schedule depends on."""
+    id: uuid.UUID
+    name: str
+    total_amount: Decimal
+    installment_amount: Decimal
+    installments_count: int
+    due_day: int
+    start_date: date
+    installments_paid: Decimal
+    prepayments: Decimal
+
+    @property
+    def first_due_date(self) -> date:
+        return first_due_date(self.start_date, self.due_day)
+
+# Schedules per loan, dropped by loan and payment writes.
+loan_schedule_cache = TTLCache(ttl=600)
+
+class LoanService:
+    @staticmethod
+    def build_schedule(
+        loan: LoanSnapshot,
+        today: date,
+        prepayment: Decimal = ZERO,
+        monthly_extra: Decimal = ZERO,
+    ) -> LoanSchedule:
+        """
+        Loans carry no interest rate, so the schedule splits `total_amount` into equal installments
+        with the last one taking the rest. Installment payments settle it from the front, while
+        prepayments (and the optional what-if `prepayment` and `monthly_extra`) shorten it from the back.
+        """
+        planned: List[Decimal] = []
+        left = loan.total_amount
+        installments_count = min(loan.installments_count, MAX_INSTALLMENTS)
+        for number in range(1, installments_count + 1):
+            if left <= 0:
+                break
+            amount = left if number == installments_count else min(loan.installment_amount, left)
+            planned.append(amount)
+            left -= amount
+
+        def due_date(index: int) -> date:
+            return add_months(loan.first_due_date, index, loan.due_day)
+
+        schedule: List[LoanInstallment] = []
+        covered = loan.installments_paid
+        index = 0
+        while index < len(planned) and covered >= planned[index]:
+            schedule.append(LoanInstallment(
+                number=index + 1, due_date=due_date(index), amount=planned[index], paid=planned[index], status="PAID"
+            ))
+            covered -= planned[index]
+            index += 1
+        paid_installments = index
+
+        outstanding = max(loan.total_amount - loan.installments_paid - loan.prepayments - prepayment, ZERO)
+        remaining = outstanding
+        overdue_amount = ZERO
+        projected: List[LoanInstallment] = []
+        while outstanding > 0 and index < len(planned):
+            paid = min(covered, planned[index])
+            amount = min(planned[index] + monthly_extra, outstanding + paid)
+            covered -= paid
+            outstanding -= amount - paid
+
+            due = due_date(index)
+            if due < today:
+                status = "OVERDUE"
+                overdue_amount += amount - paid
+            else:
+                status = "PARTIAL" if paid else "UPCOMING"
+            projected.append(LoanInstallment(number=index + 1, due_date=due, amount=amount, paid=paid, status=status))
+            index += 1
+
+        schedule.extend(projected)
+        return LoanSchedule(
+            loan_id=loan.id,
+            name=loan.name,
+            total_amount=loan.total_amount,
+            installment_amount=loan.installment_amount,
+            total_paid=loan.installments_paid + loan.prepayments,
+            remaining_amount=remaining,
+            paid_installments=paid_installments,
+            remaining_installments=len(projected),
+            installments_saved=max(len(planned) - paid_installments - len(projected), 0),
+            overdue_amount=overdue_amount,
+            next_due_date=projected[0].due_date if projected else None,
+            next_due_amount=projected[0].amount - projected[0].paid if projected else None,
+            payoff_date=schedule[-1].due_date if schedule else None,
+            schedule=schedule,
+        )
+
+    @staticmethod
+    async def _load(db: AsyncSession, user_id: uuid.UUID, loan_ids: Optional[List[uuid.UUID]] = None) -> Dict[uuid.UUID, Tuple[LoanSnapshot, LoanSchedule]]:
+        """Loads the given (or all) loans of the user with their payment totals in one query and caches them."""
+        today = date.today()
+        entries = {}
+        for loan, installments_paid, prepayments in await LoanRepository.get_with_payment_totals(db, user_id, loan_ids):
+            snapshot = LoanSnapshot(
+                id=loan.id,
+                name=loan.name,
+                total_amount=Decimal(loan.total_amount),
+                installment_amount=Decimal(loan.installment_amount),
+                installments_count=loan.installments_count,
+                due_day=loan.due_day,
+                start_date=loan.created_at.date(),
+                installments_paid=installments_paid,
+                prepayments=prepayments,
+            )
+            entries[loan.id] = (snapshot, LoanService.build_schedule(snapshot, today))
+            loan_schedule_cache.set(loan.id, entries[loan.id])
+        return entries
+
+    @staticmethod
+    async def get_schedules(db: AsyncSession, user_id: uuid.UUID) -> List[LoanSchedule]:
+        loan_ids = await LoanRepository.get_ids_by_user(db, user_id)
+        entries = {loan_id: loan_schedule_cache.get(loan_id) for loan_id in loan_ids}
+        missing = [loan_id for loan_id, entry in entries.items() if entry is None]
+        if missing:
+            entries.update(await LoanService._load(db, user_id, missing))
+        return [entries[loan_id][1] for loan_id in loan_ids if entries.get(loan_id)]
+
+    @staticmethod
+    async def _get_entry(db: AsyncSession, user_id: uuid.UUID, loan_id: uuid.UUID) -> Optional[Tuple[LoanSnapshot, LoanSchedule]]:
+        entry = loan_schedule_cache.get(loan_id)
+        # The cached snapshot has no owner, so the ownership check always goes to the database.
+        if entry is not None and await LoanRepository.get_by_id(db, loan_id, user_id):
+            return entry
+        return (await LoanService._load(db, user_id, [loan_id])).get(loan_id)
+
+    @staticmethod
+    async def get_schedule(db: AsyncSession, user_id: uuid.UUID, loan_id: uuid.UUID) -> Optional[LoanSchedule]:
+        entry = await LoanService._get_entry(db, user_id, loan_id)
+        return entry[1] if entry else None
+
+    @staticmethod
+    async def what_if(db: AsyncSession, user_id: uuid.UUID, loan_id: uuid.UUID, scenario: LoanWhatIfRequest) -> Optional[LoanWhatIf]:
+        entry = await LoanService._get_entry(db, user_id, loan_id)
+        if entry is None:
+            return None
+
+        snapshot, baseline = entry
+        projected = LoanService.build_schedule(snapshot, date.today(), scenario.prepayment, scenario.monthly_extra)
+        months_earlier = 0
+        if baseline.payoff_date and projected.payoff_date:
+            months_earlier = (baseline.payoff_date.year - projected.payoff_date.year) * 12 + (
+                baseline.payoff_date.month - projected.payoff_date.month
+            )
+        return LoanWhatIf(
+            baseline=baseline,
+            scenario=projected,
+            installments_saved=baseline.remaining_installments - projected.remaining_installments,
+            months_earlier=months_earlier,
+        )
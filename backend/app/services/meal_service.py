@@ -1,7 +1,146 @@
+import json
 import os
-import re
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.dictionary_cache import dictionary_cache, PROTEINS, BASES, INGREDIENTS
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "db", "scripts", "default_meals.json")
+
+@dataclass(frozen=True)
+class DefaultDictEntry:
+    id: uuid.UUID
+    name: str
+    category: str
+
+@dataclass(frozen=True)
+class DefaultIngredient:
+    name: str
+    category: str
+    unit: str
+
+@dataclass(frozen=True)
+class DefaultRecipeItem:
+    ingredient_name: str
+    base_amount: float
+
+@dataclass(frozen=True)
+class DefaultMeal:
+    name: str
+    description: str
+    id_protein_type: uuid.UUID
+    id_base_type: uuid.UUID
+    is_weekend_dish: bool
+    ingredients: Tuple[DefaultRecipeItem, ...]
+
+@dataclass(frozen=True)
+class DefaultDataset:
+    protein_types: Tuple[DefaultDictEntry, ...]
+    base_types: Tuple[DefaultDictEntry, ...]
+    ingredients: Tuple[DefaultIngredient, ...]
+    meals: Tuple[DefaultMeal, ...]
+
+    def static_params(self) -> Dict[str, Any]:
+        """Column arrays for everything in the starter set that does not depend on the user."""
+        return {
+            "protein_ids": [p.id for p in self.protein_types],
+            "protein_names": [p.name for p in self.protein_types],
+            "protein_categories": [p.category for p in self.protein_types],
+            "base_ids": [b.id for b in self.base_types],
+            "base_names": [b.name for b in self.base_types],
+            "base_categories": [b.category for b in self.base_types],
+            "ingredient_names": [i.name for i in self.ingredients],
+            "ingredient_categories": [i.category for i in self.ingredients],
+            "ingredient_units": [i.unit for i in self.ingredients],
+            "meal_proteins": [m.id_protein_type for m in self.meals],
+            "meal_bases": [m.id_base_type for m in self.meals],
+            "meal_names": [m.name for m in self.meals],
+            "meal_descriptions": [m.description for m in self.meals],
+            "meal_weekend": [m.is_weekend_dish for m in self.meals],
+            "recipe_meal_index": [idx for idx, m in enumerate(self.meals, start=1) for _ in m.ingredients],
+            "recipe_ingredients": [i.ingredient_name for m in self.meals for i in m.ingredients],
+            "recipe_amounts": [float(i.base_amount) for m in self.meals for i in m.ingredients],
+        }
+
+@lru_cache
+def load_default_dataset() -> DefaultDataset:
+    """Reads the starter set once; called from the lifespan so the first signup does not pay for it."""
+    with open(DATASET_PATH, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    def dict_entries(rows):
+        return tuple(DefaultDictEntry(uuid.UUID(r["id"]), r["name"], r["category"]) for r in rows)
+
+    return DefaultDataset(
+        protein_types=dict_entries(raw["protein_types"]),
+        base_types=dict_entries(raw["base_types"]),
+        ingredients=tuple(DefaultIngredient(r["name"], r["category"], r["unit"]) for r in raw["ingredients"]),
+        meals=tuple(
+            DefaultMeal(
+                name=m["name"],
+                description=m["description"],
+                id_protein_type=uuid.UUID(m["id_protein_type"]),
+                id_base_type=uuid.UUID(m["id_base_type"]),
+                is_weekend_dish=m["is_weekend_dish"],
+                ingredients=tuple(DefaultRecipeItem(i["name"], i["base_amount"]) for i in m["ingredients"]),
+            )
+            for m in raw["meals"]
+        ),
+    )
+
+@lru_cache
+def _static_params() -> Dict[str, Any]:
+    return load_default_dataset().static_params()
+
+# Dictionaries are shared between users, so they are inserted with ON CONFLICT DO NOTHING and
+# recipes are resolved by ingredient name against both the freshly inserted and the existing rows.
+SEED_USER_DATA = text("""
+    WITH protein_types AS (
+        INSERT INTO dmt.protein_types (id, name, category)
+        SELECT * FROM unnest(
+            CAST(:protein_ids AS uuid[]), CAST(:protein_names AS varchar[]), CAST(:protein_categories AS varchar[])
+        )
+        ON CONFLICT (name) DO NOTHING
+    ),
+    base_types AS (
+        INSERT INTO dmt.base_types (id, name, category)
+        SELECT * FROM unnest(
+            CAST(:base_ids AS uuid[]), CAST(:base_names AS varchar[]), CAST(:base_categories AS varchar[])
+        )
+        ON CONFLICT (name) DO NOTHING
+    ),
+    new_ingredients AS (
+        INSERT INTO dmt.ingredients (id, name, category, unit)
+        SELECT gen_random_uuid(), t.name, t.category, t.unit
+        FROM unnest(
+            CAST(:ingredient_names AS varchar[]), CAST(:ingredient_categories AS varchar[]), CAST(:ingredient_units AS varchar[])
+        ) AS t(name, category, unit)
+        ON CONFLICT (name) DO NOTHING
+        RETURNING id, name
+    ),
+    all_ingredients AS (
+        SELECT id, name FROM new_ingredients
+        UNION ALL
+        SELECT id, name FROM dmt.ingredients WHERE name = ANY(CAST(:recipe_ingredients AS varchar[]))
+    ),
+    meals AS (
+        INSERT INTO dmt.meals (id, user_id, id_protein_type, id_base_type, name, description, is_weekend_dish)
+        SELECT t.id, CAST(:user_id AS uuid), t.id_protein_type, t.id_base_type, t.name, t.description, t.is_weekend_dish
+        FROM unnest(
+            CAST(:meal_ids AS uuid[]), CAST(:meal_proteins AS uuid[]), CAST(:meal_bases AS uuid[]),
+            CAST(:meal_names AS varchar[]), CAST(:meal_descriptions AS varchar[]), CAST(:meal_weekend AS boolean[])
+        ) AS t(id, id_protein_type, id_base_type, name, description, is_weekend_dish)
+    )
+    INSERT INTO dmt.meal_ingredients (id, id_meal, id_ingredient, base_amount)
+    SELECT gen_random_uuid(), (CAST(:meal_ids AS uuid[]))[r.meal_index], i.id, r.amount
+    FROM unnest(
+        CAST(:recipe_meal_index AS integer[]), CAST(:recipe_ingredients AS varchar[]), CAST(:recipe_amounts AS float8[])
+    ) AS r(meal_index, ingredient_name, amount)
+    JOIN all_ingredients i ON i.name = r.ingredient_name
+""")
 
 async def generate_default_user_data(db: AsyncSession, user_id: str):
     check_query = text("SELECT EXISTS(SELECT 1 FROM dmt.meals WHERE user_id = :user_id)")
@@ -11,28 +150,18 @@ async def generate_default_user_data(db: AsyncSession, user_id: str):
     if already_has_meals:
         return False
 
-    base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    sql_path = os.path.join(base_path, "app", "db", "scripts", "init_meals.sql")
-
-    with open(sql_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    dataset = load_default_dataset()
+    params = {
+        **_static_params(),
+        "user_id": user_id,
+        "meal_ids": [uuid.uuid4() for _ in dataset.meals],
+    }
 
-    content = re.sub(r'--.*', '', content)
-    parts = content.split('DO $$')
-    
     try:
-        if parts[0].strip():
-            dictionary_queries = [q.strip() for q in parts[0].split(';') if q.strip()]
-            for query in dictionary_queries:
-                await db.execute(text(query + ";"))
-
-        if len(parts) > 1:
-            full_do_block = "DO $$" + parts[1].strip()
-            final_block = full_do_block.replace(':user_id', f"'{user_id}'")
-            await db.execute(text(final_block))
-        
+        await db.execute(SEED_USER_DATA, params)
         await db.commit()
+        await dictionary_cache.invalidate(db, PROTEINS, BASES, INGREDIENTS)
         return True
     except Exception as e:
         await db.rollback()
-        raise e
\ No newline at end of file
+        raise e
@@ -0,0 +1,77 @@
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.services.finance_service import FinanceService
+from app.services.loan_service import add_months
+
+class PaymentService:
+    REQUIRED_COLUMNS = {"paid_at", "amount", "type"}
+
+    @staticmethod
+    def parse_csv(content: str, default_loan_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Reads `loan_id,paid_at,amount,type` rows separated by commas or semicolons. The loan_id
+        column may be left out when the whole file belongs to `default_loan_id`.
+        """
+        content = content.strip().lstrip("\ufeff")
+        if not content:
+            return []
+
+        header = content.splitlines()[0]
+        reader = csv.DictReader(io.StringIO(content), delimiter=";" if header.count(";") > header.count(",") else ",")
+        columns = {name.strip().lower() for name in reader.fieldnames or []}
+        missing = PaymentService.REQUIRED_COLUMNS - columns
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+        if "loan_id" not in columns and not default_loan_id:
+            raise ValueError("Missing column loan_id and no loan_id was given")
+
+        rows = []
+        for line_no, raw in enumerate(reader, start=2):
+            row = {key.strip().lower(): (value or "").strip() for key, value in raw.items() if key}
+            if not any(row.values()):
+                continue
+            try:
+                amount = FinanceService.clean_amount(row["amount"])
+            except Exception:
+                raise ValueError(f"Line {line_no}: invalid amount '{row['amount']}'")
+            rows.append({
+                "loan_id": row.get("loan_id") or default_loan_id,
+                "paid_at": row["paid_at"],
+                "amount": str(amount),
+                "type": row["type"].lower(),
+                "line": line_no,
+            })
+        return rows
+
+    @staticmethod
+    def missed_installment_dates(
+        first_due: date,
+        due_day: int,
+        installments_count: int,
+        paid_months: Set[Tuple[int, int]],
+        until: date,
+    ) -> List[date]:
+        """Due dates up to `until` in months without any installment, within the installment count."""
+        remaining = installments_count - len(paid_months)
+        dates = []
+        for index in range(installments_count):
+            due = add_months(first_due, index, due_day)
+            if due > until or len(dates) >= remaining:
+                break
+            if (due.year, due.month) not in paid_months:
+                dates.append(due)
+        return dates
+
+    @staticmethod
+    def dedupe(lines: List[Any]) -> List[Any]:
+        """Drops repeated (loan_id, paid_at, amount, type) lines within one batch, keeping the first."""
+        seen, unique = set(), []
+        for line in lines:
+            key = (line.loan_id, line.paid_at, Decimal(line.amount), line.type)
+            if key not in seen:
+                seen.add(key)
+                unique.append(line)
+        return unique
@@ -0,0 +1,22 @@
+import asyncio
+import logging
+from app.db.deps import get_db
+from app.db.repositories.deadline import DeadlineRepository
+
+logger = logging.getLogger("domator.reminders")
+
+async def refresh_service_reminders() -> bool:
+    async for db in get_db():
+        refreshed = await DeadlineRepository.refresh_service_reminders(db)
+        break
+    return refreshed
+
+async def periodic_reminder_refresh(interval: int = 900):
+    while True:
+        try:
+            # Every worker runs this loop, the ones that find a refresh in progress skip their turn.
+            if await refresh_service_reminders():
+                logger.info("The service reminder queue has been refreshed.")
+        except Exception:
+            logger.exception("Error during reminder refresh")
+        await asyncio.sleep(interval)
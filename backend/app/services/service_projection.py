@@ -0,0 +1,99 @@
+import uuid
+from typing import Dict, List
+from sqlalchemy import text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.reminder import ServiceDueRead
+from app.db.models.vehicle import Vehicle
+from app.services.ttl_cache import TTLCache
+
+# For every recurring item type the latest service sets the next due date (interval_months) and
+# mileage (interval_km). The mileage is turned into a date with the km/day rate of the last year
+# of fuel logs; whichever of the two comes first is the projected due date.
+PROJECT_SERVICES_DUE = text("""
+    WITH selected AS (
+        SELECT id, current_mileage FROM dmt.vehicles WHERE id = ANY(CAST(:vehicle_ids AS uuid[]))
+    ),
+    rates AS (
+        SELECT
+            f.vehicle_id,
+            max(f.mileage) AS last_mileage,
+            max(f.date) AS last_date,
+            CASE WHEN max(f.date) > min(f.date)
+                THEN (max(f.mileage) - min(f.mileage)) / (extract(epoch FROM max(f.date) - min(f.date)) / 86400.0)
+            END AS km_per_day
+        FROM dmt.fuel_logs f
+        JOIN selected v ON v.id = f.vehicle_id
+        WHERE f.date >= now() - interval '365 days'
+        GROUP BY f.vehicle_id
+    ),
+    latest AS (
+        SELECT DISTINCT ON (e.vehicle_id, i.type)
+            e.vehicle_id, i.id AS service_item_id, i.type, i.description,
+            e.service_date, e.mileage_at_service, i.interval_km, i.interval_months
+        FROM dmt.service_items i
+        JOIN dmt.service_events e ON e.id = i.service_event_id
+        JOIN selected v ON v.id = e.vehicle_id
+        WHERE i.is_recurring AND (i.interval_km IS NOT NULL OR i.interval_months IS NOT NULL)
+        ORDER BY e.vehicle_id, i.type, e.service_date DESC, e.mileage_at_service DESC
+    ),
+    projected AS (
+        SELECT
+            l.vehicle_id, l.service_item_id, l.type, l.description,
+            l.service_date AS last_service_date,
+            l.mileage_at_service AS last_service_mileage,
+            l.interval_km, l.interval_months,
+            greatest(v.current_mileage, r.last_mileage) AS current_mileage,
+            CAST(r.km_per_day AS float8) AS km_per_day,
+            l.mileage_at_service + l.interval_km AS due_mileage,
+            l.service_date + make_interval(months => l.interval_months) AS due_date,
+            CASE WHEN l.interval_km IS NOT NULL AND r.km_per_day > 0 THEN
+                greatest(r.last_date, l.service_date) + make_interval(
+                    secs => (l.mileage_at_service + l.interval_km - greatest(v.current_mileage, r.last_mileage))
+                        / r.km_per_day * 86400
+                )
+            END AS projected_mileage_date
+        FROM latest l
+        JOIN selected v ON v.id = l.vehicle_id
+        LEFT JOIN rates r ON r.vehicle_id = l.vehicle_id
+    )
+    SELECT *, least(due_date, projected_mileage_date) AS projected_due_date
+    FROM projected
+""")
+
+# Dropped by service, fuel and vehicle writes.
+service_projection_cache = TTLCache(ttl=600)
+
+class ServiceProjectionService:
+    @staticmethod
+    async def project(db: AsyncSession, vehicle_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[ServiceDueRead]]:
+        """Projects all given vehicles in one statement."""
+        projections: Dict[uuid.UUID, List[ServiceDueRead]] = {vehicle_id: [] for vehicle_id in vehicle_ids}
+        if not vehicle_ids:
+            return projections
+
+        result = await db.execute(PROJECT_SERVICES_DUE, {"vehicle_ids": vehicle_ids})
+        for row in result.mappings():
+            projections[row["vehicle_id"]].append(ServiceDueRead.model_validate(dict(row)))
+        return projections
+
+    @staticmethod
+    async def get_due(db: AsyncSession, user_id: uuid.UUID, vehicle_id: uuid.UUID | None = None) -> List[ServiceDueRead]:
+        query = select(Vehicle.id).where(Vehicle.user_id == user_id, Vehicle.is_active)
+        if vehicle_id:
+            query = query.where(Vehicle.id == vehicle_id)
+        vehicle_ids = list((await db.execute(query)).scalars().all())
+
+        due: List[ServiceDueRead] = []
+        missing = []
+        for vid in vehicle_ids:
+            cached = service_projection_cache.get(vid)
+            if cached is None:
+                missing.append(vid)
+            else:
+                due.extend(cached)
+
+        for vid, projections in (await ServiceProjectionService.project(db, missing)).items():
+            service_projection_cache.set(vid, projections)
+            due.extend(projections)
+
+        return sorted(due, key=lambda d: (d.projected_due_date is None, d.projected_due_date, d.type))
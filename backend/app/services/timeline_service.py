@@ -0,0 +1,45 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+from typing import Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.timeline import TimelineBucket, TimelineMonth, TimelineRead
+from app.db.repositories.timeline import TimelineRepository
+
+class TimelineService:
+    @staticmethod
+    async def ensure_fresh(db: AsyncSession, user_id: uuid.UUID) -> None:
+        """Writes on the timeline sources queue the months they touch; only those are recomputed."""
+        if await TimelineRepository.has_stale_months(db, user_id):
+            await TimelineRepository.rebuild_stale(db, user_id)
+            await db.commit()
+
+    @staticmethod
+    async def get_timeline(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> TimelineRead:
+        await TimelineService.ensure_fresh(db, user_id)
+        rows = await TimelineRepository.get_months(db, user_id, date_from, date_to, sources)
+
+        months, cumulative = [], Decimal("0")
+        for month, month_rows in groupby(rows, key=lambda row: row.month):
+            buckets = [
+                TimelineBucket(source=r.source, category=r.category, income=r.income, expense=r.expense, entries=r.entries)
+                for r in month_rows
+            ]
+            income = sum((b.income for b in buckets), Decimal("0"))
+            expense = sum((b.expense for b in buckets), Decimal("0"))
+            cumulative += income - expense
+            months.append(TimelineMonth(
+                month=month, income=income, expense=expense, net=income - expense,
+                cumulative_net=cumulative, buckets=buckets,
+            ))
+
+        income = sum((m.income for m in months), Decimal("0"))
+        expense = sum((m.expense for m in months), Decimal("0"))
+        return TimelineRead(income=income, expense=expense, net=income - expense, months=months)
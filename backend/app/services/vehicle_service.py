@@ -0,0 +1,54 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.db.models.vehicle import Vehicle, VehicleDashboard, VehicleOverview, VehicleRead
+from app.db.repositories.insurance import InsuranceRepository
+from app.db.repositories.inspection import InspectionRepository
+from app.db.repositories.service import ServiceRepository
+from app.db.repositories.vehicle import VehicleRepository
+from app.services.fuel_service import FuelService
+
+class VehicleService:
+    @staticmethod
+    async def _with_session(session_factory: async_sessionmaker, query, *args):
+        async with session_factory() as session:
+            return await query(session, *args)
+
+    @staticmethod
+    async def get_dashboard(
+        session_factory: async_sessionmaker,
+        vehicle: Vehicle,
+        recent_services: int = 5,
+    ) -> VehicleDashboard:
+        """
+        Everything the vehicle page needs in one payload. Ownership is checked once by the caller;
+        the independent reads then run concurrently, each on its own pooled connection.
+        """
+        run = VehicleService._with_session
+        fuel_stats, insurance, inspection, services = await asyncio.gather(
+            run(session_factory, FuelService.get_fuel_stats, vehicle.id),
+            run(session_factory, InsuranceRepository.get_current, vehicle.id, datetime.now(timezone.utc)),
+            run(session_factory, InspectionRepository.get_latest, vehicle.id),
+            run(session_factory, ServiceRepository.get_recent_events, vehicle.id, recent_services),
+        )
+
+        return VehicleDashboard(
+            vehicle=vehicle,
+            fuel_stats=fuel_stats,
+            insurance=insurance,
+            inspection=inspection,
+            recent_services=services,
+        )
+
+    @staticmethod
+    async def get_overview(db: AsyncSession, user_id: uuid.UUID) -> list[VehicleOverview]:
+        year_start = datetime(datetime.now(timezone.utc).year, 1, 1, tzinfo=timezone.utc)
+        rows = await VehicleRepository.get_overview(db, user_id, year_start)
+        return [
+            VehicleOverview(
+                **VehicleRead.model_validate(row.Vehicle).model_dump(),
+                **{key: value for key, value in row._mapping.items() if key != "Vehicle"},
+            )
+            for row in rows
+        ]
@@ -0,0 +1,310 @@
+"""
+Load test for the API hot paths.
+
+Seeds a synthetic dataset (see benchmarks.seed) into the database configured by the usual
+POSTGRES_* settings, then fires each scenario with a fixed number of concurrent clients and
+reports p50/p95/p99 latency and requests per second. Point it at a scratch database that has
+been migrated with `alembic upgrade head`; it never deletes anything, so re-runs reuse the data.
+
+By default requests go to the app in-process through ASGITransport, which measures the app
+without the network. With --base-url they go to a running server instead, which must use the
+same database.
+
+Baselines are plain JSON. --save-baseline writes the results to the baseline file, and a run
+with --compare fails (exit code 1) when a scenario's median latency grew or its throughput dropped
+by more than --tolerance, so a regression shows up as a red check in the PR. The tail percentiles
+are reported but not gated on, 200 requests are too few for a stable p95 on a shared runner.
+
+Usage:
+    python -m benchmarks.bench_api [--users 10] [--transactions 2000] [--requests 200] [--concurrency 10]
+    python -m benchmarks.bench_api --scenarios login,current_user --compare
+    python -m benchmarks.bench_api --save-baseline
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.db.session import AsyncSessionLocal, engine
+from benchmarks.datagen import bank_csv
+from benchmarks.seed import BENCHMARK_MONDAY, PASSWORD, SeedConfig, SeededUser, seed
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "api.json")
+IMPORT_ROWS = 100
+# Seeds the generated exports, so confirmed rows from an earlier run never collide with this one.
+RUN_ID = uuid.uuid4().hex[:8]
+
+@dataclass
+class Worker:
+    client: httpx.AsyncClient
+    user: SeededUser
+    index: int
+    access_token: str = ""
+    refresh_token: str = ""
+    calls: int = 0
+    import_tokens: List[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    async def login(self) -> httpx.Response:
+        res = await self.client.post("/auth/login", json={"identifier": self.user.login, "password": PASSWORD})
+        res.raise_for_status()
+        data = res.json()
+        self.access_token, self.refresh_token = data["access_token"], data["refresh_token"]
+        return res
+
+async def scenario_login(worker: Worker) -> httpx.Response:
+    return await worker.login()
+
+async def scenario_refresh(worker: Worker) -> httpx.Response:
+    # Refresh tokens rotate, so every call has to present the one returned by the previous call.
+    res = await worker.client.post("/auth/refresh", json={"refresh_token": worker.refresh_token})
+    if res.status_code == 200:
+        data = res.json()
+        worker.access_token, worker.refresh_token = data["access_token"], data["refresh_token"]
+    return res
+
+async def scenario_current_user(worker: Worker) -> httpx.Response:
+    return await worker.client.get("/auth/me", headers=worker.headers)
+
+def _import_csv(worker: Worker) -> str:
+    # Card payment titles carry a random reference, so every call imports rows with new hashes.
+    rng = random.Random(f"{RUN_ID}:{worker.index}:{worker.calls}")
+    return bank_csv("MBANK", rng, IMPORT_ROWS, BENCHMARK_MONDAY, BENCHMARK_MONDAY + timedelta(days=28))
+
+async def scenario_import_preview(worker: Worker) -> httpx.Response:
+    files = {"file": ("export.csv", _import_csv(worker).encode("utf-8"), "text/csv")}
+    res = await worker.client.post(f"/finance/import/preview/{worker.user.import_account_id}", files=files, headers=worker.headers)
+    if res.status_code == 200:
+        worker.import_tokens.append(res.json()["token"])
+    return res
+
+async def scenario_import_confirm(worker: Worker) -> httpx.Response:
+    # Confirms the sessions staged by the preview scenario. A worker that has none left (or a run
+    # without import_preview) stages one first, and then the measured call includes the upload.
+    if not worker.import_tokens:
+        res = await scenario_import_preview(worker)
+        if res.status_code != 200:
+            return res
+    token = worker.import_tokens.pop()
+    return await worker.client.post(f"/finance/import/sessions/{token}/confirm", headers=worker.headers)
+
+async def scenario_stats_monthly(worker: Worker) -> httpx.Response:
+    month = worker.calls % 12 + 1
+    params = {"month": month, "year": BENCHMARK_MONDAY.year - 1}
+    return await worker.client.get(f"/finance/stats/monthly/{worker.user.account_id}", params=params, headers=worker.headers)
+
+async def scenario_stats_yearly(worker: Worker) -> httpx.Response:
+    params = {"year": BENCHMARK_MONDAY.year - 1}
+    return await worker.client.get(f"/finance/stats/yearly/{worker.user.account_id}", params=params, headers=worker.headers)
+
+async def scenario_shopping_list(worker: Worker) -> httpx.Response:
+    return await worker.client.get("/analysis/shopping-list", params={"start_date": BENCHMARK_MONDAY.isoformat()}, headers=worker.headers)
+
+async def scenario_proposal(worker: Worker) -> httpx.Response:
+    monday = BENCHMARK_MONDAY + timedelta(weeks=1)
+    return await worker.client.get(f"/planning/generate-proposal/{monday.isoformat()}", headers=worker.headers)
+
+async def scenario_fuel_consumption(worker: Worker) -> httpx.Response:
+    return await worker.client.get(f"/vehicles/{worker.user.vehicle_id}/fuel/consumption", headers=worker.headers)
+
+SCENARIOS: Dict[str, Callable[[Worker], Awaitable[httpx.Response]]] = {
+    "login": scenario_login,
+    "refresh": scenario_refresh,
+    "current_user": scenario_current_user,
+    "import_preview": scenario_import_preview,
+    "import_confirm": scenario_import_confirm,
+    "stats_monthly": scenario_stats_monthly,
+    "stats_yearly": scenario_stats_yearly,
+    "shopping_list": scenario_shopping_list,
+    "proposal": scenario_proposal,
+    "fuel_consumption": scenario_fuel_consumption,
+}
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+async def run_scenario(name: str, workers: List[Worker], requests: int) -> ScenarioResult:
+    scenario = SCENARIOS[name]
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def loop(worker: Worker):
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            res = await scenario(worker)
+            latencies.append(time.perf_counter() - start)
+            worker.calls += 1
+            if res.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(worker) for worker in workers))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return ScenarioResult(
+        requests=len(latencies),
+        errors=errors,
+        rps=round(len(latencies) / wall, 1),
+        p50_ms=round(percentile(latencies, 50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 99) * 1000, 2),
+        max_ms=round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        latencies=latencies,
+    )
+
+def compare(results: Dict[str, ScenarioResult], baseline: dict, tolerance: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        if result.p50_ms > base["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {base['p50_ms']} -> {result.p50_ms} ms")
+        if result.rps < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['rps']} -> {result.rps} req/s")
+    return regressions
+
+def make_client(base_url: Optional[str]) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=60)
+    from app.main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+async def run(args) -> Dict[str, ScenarioResult]:
+    config = SeedConfig(
+        users=args.users,
+        transactions_per_user=args.transactions,
+        meals_per_user=args.meals,
+        fuel_logs_per_user=args.fuel_logs,
+        weeks_per_user=args.weeks,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        users = await seed(db, config)
+    print(f"Seeded {len(users)} users in {time.perf_counter() - started:.1f} s\n")
+
+    results: Dict[str, ScenarioResult] = {}
+    async with make_client(args.base_url) as client:
+        workers = [Worker(client, users[i % len(users)], i) for i in range(args.concurrency)]
+        for worker in workers:
+            await worker.login()
+
+        print(f"{'scenario':<18} {'req':>6} {'err':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for name in args.scenarios:
+            # Warm-up requests fill the connection pool and the caches and are not measured.
+            await run_scenario(name, workers, args.warmup)
+            result = await run_scenario(name, workers, args.requests)
+            results[name] = result
+            print(f"{name:<18} {result.requests:>6} {result.errors:>5} {result.rps:>9} "
+                  f"{result.p50_ms:>9} {result.p95_ms:>9} {result.p99_ms:>9} {result.max_ms:>9}")
+
+    await engine.dispose()
+    return results
+
+def to_report(args, results: Dict[str, ScenarioResult]) -> dict:
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": f"{platform.system()} {platform.machine()}, Python {platform.python_version()}",
+        "target": args.base_url or "in-process",
+        "config": {
+            "users": args.users, "transactions": args.transactions, "meals": args.meals, "fuel_logs": args.fuel_logs,
+            "weeks": args.weeks, "seed": args.seed, "requests": args.requests, "concurrency": args.concurrency, "warmup": args.warmup,
+        },
+        "scenarios": {
+            name: {key: value for key, value in asdict(result).items() if key != "latencies"}
+            for name, result in results.items()
+        },
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+                        help=f"Comma separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--transactions", type=int, default=2000, help="Transactions per user")
+    parser.add_argument("--meals", type=int, default=40, help="Meals per user")
+    parser.add_argument("--fuel-logs", type=int, default=200, help="Fuel logs per user")
+    parser.add_argument("--weeks", type=int, default=12, help="Planned weeks per user")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests before each scenario")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail when the results regress against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.4, help="Allowed relative regression (default 40%%)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    return args
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+    report = to_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["config"] != report["config"]:
+            print("\nWarning: the baseline was recorded with a different configuration.")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against the baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
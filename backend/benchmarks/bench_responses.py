@@ -0,0 +1,101 @@
+"""
+Serialization and compression benchmark for the heaviest list payloads.
+
+Compares, on synthetic rows shaped like the real ones:
+- the response_model path (from_attributes validation + dump) with the trusted fast path,
+- jsonable_encoder + json.dumps (FastAPI's path for plain dicts) with DefaultJSONResponse,
+- raw, GZip and Brotli body sizes.
+
+Usage: python -m benchmarks.bench_responses [--rows 200] [--repeat 200]
+"""
+import argparse
+import gzip
+import json
+import timeit
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import DefaultJSONResponse, _list_adapter, orjson, trusted_response
+from app.db.models.finance import TransactionRead
+
+def make_transactions(count: int):
+    categories = [SimpleNamespace(id=uuid.uuid4(), name=name) for name in ("Paliwo", "Zakupy", "Rachunki", "Wynagrodzenie")]
+    start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        category = categories[i % len(categories)] if i % 5 else None
+        rows.append(SimpleNamespace(
+            id=uuid.uuid4(),
+            date=start + timedelta(hours=i * 3),
+            amount=Decimal(f"-{(i * 37) % 900 + 10}.{i % 100:02d}"),
+            title=f"Płatność kartą {i:04d} BIEDRONKA KRAKÓW UL. DŁUGA",
+            category_id=category.id if category else None,
+            category=category,
+        ))
+    return rows
+
+def make_calendar(count: int):
+    start = date(2025, 3, 1)
+    return {
+        "year": 2025,
+        "month": 3,
+        "days": [
+            {
+                "date": start + timedelta(days=i % 31),
+                "meal_id": uuid.uuid4(),
+                "meal_name": f"Kurczak w curry z ryżem {i}",
+                "is_two_days": bool(i % 2),
+                "is_out_of_home": False,
+                "protein_type": "Kurczak",
+                "base_type": "Ryż",
+                "note": "",
+            }
+            for i in range(count)
+        ],
+    }
+
+def measure(label: str, func, repeat: int) -> float:
+    seconds = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+    print(f"  {label:<44} {seconds * 1e6:10.1f} µs")
+    return seconds
+
+def sizes(label: str, body: bytes):
+    print(
+        f"  {label:<44} raw {len(body):>8} B   gzip {len(gzip.compress(body, compresslevel=9)):>7} B"
+        f"   br {len(brotli.compress(body)):>7} B"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if orjson else 'no'}, rows: {args.rows}\n")
+
+    transactions = make_transactions(args.rows)
+    adapter = _list_adapter(TransactionRead)
+    print("GET /finance/transactions/{account_id}")
+    validated = measure("response_model (validate + dump_json)",
+                        lambda: adapter.dump_json(adapter.validate_python(transactions, from_attributes=True)), args.repeat)
+    trusted = measure("trusted_response",
+                      lambda: trusted_response(TransactionRead, transactions).body, args.repeat)
+    print(f"  {'saved':<44} {(1 - trusted / validated) * 100:9.0f} %")
+    sizes("body", trusted_response(TransactionRead, transactions).body)
+
+    calendar = make_calendar(args.rows)
+    print("\nGET /planning/month/{year}/{month} (plain dicts)")
+    encoded = measure("jsonable_encoder + json.dumps",
+                      lambda: json.dumps(jsonable_encoder(calendar), ensure_ascii=False, separators=(",", ":")).encode(), args.repeat)
+    fast = measure("DefaultJSONResponse.render",
+                   lambda: DefaultJSONResponse(content=calendar).body, args.repeat)
+    print(f"  {'saved':<44} {(1 - fast / encoded) * 100:9.0f} %")
+    sizes("body", DefaultJSONResponse(content=calendar).body)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Per-call overhead of the hot repository lookups.
+
+Python side: the work SQLAlchemy repeats on every execute before the compiled-statement cache
+is hit, i.e. building the statement and computing its cache key. The old `select()` builders
+are compared with the lambda statements the repositories use now.
+
+Database side (unless --no-db): sequential calls of the repository methods against the
+configured database, with asyncpg's prepared-statement cache disabled and enabled.
+
+Usage: python -m benchmarks.bench_statements [--repeat 5000] [--calls 2000] [--no-db]
+"""
+import argparse
+import asyncio
+import time
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import lambda_stmt, or_, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.db.models.finance import Account
+from app.db.models.refresh_token import RefreshToken
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.db.repositories.finance import FinanceRepository
+from app.db.repositories.refresh_token import RefreshTokenRepository
+from app.db.repositories.user import UserRepository
+from app.db.repositories.vehicle import VehicleRepository
+
+def _vehicle_select(vehicle_id, user_id):
+    return select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == user_id)
+
+def _vehicle_lambda(vehicle_id, user_id):
+    return lambda_stmt(lambda: select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == user_id))
+
+def _account_select(account_id, user_id):
+    return select(Account).where(Account.id == account_id, Account.user_id == user_id)
+
+def _account_lambda(account_id, user_id):
+    return lambda_stmt(lambda: select(Account.id).where(Account.id == account_id, Account.user_id == user_id))
+
+def _user_select(identifier):
+    return select(User).where(or_(User.email == identifier, User.login == identifier))
+
+def _user_lambda(identifier):
+    return lambda_stmt(lambda: select(User).where(or_(User.email == identifier, User.login == identifier)))
+
+def _token_select(token_hash):
+    return select(RefreshToken).where(
+        RefreshToken.token_hash == token_hash,
+        RefreshToken.revoked_at.is_(None),
+        RefreshToken.expires_at > datetime.now(UTC),
+    )
+
+def _token_lambda(token_hash):
+    now = datetime.now(UTC)
+    return lambda_stmt(lambda: select(RefreshToken).where(
+        RefreshToken.token_hash == token_hash,
+        RefreshToken.revoked_at.is_(None),
+        RefreshToken.expires_at > now,
+    ))
+
+STATEMENTS = {
+    "VehicleRepository.get_by_id": (_vehicle_select, _vehicle_lambda, 2),
+    "FinanceRepository.is_account_owner": (_account_select, _account_lambda, 2),
+    "UserRepository.get_by_email_or_login": (_user_select, _user_lambda, 1),
+    "RefreshTokenRepository.get_active": (_token_select, _token_lambda, 1),
+}
+
+def _args(count: int):
+    return [uuid.uuid4() for _ in range(count)] if count == 2 else [uuid.uuid4().hex]
+
+def measure(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=repeat, repeat=3)) / repeat * 1e6
+
+def python_overhead(repeat: int):
+    print(f"Statement build + cache key, µs per call (best of 3 x {repeat})")
+    print(f"  {'':<40} {'select()':>10} {'lambda':>10}")
+    for label, (build_select, build_lambda, arity) in STATEMENTS.items():
+        # Fresh parameters on every call, as in a real request.
+        before = measure(lambda: build_select(*_args(arity))._generate_cache_key(), repeat)
+        after = measure(lambda: build_lambda(*_args(arity))._generate_cache_key(), repeat)
+        print(f"  {label:<40} {before:10.1f} {after:10.1f}")
+
+async def database_round_trips(calls: int, cache_size: int) -> dict:
+    engine = create_async_engine(
+        get_settings().database_url, pool_size=1,
+        connect_args={"prepared_statement_cache_size": cache_size},
+    )
+    lookups = {
+        "VehicleRepository.get_by_id": lambda db: VehicleRepository.get_by_id(db, uuid.uuid4(), uuid.uuid4()),
+        "FinanceRepository.is_account_owner": lambda db: FinanceRepository.is_account_owner(db, uuid.uuid4(), uuid.uuid4()),
+        "UserRepository.get_by_email_or_login": lambda db: UserRepository.get_by_email_or_login(db, uuid.uuid4().hex),
+        "RefreshTokenRepository.get_active": lambda db: RefreshTokenRepository.get_active(db, uuid.uuid4().hex),
+    }
+    timings = {}
+    try:
+        async with async_sessionmaker(engine)() as db:
+            for label, lookup in lookups.items():
+                for _ in range(50):
+                    await lookup(db)
+                started = time.perf_counter()
+                for _ in range(calls):
+                    await lookup(db)
+                timings[label] = (time.perf_counter() - started) / calls * 1e6
+    finally:
+        await engine.dispose()
+    return timings
+
+async def database_overhead(calls: int):
+    cache_size = get_settings().db_statement_cache_size
+    without = await database_round_trips(calls, 0)
+    with_cache = await database_round_trips(calls, cache_size)
+    print(f"\nRepository call against the database, µs per call ({calls} sequential calls)")
+    print(f"  {'':<40} {'no cache':>10} {f'cache={cache_size}':>10}")
+    for label in without:
+        print(f"  {label:<40} {without[label]:10.1f} {with_cache[label]:10.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5000)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--no-db", action="store_true", help="only measure the Python side")
+    args = parser.parse_args()
+
+    python_overhead(args.repeat)
+    if not args.no_db:
+        asyncio.run(database_overhead(args.calls))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,570 @@
+"""
+Synthetic data generator for scale testing.
+
+The `db` command bulk-loads users with bank accounts and transactions, vehicles with fuel logs,
+insurance, inspections and service history, loans with their payments, meals with recipes
+and meal calendars. Rows are streamed with COPY, and the derived tables (vehicle_fuel_stats,
+loan_payment_totals, timeline_monthly) are rebuilt afterwards, so the app sees the data exactly
+as if it had been entered through the API.
+
+The `csv` command writes bank exports in the mBank and Santander layouts that
+FinanceService.parse_csv reads, for stress-testing imports end to end.
+
+Everything is derived from --seed. Every user has their own random stream, so adding users
+to a configuration does not change the ones that were already generated. Users that already
+exist for a seed are skipped, which makes `db` safe to re-run with a larger --users.
+
+Usage:
+    python -m benchmarks.datagen db --users 1000 --transactions 2000 --years 5 --distribution pareto
+    python -m benchmarks.datagen csv --bank mbank --rows 100000 --output mbank.csv
+"""
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import hash_password
+from app.db.models.finance import Account, Category, ImportRule, Transaction
+from app.db.models.fuel import FuelLog
+from app.db.models.inspection import TechnicalInspection
+from app.db.models.insurance import InsurancePolicy
+from app.db.models.loan import Loan
+from app.db.models.meal import BaseType, Meal, ProteinType
+from app.db.models.meal_ingredients import Ingredient, MealIngredient
+from app.db.models.meal_planner import WeekMeal, WeekPlan
+from app.db.models.payment import LoanPaymentTotals, Payment, PaymentType
+from app.db.models.service_event import ServiceEvent
+from app.db.models.service_item import ServiceItem
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.db.repositories.fuel import FuelRepository
+from app.db.repositories.timeline import TimelineRepository
+from app.services.finance_service import FinanceService
+from app.services.loan_service import add_months
+from app.services.meal_service import load_default_dataset
+
+PASSWORD = "datagen-password"
+CENT = Decimal("0.01")
+
+CATEGORIES = ("Zakupy", "Paliwo", "Rachunki", "Restauracje", "Transport", "Zdrowie", "Wynagrodzenie")
+# (merchant, category, typical amount in PLN); card payments dominate a real history.
+MERCHANTS = (
+    ("BIEDRONKA", "Zakupy", 80), ("LIDL", "Zakupy", 90), ("KAUFLAND", "Zakupy", 140), ("ZABKA", "Zakupy", 25),
+    ("ROSSMANN", "Zakupy", 60), ("ORLEN", "Paliwo", 250), ("BP", "Paliwo", 230), ("SHELL", "Paliwo", 240),
+    ("PGE OBROT", "Rachunki", 220), ("ORANGE POLSKA", "Rachunki", 90), ("PGNIG", "Rachunki", 180),
+    ("MCDONALDS", "Restauracje", 45), ("PYSZNE.PL", "Restauracje", 70), ("KFC", "Restauracje", 50),
+    ("JAKDOJADE", "Transport", 15), ("UBER", "Transport", 35), ("APTEKA DOZ", "Zdrowie", 55),
+    ("ALLEGRO", None, 150), ("AMAZON", None, 120), ("IKEA", None, 400),
+)
+CITIES = ("KRAKOW", "WARSZAWA", "GDANSK", "POZNAN", "WROCLAW", "LODZ", "KATOWICE")
+NAMES = ("JAN KOWALSKI", "ANNA NOWAK", "PIOTR WISNIEWSKI", "KATARZYNA WOJCIK", "TOMASZ KAMINSKI")
+VEHICLES = (("Skoda", "Octavia", "Diesel"), ("Toyota", "Corolla", "Hybrid"), ("Volkswagen", "Golf", "Petrol"),
+            ("Kia", "Ceed", "Petrol"), ("Dacia", "Duster", "LPG"))
+INSURERS = ("PZU", "Warta", "Allianz", "Link4", "Generali")
+SERVICE_ITEMS = (
+    ("OIL", "Wymiana oleju i filtra", 450, 15000, 12),
+    ("BRAKES", "Klocki hamulcowe", 600, 40000, None),
+    ("TIRES", "Wymiana opon", 200, None, 6),
+    ("AIR_FILTER", "Filtr powietrza", 120, 30000, 24),
+    ("INSPECTION", "Przegląd okresowy", 350, None, None),
+)
+
+# --- distributions ---
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    users: int = 100
+    seed: int = 1
+    end_date: date = date(2025, 12, 31)
+    years: int = 3
+    transactions_per_user: int = 1000
+    vehicles_per_user: float = 1.0
+    refuel_every_days: float = 9.0
+    meals_per_user: int = 60
+    ingredients_per_meal: Tuple[int, int] = (3, 8)
+    weeks_per_user: Optional[int] = None
+    loans_per_user: float = 1.0
+    # uniform: every user gets the mean volume; pareto: a few heavy users and a long tail of light ones.
+    distribution: str = "uniform"
+    pareto_alpha: float = 1.5
+
+    @property
+    def start_date(self) -> date:
+        return self.end_date - timedelta(days=365 * self.years)
+
+    @property
+    def login_prefix(self) -> str:
+        return f"gen{self.seed}_"
+
+def volume_weight(rng: random.Random, config: GeneratorConfig) -> float:
+    """Per-user multiplier of the configured means; averages to 1 over many users."""
+    if config.distribution == "pareto":
+        mean = config.pareto_alpha / (config.pareto_alpha - 1)
+        return min(rng.paretovariate(config.pareto_alpha) / mean, 50.0)
+    return 1.0
+
+def scaled(rng: random.Random, mean: float, weight: float) -> int:
+    """Rounds stochastically, so a mean of 0.3 vehicles gives about 30% of users one vehicle."""
+    value = mean * weight
+    return int(value) + (1 if rng.random() < value - int(value) else 0)
+
+def make_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+def money(value: float) -> Decimal:
+    return Decimal(str(max(value, 0.01))).quantize(CENT)
+
+def random_datetime(rng: random.Random, start: date, end: date) -> datetime:
+    days = (end - start).days
+    day = start + timedelta(days=rng.randrange(max(days, 1)))
+    return datetime.combine(day, dt_time(rng.randrange(6, 23), rng.randrange(60)), tzinfo=timezone.utc)
+
+# --- bank statements ---
+
+class StatementRow(NamedTuple):
+    date: date
+    description: str
+    title: str
+    counterparty: str
+    amount: Decimal
+
+def statement_rows(rng: random.Random, count: int, start: date, end: date) -> List[StatementRow]:
+    """Card payments, a monthly salary and the odd transfer, in date order."""
+    days = max((end - start).days, 1)
+    rows = []
+    for _ in range(count):
+        day = start + timedelta(days=rng.randrange(days))
+        kind = rng.random()
+        if kind < 0.04:
+            rows.append(StatementRow(day, "PRZELEW PRZYCHODZĄCY", "WYNAGRODZENIE ZA " + day.strftime("%m/%Y"),
+                                     "PRACODAWCA SP. Z O.O.", money(rng.gauss(7500, 1500))))
+        elif kind < 0.10:
+            rows.append(StatementRow(day, "PRZELEW WYCHODZĄCY", f"PRZELEW ŚRODKÓW {rng.randrange(10**6):06d}",
+                                     rng.choice(NAMES), -money(rng.lognormvariate(math.log(300), 0.8))))
+        else:
+            merchant, _, typical = rng.choice(MERCHANTS)
+            card = f"{rng.randrange(10**4):04d}"
+            title = f"{merchant} {rng.choice(CITIES)} KARTA *{card} REF {rng.getrandbits(40):010x}"
+            rows.append(StatementRow(day, "ZAKUP PRZY UŻYCIU KARTY", title, "",
+                                     -money(rng.lognormvariate(math.log(typical), 0.5))))
+    rows.sort(key=lambda row: row.date)
+    return rows
+
+def pl_amount(value: Decimal) -> str:
+    """Polish bank notation: space as thousands separator, comma as decimal point."""
+    sign = "-" if value < 0 else ""
+    whole, _, cents = f"{abs(value):.2f}".partition(".")
+    groups = []
+    while whole:
+        groups.insert(0, whole[-3:])
+        whole = whole[:-3]
+    return f"{sign}{' '.join(groups)},{cents}"
+
+def account_number(rng: random.Random) -> str:
+    digits = f"{rng.randrange(10**26):026d}"
+    return " ".join([digits[:2]] + [digits[i:i + 4] for i in range(2, 26, 4)])
+
+def render_mbank(rng: random.Random, rows: Sequence[StatementRow], opening_balance: Decimal = Decimal("5000")) -> str:
+    """mBank 'Elektroniczne zestawienie operacji': preamble, operations newest first, closing balance."""
+    start, end = (rows[0].date, rows[-1].date) if rows else (date.today(), date.today())
+    income = sum((r.amount for r in rows if r.amount > 0), Decimal(0))
+    expense = sum((r.amount for r in rows if r.amount < 0), Decimal(0))
+    lines = [
+        "mBank S.A. Bankowość Detaliczna;", "Skrytka Pocztowa 2108;", "90-959 Łódź 2;", "www.mBank.pl;", ";",
+        "#Klient;", f"{rng.choice(NAMES)};", ";",
+        f"Elektroniczne zestawienie operacji za okres od {start.isoformat()} do {end.isoformat()};", ";",
+        "#Za okres:;", f"{start.strftime('%d.%m.%Y')};{end.strftime('%d.%m.%Y')};", ";",
+        "#dla rachunków:;", f"eKonto - {account_number(rng)};", ";",
+        "#Waluta;#Wpływy;#Wydatki;", f"PLN;{pl_amount(income)};{pl_amount(expense)};", ";",
+        "#Data księgowania;#Data operacji;#Opis operacji;#Tytuł;#Nadawca/Odbiorca;#Numer konta;#Kwota;#Saldo po operacji;",
+    ]
+    balance = opening_balance + income + expense
+    for row in reversed(rows):
+        booked = row.date + timedelta(days=1 if row.description.startswith("ZAKUP") else 0)
+        other_account = f"'{account_number(rng)}'" if row.counterparty else "''"
+        lines.append(
+            f"{booked.isoformat()};{row.date.isoformat()};{row.description};\"{row.title}\";"
+            f"\"{row.counterparty}\";{other_account};{pl_amount(row.amount)};{pl_amount(balance)};"
+        )
+        balance -= row.amount
+    lines.append(f";;;;;;#Saldo końcowe;{pl_amount(opening_balance + income + expense)};")
+    return "\n".join(lines) + "\n"
+
+def render_santander(rng: random.Random, rows: Sequence[StatementRow], opening_balance: Decimal = Decimal("5000")) -> str:
+    """Santander export: an account summary line, then operations newest first with a running index."""
+    end = rows[-1].date if rows else date.today()
+    closing = opening_balance + sum((r.amount for r in rows), Decimal(0))
+    lines = [f"{end.isoformat()};'{account_number(rng)}';{rng.choice(NAMES)};PLN;{pl_amount(closing)};{pl_amount(opening_balance)};{len(rows)};"]
+    balance = closing
+    for index, row in enumerate(reversed(rows), start=1):
+        day = row.date.strftime("%d-%m-%Y")
+        other_account = f"'{account_number(rng)}'" if row.counterparty else "''"
+        lines.append(
+            f"{day};{day};\"{row.title}\";\"{row.counterparty}\";{other_account};"
+            f"{pl_amount(row.amount)};{pl_amount(balance)};{index};"
+        )
+        balance -= row.amount
+    return "\n".join(lines) + "\n"
+
+RENDERERS = {"MBANK": render_mbank, "SANTANDER": render_santander}
+
+def bank_csv(bank: str, rng: random.Random, count: int, start: date, end: date) -> str:
+    return RENDERERS[bank.upper()](rng, statement_rows(rng, count, start, end))
+
+# --- domain rows ---
+
+class Batch:
+    """Column-ordered records per model, in the order they have to be loaded."""
+
+    def __init__(self):
+        self.records: Dict[type, List[tuple]] = {}
+        self.fuel_vehicles: List[uuid.UUID] = []
+        self.loan_totals: Dict[uuid.UUID, dict] = {}
+
+    def add(self, model, record: tuple):
+        self.records.setdefault(model, []).append(record)
+
+    def count(self, model) -> int:
+        return len(self.records.get(model, ()))
+
+COLUMNS = {
+    User: ("id", "email", "login", "password_hash", "is_active", "is_verified"),
+    Account: ("id", "user_id", "name", "bank_type"),
+    Category: ("id", "user_id", "name"),
+    ImportRule: ("id", "account_id", "category_id", "keyword"),
+    Transaction: ("id", "account_id", "category_id", "date", "amount", "title", "raw_hash"),
+    Vehicle: ("id", "user_id", "brand", "model", "production_year", "vin", "registration_number", "fuel_type",
+              "current_mileage", "last_service_date", "last_service_mileage", "is_active"),
+    FuelLog: ("id", "vehicle_id", "date", "mileage", "fuel_type", "liters", "price_per_liter", "total_price", "is_full"),
+    InsurancePolicy: ("id", "vehicle_id", "policy_number", "insurer_name", "start_date", "end_date", "total_cost", "policy_type"),
+    TechnicalInspection: ("id", "vehicle_id", "inspection_date", "expiration_date", "current_mileage", "cost", "station_name"),
+    ServiceEvent: ("id", "vehicle_id", "service_date", "mileage_at_service", "total_cost", "notes"),
+    ServiceItem: ("id", "service_event_id", "type", "description", "cost", "is_recurring", "interval_km", "interval_months"),
+    Loan: ("id", "user_id", "name", "total_amount", "installments_count", "due_day", "installment_amount"),
+    Payment: ("id", "loan_id", "amount", "type", "paid_at"),
+    Meal: ("id", "user_id", "id_protein_type", "id_base_type", "name", "description", "is_weekend_dish"),
+    MealIngredient: ("id", "id_meal", "id_ingredient", "base_amount"),
+    WeekPlan: ("id", "user_id", "start_date"),
+    WeekMeal: ("id", "user_id", "week_plan_id", "meal_id", "meal_date", "batch_id", "is_out_of_home"),
+}
+
+@dataclass(frozen=True)
+class Dictionaries:
+    protein_ids: List[uuid.UUID]
+    base_ids: List[uuid.UUID]
+    ingredient_ids: List[uuid.UUID]
+
+def generate_finance(batch: Batch, rng: random.Random, config: GeneratorConfig, user_id: uuid.UUID, weight: float):
+    account_id = make_uuid(rng)
+    bank = rng.choice(("MBANK", "SANTANDER"))
+    batch.add(Account, (account_id, user_id, "Konto osobiste", bank))
+    categories = {name: make_uuid(rng) for name in CATEGORIES}
+    for name, category_id in categories.items():
+        batch.add(Category, (category_id, user_id, name))
+    for merchant, category, _ in MERCHANTS:
+        if category:
+            batch.add(ImportRule, (make_uuid(rng), account_id, categories[category], merchant))
+
+    # Titles and hashes take the shape an import of the account's bank produces.
+    seen: Dict[str, int] = {}
+    for row in statement_rows(rng, scaled(rng, config.transactions_per_user, weight), config.start_date, config.end_date):
+        if row.amount > 0:
+            category = categories["Wynagrodzenie"]
+        else:
+            category = next((categories[c] for m, c, _ in MERCHANTS if c and row.title.startswith(m + " ")), None)
+        parts = (row.description, row.title) if bank == "MBANK" else (row.title, row.counterparty)
+        title = " ".join(parts).strip()
+        date_iso = row.date.isoformat()
+        key = f"{date_iso}|{row.amount}|{title}"
+        seen[key] = seen.get(key, 0) + 1
+        when = datetime.combine(row.date, dt_time(), tzinfo=timezone.utc)
+        batch.add(Transaction, (make_uuid(rng), account_id, category, when, row.amount, title,
+                                FinanceService.generate_raw_hash(date_iso, str(row.amount), title, seen[key])))
+
+def generate_vehicle(batch: Batch, rng: random.Random, config: GeneratorConfig, user_id: uuid.UUID):
+    vehicle_id = make_uuid(rng)
+    brand, model, fuel_type = rng.choice(VEHICLES)
+    mileage = rng.randrange(10_000, 150_000)
+    km_per_day = rng.uniform(20, 70)
+    liters_per_100 = rng.uniform(4.5, 8.5)
+
+    day, odometer, last_service = config.start_date, mileage, None
+    while True:
+        gap = max(1, round(rng.expovariate(1 / config.refuel_every_days)))
+        day += timedelta(days=gap)
+        if day > config.end_date:
+            break
+        distance = max(1, round(km_per_day * gap * rng.uniform(0.7, 1.3)))
+        odometer += distance
+        # Each refuel roughly replaces what the last stretch burned, so the consumption stays plausible.
+        liters = money(max(distance * liters_per_100 / 100 * rng.uniform(0.95, 1.05), 5))
+        price = money(rng.uniform(5.6, 7.2))
+        batch.add(FuelLog, (make_uuid(rng), vehicle_id, random_datetime(rng, day, day + timedelta(days=1)), odometer,
+                            fuel_type, liters, price, (liters * price).quantize(CENT), rng.random() > 0.15))
+    batch.fuel_vehicles.append(vehicle_id)
+
+    for year_start in (config.start_date + timedelta(days=365 * y) for y in range(config.years + 1)):
+        if year_start > config.end_date:
+            break
+        begins = datetime.combine(year_start, dt_time(), tzinfo=timezone.utc)
+        expires = begins + timedelta(days=365)
+        approx_mileage = mileage + round(km_per_day * (year_start - config.start_date).days)
+        batch.add(InsurancePolicy, (make_uuid(rng), vehicle_id, f"POL/{rng.randrange(10**9):09d}", rng.choice(INSURERS),
+                                    begins, expires, money(rng.uniform(600, 2500)), rng.choice(("OC", "OC+AC"))))
+        batch.add(TechnicalInspection, (make_uuid(rng), vehicle_id, begins, expires, approx_mileage,
+                                        Decimal("149.00"), f"SKP {rng.choice(CITIES)}"))
+
+        event_id = make_uuid(rng)
+        items = rng.sample(SERVICE_ITEMS, rng.randint(1, 3))
+        total = Decimal(0)
+        for item_type, description, cost, interval_km, interval_months in items:
+            item_cost = money(rng.uniform(0.7, 1.3) * cost)
+            total += item_cost
+            batch.add(ServiceItem, (make_uuid(rng), event_id, item_type, description, item_cost,
+                                    bool(interval_km or interval_months), interval_km, interval_months))
+        service_at = begins + timedelta(days=rng.randrange(30, 300))
+        batch.add(ServiceEvent, (event_id, vehicle_id, service_at, approx_mileage + rng.randrange(500, 8000), total, None))
+        last_service = (service_at, approx_mileage)
+
+    vin = f"{rng.getrandbits(68):017X}"
+    registration = f"G{rng.getrandbits(56):014X}"
+    batch.add(Vehicle, (vehicle_id, user_id, brand, model, rng.randrange(2008, 2024), vin, registration, fuel_type,
+                        odometer, last_service[0] if last_service else None,
+                        last_service[1] if last_service else None, True))
+
+def generate_loans(batch: Batch, rng: random.Random, config: GeneratorConfig, user_id: uuid.UUID, weight: float):
+    for _ in range(scaled(rng, config.loans_per_user, min(weight, 3))):
+        loan_id = make_uuid(rng)
+        installments = rng.choice((12, 24, 36, 48, 60, 120))
+        installment = money(rng.uniform(150, 2500))
+        due_day = rng.randint(1, 28)
+        batch.add(Loan, (loan_id, user_id, rng.choice(("Kredyt samochodowy", "Kredyt gotówkowy", "Raty 0%")),
+                         installment * installments, installments, due_day, installment))
+
+        opened = config.start_date + timedelta(days=rng.randrange(365 * config.years))
+        totals = {"loan_id": loan_id, "payments_count": 0, "total_installments_paid": Decimal(0),
+                  "total_prepayments": Decimal(0), "last_paid_at": None}
+        for number in range(1, installments + 1):
+            paid_at = add_months(opened, number, due_day)
+            if paid_at > config.end_date:
+                break
+            if rng.random() < 0.03:
+                continue  # a missed installment
+            payments = [(installment, PaymentType.installment)]
+            if rng.random() < 0.02:
+                payments.append((money(float(installment) * rng.uniform(1, 5)), PaymentType.prepayment))
+            for amount, kind in payments:
+                batch.add(Payment, (make_uuid(rng), loan_id, amount, kind.value, paid_at))
+                totals["payments_count"] += 1
+                key = "total_installments_paid" if kind == PaymentType.installment else "total_prepayments"
+                totals[key] += amount
+                totals["last_paid_at"] = paid_at
+        batch.loan_totals[loan_id] = totals
+
+def generate_meals(batch: Batch, rng: random.Random, config: GeneratorConfig, user_id: uuid.UUID,
+                   weight: float, dictionaries: Dictionaries):
+    meal_ids, weekend_ids = [], []
+    low, high = config.ingredients_per_meal
+    for number in range(max(scaled(rng, config.meals_per_user, weight), 1)):
+        meal_id = make_uuid(rng)
+        is_weekend = rng.random() < 0.2
+        batch.add(Meal, (meal_id, user_id, rng.choice(dictionaries.protein_ids), rng.choice(dictionaries.base_ids),
+                         f"Danie {number:05d}", None, is_weekend))
+        (weekend_ids if is_weekend else meal_ids).append(meal_id)
+        for ingredient_id in rng.sample(dictionaries.ingredient_ids, min(rng.randint(low, high), len(dictionaries.ingredient_ids))):
+            batch.add(MealIngredient, (make_uuid(rng), meal_id, ingredient_id, float(rng.choice((50, 100, 150, 200, 250, 500)))))
+
+    weeks = config.weeks_per_user if config.weeks_per_user is not None else config.years * 52
+    first_monday = config.end_date - timedelta(days=config.end_date.weekday(), weeks=weeks - 1)
+    for week in range(weeks):
+        monday = first_monday + timedelta(weeks=week)
+        plan_id = make_uuid(rng)
+        batch.add(WeekPlan, (plan_id, user_id, monday))
+        day = 0
+        while day < 7:
+            pool = weekend_ids if day == 5 and weekend_ids else (meal_ids or weekend_ids)
+            meal_id = rng.choice(pool)
+            # Most dishes are cooked for two days, which is what batch_id links together.
+            span = 2 if day < 6 and rng.random() < 0.6 else 1
+            batch_id = make_uuid(rng) if span == 2 else None
+            out_of_home = rng.random() < 0.05
+            for offset in range(span):
+                batch.add(WeekMeal, (make_uuid(rng), user_id, plan_id, None if out_of_home else meal_id,
+                                     monday + timedelta(days=day + offset), batch_id, out_of_home))
+            day += span
+
+def generate_user(batch: Batch, config: GeneratorConfig, index: int, password_hash: str, dictionaries: Dictionaries):
+    rng = random.Random(f"{config.seed}:{index}")
+    weight = volume_weight(rng, config)
+    user_id = make_uuid(rng)
+    login = f"{config.login_prefix}{index}"
+    batch.add(User, (user_id, f"{login}@datagen.local", login, password_hash, True, True))
+
+    generate_finance(batch, rng, config, user_id, weight)
+    for _ in range(scaled(rng, config.vehicles_per_user, min(weight, 3))):
+        generate_vehicle(batch, rng, config, user_id)
+    generate_loans(batch, rng, config, user_id, weight)
+    generate_meals(batch, rng, config, user_id, weight, dictionaries)
+
+# --- loading ---
+
+async def ensure_dictionaries(db: AsyncSession) -> Dictionaries:
+    """The global protein, base and ingredient dictionaries from the starter set, created when missing."""
+    dataset = load_default_dataset()
+    await db.execute(insert(ProteinType).values([{"id": p.id, "name": p.name, "category": p.category}
+                                                 for p in dataset.protein_types]).on_conflict_do_nothing())
+    await db.execute(insert(BaseType).values([{"id": b.id, "name": b.name, "category": b.category}
+                                              for b in dataset.base_types]).on_conflict_do_nothing())
+    await db.execute(insert(Ingredient).values([{"name": i.name, "category": i.category, "unit": i.unit}
+                                                for i in dataset.ingredients]).on_conflict_do_nothing())
+    return Dictionaries(
+        protein_ids=list((await db.execute(select(ProteinType.id).order_by(ProteinType.name))).scalars()),
+        base_ids=list((await db.execute(select(BaseType.id).order_by(BaseType.name))).scalars()),
+        ingredient_ids=list((await db.execute(select(Ingredient.id).order_by(Ingredient.name))).scalars()),
+    )
+
+async def copy_batch(db: AsyncSession, batch: Batch) -> None:
+    """COPYs the records over the session's own connection, so they commit with the session."""
+    connection = await db.connection()
+    driver = (await connection.get_raw_connection()).driver_connection
+    for model, columns in COLUMNS.items():
+        records = batch.records.get(model)
+        if records:
+            table = model.__table__
+            await driver.copy_records_to_table(table.name, schema_name=table.schema, columns=columns, records=records)
+
+# Models feeding the timeline rollup: (column of the account, vehicle or loan they belong to, date column).
+TIMELINE_DATES = {
+    Transaction: ("account_id", "date"),
+    Payment: ("loan_id", "paid_at"),
+    FuelLog: ("vehicle_id", "date"),
+    InsurancePolicy: ("vehicle_id", "start_date"),
+    TechnicalInspection: ("vehicle_id", "inspection_date"),
+    ServiceEvent: ("vehicle_id", "service_date"),
+}
+
+async def rebuild_derived(db: AsyncSession, batch: Batch) -> None:
+    """Fills the tables the repositories otherwise maintain on every write."""
+    if batch.loan_totals:
+        stmt = insert(LoanPaymentTotals).values(list(batch.loan_totals.values()))
+        await db.execute(stmt.on_conflict_do_nothing())
+    for vehicle_id in batch.fuel_vehicles:
+        await FuelRepository.rebuild_stats(db, vehicle_id)
+
+    owners = {record[0]: record[1] for model in (Account, Vehicle, Loan) for record in batch.records.get(model, ())}
+    dates: Dict[uuid.UUID, List] = {}
+    for model, (parent, column) in TIMELINE_DATES.items():
+        parent_at, date_at = COLUMNS[model].index(parent), COLUMNS[model].index(column)
+        for record in batch.records.get(model, ()):
+            dates.setdefault(owners[record[parent_at]], []).append(record[date_at])
+    for user_id, user_dates in dates.items():
+        await TimelineRepository.mark_stale(db, user_id, user_dates)
+        await TimelineRepository.rebuild_stale(db, user_id)
+
+async def generate(db: AsyncSession, config: GeneratorConfig, users_per_commit: int = 20, report=print) -> Dict[str, int]:
+    existing = set((await db.execute(select(User.login).where(User.login.startswith(config.login_prefix)))).scalars())
+    pending = [i for i in range(config.users) if f"{config.login_prefix}{i}" not in existing]
+    if existing:
+        report(f"Skipping {config.users - len(pending)} users that already exist for seed {config.seed}")
+
+    dictionaries = await ensure_dictionaries(db)
+    await db.commit()
+    password_hash = hash_password(PASSWORD)
+
+    totals: Dict[str, int] = {}
+    started = time.perf_counter()
+    for chunk_start in range(0, len(pending), users_per_commit):
+        batch = Batch()
+        for index in pending[chunk_start:chunk_start + users_per_commit]:
+            generate_user(batch, config, index, password_hash, dictionaries)
+
+        await copy_batch(db, batch)
+        await rebuild_derived(db, batch)
+        await db.commit()
+
+        for model in COLUMNS:
+            totals[model.__tablename__] = totals.get(model.__tablename__, 0) + batch.count(model)
+        done = min(chunk_start + users_per_commit, len(pending))
+        rows = sum(totals.values())
+        report(f"{done}/{len(pending)} users, {rows} rows, {rows / (time.perf_counter() - started):.0f} rows/s")
+    return totals
+
+# --- CLI ---
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    db = commands.add_parser("db", help="Bulk-load users and their data into the configured database")
+    db.add_argument("--users", type=int, default=100)
+    db.add_argument("--seed", type=int, default=1)
+    db.add_argument("--end-date", type=date.fromisoformat, default=GeneratorConfig.end_date)
+    db.add_argument("--years", type=int, default=3, help="Length of the generated history")
+    db.add_argument("--transactions", type=int, default=1000, help="Mean transactions per user")
+    db.add_argument("--vehicles", type=float, default=1.0, help="Mean vehicles per user")
+    db.add_argument("--refuel-every", type=float, default=9.0, help="Mean days between refuels")
+    db.add_argument("--meals", type=int, default=60, help="Mean meals per user")
+    db.add_argument("--ingredients", type=int, nargs=2, default=(3, 8), metavar=("MIN", "MAX"), help="Ingredients per meal")
+    db.add_argument("--weeks", type=int, help="Planned weeks per user (default: the whole history)")
+    db.add_argument("--loans", type=float, default=1.0, help="Mean loans per user")
+    db.add_argument("--distribution", choices=("uniform", "pareto"), default="uniform",
+                    help="How volume is spread across users")
+    db.add_argument("--pareto-alpha", type=float, default=1.5)
+    db.add_argument("--users-per-commit", type=int, default=20)
+
+    csv = commands.add_parser("csv", help="Write a bank export that the finance import accepts")
+    csv.add_argument("--bank", choices=("mbank", "santander"), required=True)
+    csv.add_argument("--rows", type=int, default=1000)
+    csv.add_argument("--seed", type=int, default=1)
+    csv.add_argument("--start-date", type=date.fromisoformat, default=date(2025, 1, 1))
+    csv.add_argument("--end-date", type=date.fromisoformat, default=date(2025, 12, 31))
+    csv.add_argument("--encoding", default="cp1250", help="Banks export cp1250; the import also accepts utf-8")
+    csv.add_argument("--output", required=True)
+
+    args = parser.parse_args(argv)
+    if args.command == "db" and args.distribution == "pareto" and args.pareto_alpha <= 1:
+        parser.error("--pareto-alpha must be greater than 1")
+    return args
+
+async def run_db(args) -> None:
+    from app.db.session import AsyncSessionLocal, engine
+
+    config = GeneratorConfig(
+        users=args.users, seed=args.seed, end_date=args.end_date, years=args.years,
+        transactions_per_user=args.transactions, vehicles_per_user=args.vehicles, refuel_every_days=args.refuel_every,
+        meals_per_user=args.meals, ingredients_per_meal=tuple(args.ingredients), weeks_per_user=args.weeks,
+        loans_per_user=args.loans, distribution=args.distribution, pareto_alpha=args.pareto_alpha,
+    )
+    async with AsyncSessionLocal() as db:
+        totals = await generate(db, config, users_per_commit=args.users_per_commit)
+    await engine.dispose()
+
+    for table, count in totals.items():
+        print(f"  {table:<24} {count:>12}")
+    print(f"Users log in as {config.login_prefix}<n> with password '{PASSWORD}'")
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "db":
+        asyncio.run(run_db(args))
+        return 0
+
+    content = bank_csv(args.bank, random.Random(args.seed), args.rows, args.start_date, args.end_date)
+    with open(args.output, "w", encoding=args.encoding, newline="") as f:
+        f.write(content)
+    print(f"Wrote {args.rows} {args.bank} operations to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Seeds a synthetic dataset for the API benchmarks.
+
+Every benchmark user gets a bank account with categories, import rules and a transaction
+history, an empty second account for the import scenarios, a vehicle with a fuel log, the starter meals plus extra generated ones, and a meal
+calendar covering the weeks before the benchmark Monday. The data is derived from a seed,
+so two runs with the same configuration measure the same database.
+
+Users are looked up by their login prefix first, which makes seeding idempotent: running the
+benchmark again with the same seed reuses what is already there.
+"""
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import hash_password
+from app.db.models.finance import Account, Category, ImportRule, Transaction
+from app.db.models.fuel import FuelLog
+from app.db.models.meal import Meal
+from app.db.models.meal_ingredients import Ingredient, MealIngredient
+from app.db.models.meal_planner import WeekMeal, WeekPlan
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.db.repositories.fuel import FuelRepository
+from app.services.finance_service import FinanceService
+from app.services.meal_service import generate_default_user_data, load_default_dataset
+
+PASSWORD = "benchmark-password"
+BENCHMARK_MONDAY = date(2025, 6, 2)
+
+MAIN_ACCOUNT = "Konto główne"
+# Import scenarios write here, so the rows they add do not skew the stats measured on the main account.
+IMPORT_ACCOUNT = "Konto importów"
+CATEGORIES = ("Zakupy", "Paliwo", "Rachunki", "Restauracje", "Wynagrodzenie")
+MERCHANTS = (
+    ("BIEDRONKA", "Zakupy"), ("LIDL", "Zakupy"), ("ORLEN", "Paliwo"), ("BP", "Paliwo"),
+    ("PGE OBROT", "Rachunki"), ("ORANGE POLSKA", "Rachunki"), ("MCDONALDS", "Restauracje"),
+    ("PYSZNE.PL", "Restauracje"), ("ALLEGRO", None), ("ZABKA", None),
+)
+CITIES = ("KRAKOW", "WARSZAWA", "GDANSK", "POZNAN", "WROCLAW")
+
+@dataclass(frozen=True)
+class SeedConfig:
+    users: int = 10
+    transactions_per_user: int = 2000
+    meals_per_user: int = 40
+    fuel_logs_per_user: int = 200
+    weeks_per_user: int = 12
+    seed: int = 42
+
+    @property
+    def login_prefix(self) -> str:
+        return f"bench{self.seed}_"
+
+@dataclass(frozen=True)
+class SeededUser:
+    id: uuid.UUID
+    login: str
+    account_id: uuid.UUID
+    import_account_id: uuid.UUID
+    vehicle_id: uuid.UUID
+
+def _transactions(rng: random.Random, account_id: uuid.UUID, categories: dict, count: int) -> List[dict]:
+    start = datetime(BENCHMARK_MONDAY.year - 2, 1, 1, tzinfo=timezone.utc)
+    span = int((datetime(BENCHMARK_MONDAY.year, BENCHMARK_MONDAY.month, 1, tzinfo=timezone.utc) - start).total_seconds())
+    rows = []
+    for i in range(count):
+        if i % 30 == 0:
+            title, amount, category = "PRZELEW WYNAGRODZENIE", Decimal(rng.randint(5000, 9000)), categories["Wynagrodzenie"]
+        else:
+            merchant, category_name = rng.choice(MERCHANTS)
+            title = f"{merchant} {rng.choice(CITIES)}"
+            amount = -Decimal(rng.randint(500, 40000)) / 100
+            category = categories.get(category_name)
+        occurred = start + timedelta(seconds=rng.randrange(span))
+        rows.append({
+            "id": uuid.uuid4(),
+            "account_id": account_id,
+            "category_id": category,
+            "date": occurred,
+            "amount": amount,
+            "title": title,
+            "raw_hash": FinanceService.generate_raw_hash(occurred.date().isoformat(), str(amount), title, i),
+        })
+    return rows
+
+def _fuel_logs(rng: random.Random, vehicle_id: uuid.UUID, count: int) -> List[dict]:
+    rows, mileage = [], 50_000
+    when = datetime(BENCHMARK_MONDAY.year - 3, 1, 1, tzinfo=timezone.utc)
+    for _ in range(count):
+        when += timedelta(days=rng.randint(4, 12))
+        mileage += rng.randint(350, 750)
+        liters = Decimal(rng.randint(2500, 5500)) / 100
+        price = Decimal(rng.randint(560, 720)) / 100
+        rows.append({
+            "id": uuid.uuid4(),
+            "vehicle_id": vehicle_id,
+            "date": when,
+            "mileage": mileage,
+            "fuel_type": "PB95",
+            "liters": liters,
+            "price_per_liter": price,
+            "total_price": (liters * price).quantize(Decimal("0.01")),
+            "is_full": rng.random() > 0.15,
+        })
+    return rows
+
+async def _seed_meals(db: AsyncSession, rng: random.Random, user_id: uuid.UUID, config: SeedConfig) -> List[uuid.UUID]:
+    await generate_default_user_data(db, str(user_id))
+
+    dataset = load_default_dataset()
+    ingredient_ids = list((await db.execute(select(Ingredient.id).order_by(Ingredient.name))).scalars().all())
+    extra = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "id_protein_type": rng.choice(dataset.protein_types).id,
+            "id_base_type": rng.choice(dataset.base_types).id,
+            "name": f"Danie {i:04d}",
+            "description": "Wygenerowane do testów wydajności",
+            "is_weekend_dish": rng.random() < 0.2,
+        }
+        for i in range(max(config.meals_per_user - len(dataset.meals), 0))
+    ]
+    if extra:
+        await db.execute(insert(Meal), extra)
+        await db.execute(insert(MealIngredient), [
+            {"id": uuid.uuid4(), "id_meal": meal["id"], "id_ingredient": ingredient_id, "base_amount": rng.randint(50, 400)}
+            for meal in extra
+            for ingredient_id in rng.sample(ingredient_ids, rng.randint(3, 6))
+        ])
+
+    return list((await db.execute(select(Meal.id).where(Meal.user_id == user_id).order_by(Meal.name))).scalars().all())
+
+async def _seed_calendar(db: AsyncSession, rng: random.Random, user_id: uuid.UUID, meal_ids: List[uuid.UUID], weeks: int):
+    plans, entries = [], []
+    # The benchmark week itself is planned too, so the shopping list has something to add up.
+    for week in range(-weeks, 1):
+        monday = BENCHMARK_MONDAY + timedelta(weeks=week)
+        plan_id = uuid.uuid4()
+        plans.append({"id": plan_id, "user_id": user_id, "start_date": monday})
+        for day in range(7):
+            entries.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "week_plan_id": plan_id,
+                "meal_id": rng.choice(meal_ids),
+                "meal_date": monday + timedelta(days=day),
+                "is_out_of_home": rng.random() < 0.1,
+            })
+    await db.execute(insert(WeekPlan), plans)
+    await db.execute(insert(WeekMeal), entries)
+
+async def _seed_user(db: AsyncSession, config: SeedConfig, index: int, password_hash: str) -> SeededUser:
+    rng = random.Random(f"{config.seed}:{index}")
+    user_id = uuid.uuid4()
+    login = f"{config.login_prefix}{index}"
+    db.add(User(id=user_id, email=f"{login}@bench.local", login=login, password_hash=password_hash, is_verified=True))
+    await db.flush()
+
+    account_id, import_account_id = uuid.uuid4(), uuid.uuid4()
+    db.add(Account(id=account_id, user_id=user_id, name=MAIN_ACCOUNT, bank_type="MBANK"))
+    db.add(Account(id=import_account_id, user_id=user_id, name=IMPORT_ACCOUNT, bank_type="MBANK"))
+    categories = {name: uuid.uuid4() for name in CATEGORIES}
+    db.add_all(Category(id=category_id, user_id=user_id, name=name) for name, category_id in categories.items())
+    await db.flush()
+    db.add_all(
+        ImportRule(account_id=account, category_id=categories[category], keyword=merchant)
+        for account in (account_id, import_account_id)
+        for merchant, category in MERCHANTS if category
+    )
+    if config.transactions_per_user:
+        await db.execute(insert(Transaction), _transactions(rng, account_id, categories, config.transactions_per_user))
+
+    vehicle_id = uuid.uuid4()
+    db.add(Vehicle(
+        id=vehicle_id, user_id=user_id, brand="Skoda", model="Octavia", production_year=2018,
+        vin=f"BENCH{config.seed:04d}{index:08d}"[-17:], registration_number=f"KR{config.seed % 100:02d}{index:05d}",
+        fuel_type="PB95", current_mileage=50_000,
+    ))
+    await db.flush()
+    if config.fuel_logs_per_user:
+        await db.execute(insert(FuelLog), _fuel_logs(rng, vehicle_id, config.fuel_logs_per_user))
+        await FuelRepository.rebuild_stats(db, vehicle_id)
+
+    meal_ids = await _seed_meals(db, rng, user_id, config)
+    await _seed_calendar(db, rng, user_id, meal_ids, config.weeks_per_user)
+    await db.commit()
+    return SeededUser(user_id, login, account_id, import_account_id, vehicle_id)
+
+async def seed(db: AsyncSession, config: SeedConfig) -> List[SeededUser]:
+    """Creates the missing benchmark users and returns all of them, in index order."""
+    existing = {
+        user.login: user
+        for user in (await db.execute(select(User).where(User.login.startswith(config.login_prefix)))).scalars().all()
+    }
+    password_hash = hash_password(PASSWORD)
+
+    users = []
+    for index in range(config.users):
+        login = f"{config.login_prefix}{index}"
+        user = existing.get(login)
+        if user is None:
+            users.append(await _seed_user(db, config, index, password_hash))
+            continue
+
+        accounts = dict((await db.execute(select(Account.name, Account.id).where(Account.user_id == user.id))).all())
+        vehicle_id = (await db.execute(select(Vehicle.id).where(Vehicle.user_id == user.id))).scalars().first()
+        users.append(SeededUser(user.id, login, accounts[MAIN_ACCOUNT], accounts[IMPORT_ACCOUNT], vehicle_id))
+    return users
@@ -6,8 +6,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 
 from app.main import app
 from app.db.base import Base
-from app.db.deps import get_db
+from app.db.deps import get_db, get_session_factory
 from app.core.config import get_settings
+from app.services.dictionary_cache import dictionary_cache
+from app.services.service_projection import service_projection_cache
+from app.services.loan_service import loan_schedule_cache
 
 settings = get_settings()
 
@@ -32,20 +35,13 @@ async def db_session():
                 l.total_amount,
                 l.installments_count,
                 l.installment_amount,
-                l.due_day, 
-                COALESCE(SUM(p.amount), 0) AS total_paid,
-                l.total_amount - COALESCE(SUM(p.amount), 0) AS remaining,
-                COALESCE(
-                    SUM(CASE WHEN p.type = 'installment' THEN p.amount END),
-                    0
-                ) AS total_installments_paid,
-                COALESCE(
-                    SUM(CASE WHEN p.type = 'prepayment' THEN p.amount END),
-                    0
-                ) AS total_prepayments
+                l.due_day,
+                COALESCE(t.total_installments_paid + t.total_prepayments, 0) AS total_paid,
+                l.total_amount - COALESCE(t.total_installments_paid + t.total_prepayments, 0) AS remaining,
+                COALESCE(t.total_installments_paid, 0) AS total_installments_paid,
+                COALESCE(t.total_prepayments, 0) AS total_prepayments
             FROM dmt.loans l
-            LEFT JOIN dmt.payments p ON p.loan_id = l.id
-            GROUP BY l.id;
+            LEFT JOIN dmt.loan_payment_totals t ON t.loan_id = l.id;
         """))
 
         await conn.execute(text("""
@@ -71,6 +67,12 @@ async def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        db_session.bind, expire_on_commit=False, class_=AsyncSession
+    )
+    dictionary_cache.clear()
+    service_projection_cache.clear()
+    loan_schedule_cache.clear()
     
     async with AsyncClient(
         transport=ASGITransport(app=app), 
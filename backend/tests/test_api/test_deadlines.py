@@ -0,0 +1,94 @@
+import pytest
+import uuid
+from httpx import AsyncClient
+from datetime import datetime, timedelta, timezone
+from app.db.repositories.deadline import DeadlineRepository
+
+async def get_auth_data(client: AsyncClient):
+    suffix = uuid.uuid4().hex[:6]
+    email = f"test_dl_{suffix}@wp.pl"
+    login = f"user_dl_{suffix}"
+    password = "password123"
+    await client.post("/auth/register", json={"email": email, "login": login, "password": password})
+    login_res = await client.post("/auth/login", json={"identifier": email, "password": password})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+async def create_test_vehicle(client: AsyncClient, headers: dict):
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Mazda", "model": "3", "production_year": 2017,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"GD {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Petrol", "current_mileage": 49000
+    })
+    return v_res.json()["vehicle_id"]
+
+@pytest.mark.anyio
+async def test_deadlines_single_sorted_stream(client: AsyncClient, db_session):
+    """Insurance, inspection and recurring service deadlines come back together, most urgent first."""
+    headers, _ = await get_auth_data(client)
+    v_id = await create_test_vehicle(client, headers)
+    now = datetime.now(timezone.utc)
+
+    for number, start, end in [("OLD", now - timedelta(days=400), now - timedelta(days=35)),
+                               ("NEW", now - timedelta(days=355), now + timedelta(days=10))]:
+        await client.post(f"/vehicles/{v_id}/insurance/", headers=headers, json={
+            "vehicle_id": v_id, "policy_number": number, "insurer_name": "PZU",
+            "start_date": start.isoformat(), "end_date": end.isoformat(), "total_cost": 700, "policy_type": "OC"
+        })
+    await client.post(f"/vehicles/{v_id}/inspections/", headers=headers, json={
+        "vehicle_id": v_id, "inspection_date": (now - timedelta(days=265)).isoformat(),
+        "expiration_date": (now + timedelta(days=100)).isoformat(), "current_mileage": 49000, "cost": 149
+    })
+
+    event = await client.post("/services/events", headers=headers, json={
+        "vehicle_id": v_id, "service_date": (now - timedelta(days=25)).isoformat(), "mileage_at_service": 49600
+    })
+    event_id = event.json()["event_id"]
+    for item in [
+        {"type": "Olej", "description": "Wymiana oleju", "interval_km": 1000, "interval_months": 12},
+        {"type": "Myjnia", "description": "Mycie podwozia", "interval_km": None, "interval_months": 1},
+        {"type": "Opony", "description": "Wymiana opon", "interval_km": None, "interval_months": None},
+    ]:
+        await client.post("/services/items", headers=headers, json={
+            "service_event_id": event_id, "cost": 100, "is_recurring": True, **item
+        })
+
+    await DeadlineRepository.refresh_service_reminders(db_session)
+
+    res = await client.get("/deadlines/", headers=headers)
+    assert res.status_code == 200
+    deadlines = res.json()
+    assert [(d["kind"], d["title"]) for d in deadlines] == [
+        ("service", "Wymiana oleju"),
+        ("service", "Mycie podwozia"),
+        ("insurance", "OC PZU"),
+    ]
+    assert deadlines[0]["km_remaining"] == 1000
+    assert deadlines[2]["days_remaining"] in (9, 10)
+
+    wider = (await client.get("/deadlines/", params={"days": 120, "km": 0}, headers=headers)).json()
+    assert [d["title"] for d in wider] == ["Mycie podwozia", "OC PZU", "Technical inspection"]
+
+    other_headers, _ = await get_auth_data(client)
+    assert (await client.get("/deadlines/", headers=other_headers)).json() == []
+
+@pytest.mark.anyio
+async def test_deadlines_follow_service_item_writes(client: AsyncClient):
+    """Writing a recurring item refreshes its vehicle's reminders without waiting for the periodic job."""
+    headers, _ = await get_auth_data(client)
+    v_id = await create_test_vehicle(client, headers)
+    now = datetime.now(timezone.utc)
+
+    event = await client.post("/services/events/with-items", headers=headers, json={
+        "vehicle_id": v_id, "service_date": (now - timedelta(days=20)).isoformat(), "mileage_at_service": 49000,
+        "items": [{"type": "Olej", "description": "Wymiana oleju", "cost": 300, "is_recurring": True,
+                   "interval_km": 500, "interval_months": 12}],
+    })
+    item_id = event.json()["item_ids"][0]
+    assert [d["title"] for d in (await client.get("/deadlines/", headers=headers)).json()] == ["Wymiana oleju"]
+
+    await client.patch(f"/services/items/{item_id}", headers=headers, json={"description": "Olej i filtry"})
+    assert [d["title"] for d in (await client.get("/deadlines/", headers=headers)).json()] == ["Olej i filtry"]
+
+    await client.delete(f"/services/items/{item_id}", headers=headers)
+    assert (await client.get("/deadlines/", headers=headers)).json() == []
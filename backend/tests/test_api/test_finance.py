@@ -0,0 +1,82 @@
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.db.models.finance import ImportSession
+
+CSV = """#Data księgowania;#Data operacji;#Opis operacji;#Tytuł;#Nadawca/Odbiorca;#Numer konta;#Kwota;#Saldo po operacji;
+2025-03-01;2025-03-01;ZAKUP PRZY UŻYCIU KARTY;BIEDRONKA KRAKOW;;;-45,20;1000,00;
+2025-03-02;2025-03-02;ZAKUP PRZY UŻYCIU KARTY;ORLEN KRAKOW;;;-210,00;790,00;
+2025-03-05;2025-03-05;PRZELEW PRZYCHODZĄCY;WYNAGRODZENIE;;;6500,00;7290,00;
+"""
+
+async def get_auth_data(client: AsyncClient):
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"fin_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+async def preview(client: AsyncClient, headers: dict):
+    account = (await client.post("/finance/accounts", json={"name": "Konto", "bank_type": "MBANK"}, headers=headers)).json()
+    files = {"file": ("export.csv", CSV.encode("utf-8"), "text/csv")}
+    res = await client.post(f"/finance/import/preview/{account['id']}", files=files, headers=headers)
+    assert res.status_code == 200
+    return account["id"], res.json()
+
+@pytest.mark.anyio
+async def test_import_session_confirm_applies_overrides(client: AsyncClient):
+    """Confirm sends only the token; the staged rows are saved with the user's changes."""
+    headers, _ = await get_auth_data(client)
+    category = (await client.post("/finance/categories", json={"name": "Paliwo"}, headers=headers)).json()
+    account_id, data = await preview(client, headers)
+
+    assert [row["position"] for row in data["transactions"]] == [0, 1, 2]
+    assert data["transactions"][1]["title"].endswith("ORLEN KRAKOW")
+
+    overrides = [{"position": 1, "category_id": category["id"]}, {"position": 2, "skip": True}]
+    res = await client.post(f"/finance/import/sessions/{data['token']}/confirm", json={"overrides": overrides}, headers=headers)
+    assert res.status_code == 200
+    assert res.json()["message"] == "Successfully imported 2 transactions"
+
+    saved = (await client.get(f"/finance/transactions/{account_id}", params={"month": 3, "year": 2025}, headers=headers)).json()
+    assert sorted((tx["amount"], tx["category_id"]) for tx in saved) == [("-210.00", category["id"]), ("-45.20", None)]
+
+    # The session is consumed by the confirmation.
+    again = await client.post(f"/finance/import/sessions/{data['token']}/confirm", headers=headers)
+    assert again.status_code == 404
+
+@pytest.mark.anyio
+async def test_import_session_is_private_and_validated(client: AsyncClient, db_session):
+    headers, _ = await get_auth_data(client)
+    other_headers, _ = await get_auth_data(client)
+    foreign_category = (await client.post("/finance/categories", json={"name": "Obca"}, headers=other_headers)).json()
+    _, data = await preview(client, headers)
+    confirm_url = f"/finance/import/sessions/{data['token']}/confirm"
+
+    assert (await client.post(confirm_url, headers=other_headers)).status_code == 404
+    bad_position = await client.post(confirm_url, json={"overrides": [{"position": 3, "skip": True}]}, headers=headers)
+    assert bad_position.status_code == 400
+    bad_category = await client.post(confirm_url, json={"overrides": [{"position": 0, "category_id": foreign_category["id"]}]}, headers=headers)
+    assert bad_category.status_code == 400
+
+    await db_session.execute(
+        update(ImportSession).where(ImportSession.id == uuid.UUID(data["token"]))
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+    )
+    await db_session.commit()
+    assert (await client.post(confirm_url, headers=headers)).status_code == 404
+
+@pytest.mark.anyio
+async def test_import_duplicates_are_rejected(client: AsyncClient):
+    """A second import of the same statement fails, for sessions and for the legacy payload."""
+    headers, _ = await get_auth_data(client)
+    account_id, data = await preview(client, headers)
+    assert (await client.post(f"/finance/import/sessions/{data['token']}/confirm", headers=headers)).status_code == 200
+
+    legacy = await client.post(f"/finance/import/confirm/{account_id}", json=data["transactions"], headers=headers)
+    assert legacy.status_code == 400
+    assert "possible duplicates" in legacy.json()["detail"]
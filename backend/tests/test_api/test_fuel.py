@@ -97,4 +97,96 @@ async def test_fuel_invalid_mileage(client: AsyncClient):
         "mileage": -100, "fuel_type": "Petrol", "liters": 10, "price_per_liter": 6
     }
     res = await client.post(f"/vehicles/{v_id}/fuel/", json=bad_payload, headers=headers)
-    assert res.status_code == 422
\ No newline at end of file
+    assert res.status_code == 422
+
+@pytest.mark.anyio
+async def test_consumption_uses_full_history(client: AsyncClient):
+    """Consumption covers every refuel, not only the latest page of logs."""
+    headers, _ = await get_auth_data(client)
+    v_id = await create_test_vehicle(client, headers)
+    start = datetime(2024, 1, 1)
+
+    for i in range(25):
+        await client.post(f"/vehicles/{v_id}/fuel/", headers=headers, json={
+            "vehicle_id": v_id, "date": (start + timedelta(days=i)).isoformat(),
+            "mileage": 10000 + i * 500, "fuel_type": "Petrol",
+            "liters": 30 if i % 2 == 0 else 40, "price_per_liter": 6
+        })
+
+    res = await client.get(f"/vehicles/{v_id}/fuel/consumption", headers=headers)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["segments_count"] == 24
+    assert data["total_distance"] == 24 * 500
+    assert data["average_consumption"] == 7.0
+    assert data["history"][0]["consumption"] == 8.0
+    assert data["history"][1]["rolling_average"] == 7.0
+
+@pytest.mark.anyio
+async def test_consumption_date_and_fuel_type_filters(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    v_id = await create_test_vehicle(client, headers)
+    start = datetime(2024, 1, 1)
+
+    entries = [
+        (0, 10000, "Petrol", 40, True),
+        (1, 10200, "LPG", 30, True),
+        (2, 10500, "Petrol", 20, False),
+        (3, 11000, "Petrol", 30, True),
+        (10, 11500, "Petrol", 35, True),
+    ]
+    for day, mileage, fuel_type, liters, is_full in entries:
+        await client.post(f"/vehicles/{v_id}/fuel/", headers=headers, json={
+            "vehicle_id": v_id, "date": (start + timedelta(days=day)).isoformat(), "mileage": mileage,
+            "fuel_type": fuel_type, "liters": liters, "price_per_liter": 6, "is_full": is_full
+        })
+
+    res = await client.get(
+        f"/vehicles/{v_id}/fuel/consumption",
+        params={"fuel_type": "Petrol", "date_to": (start + timedelta(days=5)).isoformat()},
+        headers=headers,
+    )
+    data = res.json()
+    assert data["segments_count"] == 1
+    assert data["history"][0]["distance"] == 1000
+    assert data["history"][0]["liters"] == 50.0
+    assert data["average_consumption"] == 5.0
+
+@pytest.mark.anyio
+async def test_fuel_stats_follow_log_writes(client: AsyncClient):
+    """The summary is updated on create, back-dated create, patch and delete."""
+    headers, _ = await get_auth_data(client)
+    v_id = await create_test_vehicle(client, headers)
+    start = datetime(2024, 1, 1)
+
+    async def add_log(day, mileage, liters, is_full=True):
+        res = await client.post(f"/vehicles/{v_id}/fuel/", headers=headers, json={
+            "vehicle_id": v_id, "date": (start + timedelta(days=day)).isoformat(), "mileage": mileage,
+            "fuel_type": "Petrol", "liters": liters, "price_per_liter": 5, "is_full": is_full
+        })
+        return res.json()["id"]
+
+    await add_log(0, 10000, 40)
+    await add_log(1, 10300, 10, is_full=False)
+    last_id = await add_log(2, 10500, 20)
+
+    stats = (await client.get(f"/vehicles/{v_id}/fuel/stats", headers=headers)).json()
+    assert stats["entries_count"] == 3
+    assert stats["full_tank_count"] == 2
+    assert stats["total_spent"] == 350.0
+    assert stats["last_full_mileage"] == 10500
+    assert stats["average_consumption"] == 6.0
+
+    await add_log(-1, 9500, 50)
+    await client.patch(f"/vehicles/{v_id}/fuel/{last_id}", json={"liters": 30}, headers=headers)
+    stats = (await client.get(f"/vehicles/{v_id}/fuel/stats", headers=headers)).json()
+    consumption = (await client.get(f"/vehicles/{v_id}/fuel/consumption", headers=headers)).json()
+    assert stats["entries_count"] == 4
+    assert stats["consumption_distance"] == consumption["total_distance"] == 1000
+    assert stats["average_consumption"] == consumption["weighted_average_consumption"] == 8.0
+
+    await client.delete(f"/vehicles/{v_id}/fuel/{last_id}", headers=headers)
+    stats = (await client.get(f"/vehicles/{v_id}/fuel/stats", headers=headers)).json()
+    assert stats["entries_count"] == 3
+    assert stats["last_full_mileage"] == 10000
+    assert stats["total_liters"] == 100.0
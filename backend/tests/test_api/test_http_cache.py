@@ -0,0 +1,89 @@
+import pytest
+import uuid
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy import update
+from app.db.models.resource_version import ResourceVersion
+
+async def get_auth_data(client: AsyncClient):
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"etag_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+@pytest.mark.anyio
+async def test_categories_not_modified_until_written(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+
+    first = await client.get("/finance/categories", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = await client.get("/finance/categories", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    await client.post("/finance/categories", json={"name": "Paliwo"}, headers=headers)
+    changed = await client.get("/finance/categories", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [c["name"] for c in changed.json()] == ["Paliwo"]
+    assert changed.headers["etag"] != etag
+
+@pytest.mark.anyio
+async def test_if_modified_since_waits_for_the_second_to_pass(client: AsyncClient, db_session):
+    """A write in the second Last-Modified names would be invisible to If-Modified-Since."""
+    headers, user_id = await get_auth_data(client)
+    await client.post("/finance/categories", json={"name": "Paliwo"}, headers=headers)
+
+    fresh = await client.get("/finance/categories", headers=headers)
+    assert "last-modified" not in fresh.headers
+    now = format_datetime(datetime.now(timezone.utc), usegmt=True)
+    same_second = await client.get("/finance/categories", headers={**headers, "If-Modified-Since": now})
+    assert same_second.status_code == 200
+
+    await db_session.execute(
+        update(ResourceVersion)
+        .where(ResourceVersion.user_id == uuid.UUID(user_id))
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+    )
+    await db_session.commit()
+
+    settled = await client.get("/finance/categories", headers=headers)
+    assert "last-modified" in settled.headers
+    since = await client.get("/finance/categories", headers={**headers, "If-Modified-Since": settled.headers["last-modified"]})
+    assert since.status_code == 304
+
+@pytest.mark.anyio
+async def test_vehicle_list_versions_follow_service_writes(client: AsyncClient):
+    """A service event moves the vehicle's mileage, so it invalidates the vehicle list too."""
+    headers, _ = await get_auth_data(client)
+    vehicle_payload = {
+        "brand": "Toyota", "model": "Corolla", "production_year": 2019, "vin": f"VIN{uuid.uuid4().hex[:14].upper()}",
+        "registration_number": f"WA{uuid.uuid4().hex[:5].upper()}", "fuel_type": "PB95", "current_mileage": 50000,
+    }
+    vehicle_id = (await client.post("/vehicles/", json=vehicle_payload, headers=headers)).json()["vehicle_id"]
+
+    etag = (await client.get("/vehicles/", headers=headers)).headers["etag"]
+    assert (await client.get("/vehicles/", headers={**headers, "If-None-Match": etag})).status_code == 304
+
+    await client.post("/services/events", json={
+        "vehicle_id": vehicle_id, "service_date": "2025-05-01T10:00:00Z", "mileage_at_service": 52000,
+    }, headers=headers)
+    res = await client.get("/vehicles/", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["current_mileage"] == 52000
+
+@pytest.mark.anyio
+async def test_tags_are_per_user(client: AsyncClient):
+    headers_a, _ = await get_auth_data(client)
+    headers_b, _ = await get_auth_data(client)
+
+    etag = (await client.get("/settings/meals/", headers=headers_a)).headers["etag"]
+    res = await client.get("/settings/meals/", headers={**headers_b, "If-None-Match": etag})
+    assert res.status_code == 200
+
+    await client.patch("/settings/meals/", json={"default_servings": 3}, headers=headers_a)
+    assert (await client.get("/settings/meals/", headers={**headers_a, "If-None-Match": etag})).status_code == 200
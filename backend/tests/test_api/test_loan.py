@@ -72,4 +72,79 @@ async def test_loans_full_flow(client: AsyncClient, db_session):
     token2, user2_id = await create_test_user(client, "empty@wp.pl", "emptyuser", "password123")
     headers2 = {"Authorization": f"Bearer {token2}"}
     empty_status2 = await client.get(f"/loans/loan_status/{user2_id}", headers=headers2)
-    assert empty_status2.status_code == 404
\ No newline at end of file
+    assert empty_status2.status_code == 404
+
+@pytest.mark.anyio
+async def test_loan_schedule_and_what_if(client: AsyncClient):
+    """Installments settle the schedule from the front, prepayments shorten it from the back."""
+    token, _ = await create_test_user(client, "schedule@wp.pl", "scheduleuser", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    loan_payload = {"name": "Kredyt", "total_amount": 1000.00, "installments_count": 10, "due_day": 15, "installment_amount": 100.00}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+
+    for amount, payment_type in [(100, "installment"), (100, "installment"), (50, "installment"), (300, "prepayment")]:
+        await client.post("/payments/", json={"loan_id": loan_id, "amount": amount, "type": payment_type}, headers=headers)
+
+    res = await client.get(f"/loans/{loan_id}/schedule", headers=headers)
+    assert res.status_code == 200
+    schedule = res.json()
+    assert schedule["paid_installments"] == 2
+    assert schedule["remaining_installments"] == 5
+    assert schedule["installments_saved"] == 3
+    assert float(schedule["remaining_amount"]) == 450
+    assert float(schedule["next_due_amount"]) == 50
+    assert [row["status"] for row in schedule["schedule"]] == ["PAID", "PAID", "PARTIAL", "UPCOMING", "UPCOMING", "UPCOMING", "UPCOMING"]
+    assert all(row["due_date"].endswith("-15") for row in schedule["schedule"])
+
+    what_if = await client.post(f"/loans/{loan_id}/what-if", json={"prepayment": 200, "monthly_extra": 50}, headers=headers)
+    assert what_if.status_code == 200
+    assert what_if.json()["scenario"]["remaining_installments"] == 2
+    assert what_if.json()["installments_saved"] == 3
+    assert what_if.json()["months_earlier"] == 3
+
+    # A new payment drops the cached schedule.
+    await client.post("/payments/", json={"loan_id": loan_id, "amount": 50, "type": "installment"}, headers=headers)
+    schedules = (await client.get("/loans/schedules", headers=headers)).json()
+    assert [s["paid_installments"] for s in schedules] == [3]
+
+    token2, _ = await create_test_user(client, "schedule2@wp.pl", "scheduleuser2", "password123")
+    foreign = await client.get(f"/loans/{loan_id}/schedule", headers={"Authorization": f"Bearer {token2}"})
+    assert foreign.status_code == 404
+
+@pytest.mark.anyio
+async def test_loan_schedule_keeps_large_final_installment(client: AsyncClient):
+    """The schedule follows the planned installments, so a balloon payment stays the last one."""
+    token, _ = await create_test_user(client, "balloon@wp.pl", "balloonuser", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    loan_payload = {"name": "Balon", "total_amount": 12000.00, "installments_count": 12, "due_day": 10, "installment_amount": 500.00}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+
+    schedule = (await client.get(f"/loans/{loan_id}/schedule", headers=headers)).json()
+    assert len(schedule["schedule"]) == 12
+    assert float(schedule["schedule"][-1]["amount"]) == 6500
+
+    await client.post("/payments/", json={"loan_id": loan_id, "amount": 5500, "type": "installment"}, headers=headers)
+    schedule = (await client.get(f"/loans/{loan_id}/schedule", headers=headers)).json()
+    assert schedule["paid_installments"] == 11
+    assert schedule["remaining_installments"] == 1
+    assert float(schedule["next_due_amount"]) == 6500
+
+@pytest.mark.anyio
+async def test_loan_schedule_huge_total_with_tiny_installment(client: AsyncClient):
+    """The projection never runs past installments_count, whatever the what-if scenario."""
+    token, _ = await create_test_user(client, "tiny@wp.pl", "tinyuser", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    loan_payload = {"name": "Duzy", "total_amount": 1000000.00, "installments_count": 12, "due_day": 1, "installment_amount": 10.00}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+
+    schedules = await client.get("/loans/schedules", headers=headers)
+    assert schedules.status_code == 200
+    assert [s["remaining_installments"] for s in schedules.json()] == [12]
+
+    what_if = await client.post(f"/loans/{loan_id}/what-if", json={"monthly_extra": 1}, headers=headers)
+    assert what_if.status_code == 200
+    assert what_if.json()["scenario"]["remaining_installments"] == 12
+    assert what_if.json()["months_earlier"] == 0
@@ -42,3 +42,37 @@ async def test_loan_financial_integration(client: AsyncClient):
     assert Decimal(str(loan_data["remaining"])) == Decimal("500.00")
     assert Decimal(str(loan_data["total_installments_paid"])) == Decimal("200.00")
     assert Decimal(str(loan_data["total_prepayments"])) == Decimal("300.00")
+
+@pytest.mark.anyio
+async def test_loan_status_follows_payment_writes(client: AsyncClient):
+    """The maintained totals behind /loans/status move with payment insert, update and delete."""
+    email, password = "status@wp.pl", "secure_pass"
+    await client.post("/auth/register", json={"email": email, "login": "statususer", "password": password})
+    login_res = await client.post("/auth/login", json={"identifier": email, "password": password})
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+    loan_payload = {"name": "Kredyt", "total_amount": 1000.00, "installments_count": 10, "due_day": 15, "installment_amount": 100.00}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+
+    empty = (await client.get("/loans/status", headers=headers)).json()
+    assert Decimal(str(empty[0]["total_paid"])) == Decimal("0")
+    assert empty[0]["last_paid_at"] is None
+
+    first = await client.post("/payments/", json={"loan_id": loan_id, "amount": 100, "type": "installment", "paid_at": "2026-01-15"}, headers=headers)
+    second = await client.post("/payments/", json={"loan_id": loan_id, "amount": 250, "type": "installment", "paid_at": "2026-02-15"}, headers=headers)
+    await client.patch(f"/payments/{second.json()['payment_id']}", json={"type": "prepayment"}, headers=headers)
+
+    loan = (await client.get("/loans/status", headers=headers)).json()[0]
+    assert Decimal(str(loan["total_installments_paid"])) == Decimal("100.00")
+    assert Decimal(str(loan["total_prepayments"])) == Decimal("250.00")
+    assert Decimal(str(loan["remaining"])) == Decimal("650.00")
+    assert loan["last_paid_at"] == "2026-02-15"
+
+    await client.delete(f"/payments/{second.json()['payment_id']}", headers=headers)
+    await client.delete(f"/payments/{first.json()['payment_id']}", headers=headers)
+    loan = (await client.get("/loans/status", headers=headers)).json()[0]
+    assert Decimal(str(loan["total_paid"])) == Decimal("0")
+    assert loan["last_paid_at"] is None
+
+    foreign = await client.get("/loans/loan_status/11111111-1111-1111-1111-111111111111", headers=headers)
+    assert foreign.status_code == 403
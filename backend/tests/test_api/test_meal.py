@@ -0,0 +1,160 @@
+import pytest
+import uuid
+from httpx import AsyncClient
+
+async def get_auth_data(client: AsyncClient):
+    """Auxiliary function for authorization (same as in test_vehicle)."""
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"meal_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+@pytest.mark.anyio
+async def test_dictionary_etag_returns_not_modified(client: AsyncClient):
+    """A repeated request with the received ETag is answered with 304 and no body."""
+    headers, _ = await get_auth_data(client)
+    await client.post("/meals/proteins/", json={"name": "Kurczak", "category": "Mięso białe"}, headers=headers)
+
+    first = await client.get("/meals/proteins/all", headers=headers)
+    assert first.status_code == 200
+    assert [p["name"] for p in first.json()] == ["Kurczak"]
+    etag = first.headers["etag"]
+
+    second = await client.get("/meals/proteins/all", headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+@pytest.mark.anyio
+async def test_dictionary_writes_invalidate_cache(client: AsyncClient):
+    """Create, patch and delete on a dictionary change its ETag and content."""
+    headers, _ = await get_auth_data(client)
+
+    first = await client.get("/meals/bases/all", headers=headers)
+    assert first.json() == []
+    etag = first.headers["etag"]
+
+    create_res = await client.post("/meals/bases/", json={"name": "Ryż", "category": "Zbożowe"}, headers=headers)
+    base_id = create_res.json()["id"]
+
+    after_create = await client.get("/meals/bases/all", headers={**headers, "If-None-Match": etag})
+    assert after_create.status_code == 200
+    assert [b["name"] for b in after_create.json()] == ["Ryż"]
+
+    await client.patch(f"/meals/bases/{base_id}", json={"name": "Ryż basmati"}, headers=headers)
+    after_patch = await client.get("/meals/bases/all", headers=headers)
+    assert [b["name"] for b in after_patch.json()] == ["Ryż basmati"]
+
+    await client.delete(f"/meals/bases/{base_id}", headers=headers)
+    after_delete = await client.get("/meals/bases/all", headers=headers)
+    assert after_delete.json() == []
+
+@pytest.mark.anyio
+async def test_ingredient_dictionary_is_cached_and_invalidated(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+
+    first = await client.get("/meals/ingredients/", headers=headers)
+    etag = first.headers["etag"]
+
+    await client.post("/meals/ingredients/", json={"name": "Cebula", "category": "Warzywa", "unit": "szt"}, headers=headers)
+
+    res = await client.get("/meals/ingredients/", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["name"] == "Cebula"
+    assert res.headers["etag"] != etag
+
+@pytest.mark.anyio
+async def test_setup_defaults_seeds_starter_meals_once(client: AsyncClient, db_session):
+    """Starter meals are created with their recipes and the second call is a no-op."""
+    headers, user_id = await get_auth_data(client)
+
+    res = await client.post("/settings/meals/setup-defaults", headers=headers)
+    assert res.status_code == 200
+    assert res.json()["status"] == "created"
+
+    meals = (await client.get("/meals/", headers=headers)).json()
+    assert len(meals) == 20
+    assert all(m["protein_type"] and m["base_type"] for m in meals)
+
+    curry = next(m for m in meals if m["name"] == "Kurczak w curry z ryżem")
+    recipe = (await client.get(f"/meals/ingredients/{curry['id']}", headers=headers)).json()
+    assert sorted(r["ingredient"]["name"] for r in recipe) == [
+        "Cebula", "Curry (przyprawa)", "Kurczak (pierś)", "Ryż basmati"
+    ]
+
+    again = await client.post("/settings/meals/setup-defaults", headers=headers)
+    assert again.json()["status"] == "skipped"
+
+@pytest.mark.anyio
+async def test_setup_defaults_reuses_existing_dictionaries(client: AsyncClient):
+    """A second user gets full recipes linked to the ingredients created for the first one."""
+    headers_a, _ = await get_auth_data(client)
+    headers_b, _ = await get_auth_data(client)
+
+    await client.get("/meals/ingredients/", headers=headers_a)
+    await client.post("/settings/meals/setup-defaults", headers=headers_a)
+    res = await client.post("/settings/meals/setup-defaults", headers=headers_b)
+    assert res.json()["status"] == "created"
+
+    ingredients = (await client.get("/meals/ingredients/", headers=headers_b)).json()
+    assert len(ingredients) == 35
+
+    meals = (await client.get("/meals/", headers=headers_b)).json()
+    lasagne = next(m for m in meals if m["name"] == "Lasagne")
+    recipe = (await client.get(f"/meals/ingredients/{lasagne['id']}", headers=headers_b)).json()
+    assert len(recipe) == 4
+
+async def create_dictionaries(client: AsyncClient, headers: dict):
+    protein = await client.post("/meals/proteins/", json={"name": f"Białko {uuid.uuid4().hex[:6]}", "category": "Mięso"}, headers=headers)
+    base = await client.post("/meals/bases/", json={"name": f"Baza {uuid.uuid4().hex[:6]}", "category": "Zbożowe"}, headers=headers)
+    return protein.json()["id"], base.json()["id"]
+
+@pytest.mark.anyio
+async def test_list_meals_keyset_pagination(client: AsyncClient):
+    """Pages follow the name order and the cursor is handed over in X-Next-Cursor."""
+    headers, _ = await get_auth_data(client)
+    protein_id, base_id = await create_dictionaries(client, headers)
+
+    for name in ["Dorsz", "Alfredo", "Curry", "Bigos", "Eintopf"]:
+        await client.post("/meals/", json={"id_protein_type": protein_id, "id_base_type": base_id, "name": name}, headers=headers)
+
+    names, cursor = [], None
+    while True:
+        params = {"limit": 2, "fields": "id,name"}
+        if cursor:
+            params["cursor"] = cursor
+        res = await client.get("/meals/", params=params, headers=headers)
+        assert res.status_code == 200
+        page = res.json()
+        assert all(set(item) == {"id", "name"} for item in page)
+        names.extend(item["name"] for item in page)
+        cursor = res.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert names == ["Alfredo", "Bigos", "Curry", "Dorsz", "Eintopf"]
+
+@pytest.mark.anyio
+async def test_list_meals_filters_and_default_shape(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    protein_a, base_a = await create_dictionaries(client, headers)
+    protein_b, _ = await create_dictionaries(client, headers)
+
+    await client.post("/meals/", json={"id_protein_type": protein_a, "id_base_type": base_a, "name": "Schabowy", "is_weekend_dish": True}, headers=headers)
+    await client.post("/meals/", json={"id_protein_type": protein_b, "id_base_type": base_a, "name": "Pulpety"}, headers=headers)
+
+    weekend = (await client.get("/meals/", params={"is_weekend_dish": True}, headers=headers)).json()
+    assert [m["name"] for m in weekend] == ["Schabowy"]
+    assert weekend[0]["protein_type"]["id"] == protein_a
+    assert "description" in weekend[0]
+
+    by_protein = (await client.get("/meals/", params={"protein_id": protein_b}, headers=headers)).json()
+    assert [m["name"] for m in by_protein] == ["Pulpety"]
+
+    by_name = (await client.get("/meals/", params={"name": "pul"}, headers=headers)).json()
+    assert [m["name"] for m in by_name] == ["Pulpety"]
+
+    bad = await client.get("/meals/", params={"fields": "id,password"}, headers=headers)
+    assert bad.status_code == 400
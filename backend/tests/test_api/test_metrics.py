@@ -0,0 +1,71 @@
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+
+from app.core import observability
+from app.core.config import get_settings
+
+async def get_auth_data(client: AsyncClient):
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"metrics_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+def sample(body: str, prefix: str) -> float:
+    return sum(float(line.rsplit(" ", 1)[1]) for line in body.splitlines() if line.startswith(prefix))
+
+@pytest.mark.anyio
+async def test_metrics_report_latency_and_queries_per_route(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    await client.get("/vehicles/", headers=headers)
+
+    res = await client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+    body = res.text
+
+    assert 'http_request_duration_seconds_count{method="GET",route="/vehicles/",status="200"}' in body
+    assert sample(body, 'http_request_db_queries_sum{method="GET",route="/vehicles/"}') > 0
+    assert sample(body, 'http_request_db_queries_count{method="POST",route="/auth/login"}') >= 1
+
+@pytest.mark.anyio
+async def test_profile_header_is_ignored_when_profiling_disabled(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    res = await client.get("/vehicles/", headers={**headers, "X-Profile": "1"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/json")
+
+@pytest.mark.anyio
+async def test_metrics_are_limited_to_allowlisted_clients(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(get_settings(), "metrics_allowlist", ["10.0.0.0/8"])
+    res = await client.get("/metrics")
+    assert res.status_code == 403
+
+@pytest.mark.anyio
+async def test_profiler_starts_only_for_the_profiling_token(monkeypatch):
+    started = []
+
+    class FakeProfiler:
+        def __init__(self, **kwargs):
+            pass
+
+        def start(self):
+            started.append(True)
+
+        def stop(self):
+            pass
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    monkeypatch.setattr(observability, "Profiler", FakeProfiler)
+    middleware = observability.ObservabilityMiddleware(app, profiling_enabled=True, profiling_token="secret")
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://testserver") as ac:
+        assert (await ac.get("/", headers={"X-Profile": "1"})).status_code == 200
+        assert started == []
+        await ac.get("/", headers={"X-Profile": "secret"})
+        assert started == [True]
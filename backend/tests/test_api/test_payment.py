@@ -135,4 +135,57 @@ async def test_payments_multiple_for_loan(client: AsyncClient, db_session):
 
     res_get_empty = await client.get(f"/payments/loan/{loan_id}", headers=headers)
     assert res_get_empty.status_code == 200
-    assert res_get_empty.json() == []
\ No newline at end of file
+    assert res_get_empty.json() == []
+
+@pytest.mark.anyio
+async def test_bulk_payments_json_csv_and_missed_installments(client: AsyncClient):
+    """Bulk imports skip already recorded payments and keep the loan totals in step."""
+    token, _ = await create_test_user(client, "bulk_pay@wp.pl", "bulkpayuser", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    loan_id = await create_test_loan(client, token)
+
+    batch = [
+        {"loan_id": loan_id, "amount": 200, "type": "installment", "paid_at": "2025-01-10"},
+        {"loan_id": loan_id, "amount": 200, "type": "installment", "paid_at": "2025-02-10"},
+        {"loan_id": loan_id, "amount": 200, "type": "installment", "paid_at": "2025-02-10"},
+    ]
+    res = await client.post("/payments/bulk", json=batch, headers=headers)
+    assert res.status_code == 201
+    assert (res.json()["inserted"], res.json()["skipped"]) == (2, 1)
+
+    undated = [{"loan_id": loan_id, "amount": 75, "type": "prepayment", "paid_at": None}] * 2
+    res = await client.post("/payments/bulk", json=undated, headers=headers)
+    assert res.status_code == 201
+    assert (res.json()["inserted"], res.json()["skipped"]) == (1, 1)
+
+    csv_content = "paid_at;amount;type\n2025-02-10;200,00;installment\n2025-03-05;150,00;prepayment\n"
+    res = await client.post(
+        "/payments/bulk/csv", params={"loan_id": loan_id},
+        files={"file": ("payments.csv", csv_content, "text/csv")}, headers=headers,
+    )
+    assert res.status_code == 201
+    assert (res.json()["inserted"], res.json()["skipped"]) == (1, 1)
+
+    res = await client.post(
+        f"/payments/loan/{loan_id}/missed-installments",
+        params={"since": "2025-01-01", "until": "2025-05-31"}, headers=headers,
+    )
+    assert res.json()["inserted"] == 3
+
+    payments = (await client.get(f"/payments/loan/{loan_id}", headers=headers)).json()
+    installments = sorted(p["paid_at"] for p in payments if p["type"] == "installment")
+    assert installments == ["2025-01-10", "2025-02-10", "2025-03-10", "2025-04-10", "2025-05-10"]
+
+    status_res = (await client.get("/loans/status", headers=headers)).json()[0]
+    assert Decimal(str(status_res["total_installments_paid"])) == Decimal("1000.00")
+    assert Decimal(str(status_res["total_prepayments"])) == Decimal("225.00")
+
+    bad_csv = await client.post(
+        "/payments/bulk/csv", params={"loan_id": loan_id},
+        files={"file": ("payments.csv", "paid_at;amount;type\n2025-06-10;200;bonus\n", "text/csv")}, headers=headers,
+    )
+    assert bad_csv.status_code == 400
+
+    token2, _ = await create_test_user(client, "bulk_pay2@wp.pl", "bulkpayuser2", "password123")
+    foreign = await client.post("/payments/bulk", json=batch[:1], headers={"Authorization": f"Bearer {token2}"})
+    assert foreign.status_code == 404
@@ -0,0 +1,54 @@
+import pytest
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from httpx import AsyncClient
+
+from app.core.responses import trusted_response, _list_adapter
+from app.db.models.finance import TransactionRead
+
+async def get_auth_data(client: AsyncClient):
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"resp_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+def test_trusted_construction_matches_validation():
+    """The fast path produces the same JSON as validating through the response model."""
+    category = SimpleNamespace(id=uuid.uuid4(), name="Paliwo")
+    rows = [
+        SimpleNamespace(id=uuid.uuid4(), date=datetime(2025, 3, 1, 12, tzinfo=timezone.utc), amount=Decimal("-120.50"),
+                        title="Orlen", category_id=category.id, category=category, raw_hash="x"),
+        SimpleNamespace(id=uuid.uuid4(), date=datetime(2025, 3, 2, tzinfo=timezone.utc), amount=Decimal("5000.00"),
+                        title="Pensja", category_id=None, category=None, raw_hash="y"),
+    ]
+    adapter = _list_adapter(TransactionRead)
+    validated = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    assert trusted_response(TransactionRead, rows).body == validated
+
+@pytest.mark.anyio
+async def test_large_responses_are_compressed(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    await client.post("/settings/meals/setup-defaults", headers=headers)
+
+    res = await client.get("/meals/", headers={**headers, "Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert len(res.json()) == 20
+
+    small = await client.get("/meals/", params={"limit": 1, "fields": "id"}, headers={**headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.headers["x-next-cursor"]
+
+@pytest.mark.anyio
+async def test_brotli_for_clients_that_accept_it(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    await client.post("/settings/meals/setup-defaults", headers=headers)
+
+    res = await client.get("/meals/", headers={**headers, "Accept-Encoding": "br, gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "br"
+    assert len(res.json()) == 20
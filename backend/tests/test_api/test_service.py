@@ -1,6 +1,7 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import select
 from app.db.models.service_event import ServiceEvent
 
@@ -241,4 +242,192 @@ async def test_service_mileage_cannot_be_lower_than_vehicle_mileage(client: Asyn
     res = await client.post("/services/events", json=event_payload, headers=headers)
     
     assert res.status_code == 400
-    assert "Mileage at service cannot be lower" in res.json()["detail"]
\ No newline at end of file
+    assert "Mileage at service cannot be lower" in res.json()["detail"]
+
+@pytest.mark.anyio
+async def test_services_due_projects_mileage_and_follows_fuel_writes(client: AsyncClient):
+    """The km interval is turned into a date from the fuel log mileage rate and refreshed by new logs."""
+    headers, _ = await get_auth_data(client)
+    now = datetime.now(timezone.utc)
+
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Dacia", "model": "Duster", "production_year": 2021,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"LU {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Petrol", "current_mileage": 5000
+    })
+    vehicle_id = v_res.json()["vehicle_id"]
+
+    async def add_fuel(days_ago, mileage):
+        await client.post(f"/vehicles/{vehicle_id}/fuel/", headers=headers, json={
+            "vehicle_id": vehicle_id, "date": (now - timedelta(days=days_ago)).isoformat(),
+            "mileage": mileage, "fuel_type": "Petrol", "liters": 40, "price_per_liter": 6
+        })
+
+    await add_fuel(110, 5000)
+    await add_fuel(10, 10000)
+
+    e_res = await client.post("/services/events", headers=headers, json={
+        "vehicle_id": vehicle_id, "service_date": (now - timedelta(days=10)).isoformat(), "mileage_at_service": 10000
+    })
+    event_id = e_res.json()["event_id"]
+    for item in [
+        {"type": "Olej", "description": "Wymiana oleju", "interval_km": 15000, "interval_months": 12},
+        {"type": "Klima", "description": "Serwis klimatyzacji", "interval_km": None, "interval_months": 6},
+    ]:
+        await client.post("/services/items", headers=headers, json={
+            "service_event_id": event_id, "cost": 200, "is_recurring": True, **item
+        })
+
+    res = await client.get("/services/due", headers=headers)
+    assert res.status_code == 200
+    due = res.json()
+    assert [d["type"] for d in due] == ["Klima", "Olej"]
+    oil = due[1]
+    assert oil["km_per_day"] == pytest.approx(50.0)
+    assert oil["due_mileage"] == 25000
+    assert 289 <= oil["days_remaining"] <= 291
+
+    await add_fuel(0, 15000)
+
+    due = (await client.get("/services/due", params={"vehicle_id": vehicle_id}, headers=headers)).json()
+    assert [d["type"] for d in due] == ["Olej", "Klima"]
+    assert due[0]["km_remaining"] == 10000
+    assert 109 <= due[0]["days_remaining"] <= 111
+
+@pytest.mark.anyio
+async def test_item_and_event_writes_keep_totals_and_vehicle_cache(client: AsyncClient):
+    """Item writes shift the event total by their delta; event writes move the vehicle's last service."""
+    headers, _ = await get_auth_data(client)
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Fiat", "model": "Tipo", "production_year": 2019,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"SK {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Petrol", "current_mileage": 60000
+    })
+    vehicle_id = v_res.json()["vehicle_id"]
+
+    first = await client.post("/services/events", headers=headers, json={
+        "vehicle_id": vehicle_id, "service_date": "2024-01-10", "mileage_at_service": 60000
+    })
+    second = await client.post("/services/events", headers=headers, json={
+        "vehicle_id": vehicle_id, "service_date": "2024-06-10", "mileage_at_service": 70000
+    })
+    event_id = second.json()["event_id"]
+
+    item_ids = []
+    for cost in ["100.00", "50.25"]:
+        res = await client.post("/services/items", headers=headers, json={
+            "service_event_id": event_id, "type": "Części", "description": "Filtr", "cost": cost
+        })
+        item_ids.append(res.json()["item_id"])
+
+    await client.patch(f"/services/items/{item_ids[0]}", json={"cost": "80.00"}, headers=headers)
+    await client.delete(f"/services/items/{item_ids[1]}", headers=headers)
+
+    history = (await client.get(f"/services/vehicle/{vehicle_id}", headers=headers)).json()
+    latest = next(e for e in history if e["id"] == event_id)
+    assert float(latest["total_cost"]) == 80.0
+
+    vehicle = (await client.get(f"/vehicles/{vehicle_id}", headers=headers)).json()
+    assert vehicle["last_service_mileage"] == 70000
+    assert vehicle["current_mileage"] == 70000
+
+    await client.delete(f"/services/events/{event_id}", headers=headers)
+    vehicle = (await client.get(f"/vehicles/{vehicle_id}", headers=headers)).json()
+    assert vehicle["last_service_mileage"] == 60000
+    assert vehicle["last_service_date"].startswith("2024-01-10")
+    assert vehicle["current_mileage"] == 70000
+    assert first.status_code == 201
+
+@pytest.mark.anyio
+async def test_create_event_with_items_in_one_request(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Seat", "model": "Leon", "production_year": 2020,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"PZ {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Petrol", "current_mileage": 40000
+    })
+    vehicle_id = v_res.json()["vehicle_id"]
+
+    items = [
+        {"type": "Części", "description": f"Pozycja {i}", "cost": "10.50", "is_recurring": i == 0, "interval_km": 15000 if i == 0 else None}
+        for i in range(15)
+    ]
+    res = await client.post("/services/events/with-items", headers=headers, json={
+        "vehicle_id": vehicle_id, "service_date": "2024-05-01", "mileage_at_service": 41000,
+        "notes": "Faktura", "items": items
+    })
+    assert res.status_code == 201
+    data = res.json()
+    assert len(data["item_ids"]) == 15
+    assert float(data["total_cost"]) == 157.5
+
+    history = (await client.get(f"/services/vehicle/{vehicle_id}", headers=headers)).json()
+    assert len(history) == 1
+    assert sorted(i["id"] for i in history[0]["items"]) == sorted(data["item_ids"])
+    assert float(history[0]["total_cost"]) == 157.5
+
+    vehicle = (await client.get(f"/vehicles/{vehicle_id}", headers=headers)).json()
+    assert vehicle["current_mileage"] == 41000
+    assert vehicle["last_service_mileage"] == 41000
+
+    lower = await client.post("/services/events/with-items", headers=headers, json={
+        "vehicle_id": vehicle_id, "service_date": "2024-06-01", "mileage_at_service": 100, "items": items
+    })
+    assert lower.status_code == 400
+
+    other_headers, _ = await get_auth_data(client)
+    foreign = await client.post("/services/events/with-items", headers=other_headers, json={
+        "vehicle_id": vehicle_id, "service_date": "2024-06-01", "mileage_at_service": 42000, "items": []
+    })
+    assert foreign.status_code == 404
+
+@pytest.mark.anyio
+async def test_vehicle_history_pages_filters_and_yearly_totals(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Volvo", "model": "V60", "production_year": 2016,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"WE {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Diesel", "current_mileage": 100000
+    })
+    vehicle_id = v_res.json()["vehicle_id"]
+
+    visits = [("2022-03-01", 100000), ("2023-03-01", 110000), ("2023-09-01", 115000), ("2024-03-01", 120000)]
+    for service_date, mileage in visits:
+        await client.post("/services/events/with-items", headers=headers, json={
+            "vehicle_id": vehicle_id, "service_date": service_date, "mileage_at_service": mileage,
+            "items": [
+                {"type": "Olej", "description": "Olej", "cost": "200.00"},
+                {"type": "Filtr", "description": "Filtr powietrza", "cost": "50.00"},
+            ],
+        })
+
+    dates, cursor = [], None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        res = await client.get(f"/services/vehicle/{vehicle_id}", params=params, headers=headers)
+        assert res.status_code == 200
+        dates.extend(e["service_date"][:10] for e in res.json())
+        cursor = res.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert dates == [d for d, _ in reversed(visits)]
+
+    filtered = (await client.get(f"/services/vehicle/{vehicle_id}", params={"item_type": "Filtr"}, headers=headers)).json()
+    assert len(filtered) == 4
+    assert all([i["type"] for i in e["items"]] == ["Filtr"] for e in filtered)
+
+    yearly = (await client.get(f"/services/vehicle/{vehicle_id}/yearly", headers=headers)).json()
+    assert [(y["year"], y["events_count"], float(y["total_cost"])) for y in yearly] == [
+        (2024, 1, 250.0), (2023, 2, 500.0), (2022, 1, 250.0)
+    ]
+    oil = (await client.get(f"/services/vehicle/{vehicle_id}/yearly", params={"item_type": "Olej"}, headers=headers)).json()
+    assert float(oil[1]["total_cost"]) == 400.0
+
+    other_headers, _ = await get_auth_data(client)
+    assert (await client.get(f"/services/vehicle/{vehicle_id}", headers=other_headers)).json() == []
+    assert (await client.get(f"/services/vehicle/{vehicle_id}/yearly", headers=other_headers)).json() == []
+
+    bad = await client.get(f"/services/vehicle/{vehicle_id}", params={"cursor": "nope"}, headers=headers)
+    assert bad.status_code == 400
@@ -0,0 +1,100 @@
+import pytest
+import uuid
+from datetime import date
+from decimal import Decimal
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.db.models.timeline import TimelineMonthly, TimelineStaleMonth
+
+async def get_auth_data(client: AsyncClient):
+    unique_id = uuid.uuid4().hex[:6]
+    user_data = {"email": f"timeline_{unique_id}@wp.pl", "login": f"user_{unique_id}", "password": "password123"}
+    await client.post("/auth/register", json=user_data)
+    login_res = await client.post("/auth/login", json={"identifier": user_data["email"], "password": user_data["password"]})
+    data = login_res.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["user_id"]
+
+@pytest.mark.anyio
+async def test_timeline_buckets_sources_per_month(client: AsyncClient):
+    """Loan payments, fuel and service costs land in monthly buckets and follow later writes."""
+    headers, _ = await get_auth_data(client)
+
+    loan_payload = {"name": "Hipoteka", "total_amount": 1000, "installments_count": 10, "due_day": 10, "installment_amount": 100}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+    await client.post("/payments/bulk", json=[
+        {"loan_id": loan_id, "amount": 100, "type": "installment", "paid_at": "2025-01-10"},
+        {"loan_id": loan_id, "amount": 100, "type": "installment", "paid_at": "2025-02-10"},
+    ], headers=headers)
+
+    vehicle_payload = {
+        "brand": "Skoda", "model": "Octavia", "production_year": 2018, "vin": f"VIN{uuid.uuid4().hex[:14].upper()}",
+        "registration_number": f"KR{uuid.uuid4().hex[:5].upper()}", "fuel_type": "PB95", "current_mileage": 100000,
+    }
+    vehicle_id = (await client.post("/vehicles/", json=vehicle_payload, headers=headers)).json()["vehicle_id"]
+    await client.post(f"/vehicles/{vehicle_id}/fuel/", json={
+        "vehicle_id": vehicle_id, "date": "2025-01-20T10:00:00Z", "mileage": 100500,
+        "fuel_type": "PB95", "liters": 40, "price_per_liter": 6.5,
+    }, headers=headers)
+
+    timeline = (await client.get("/timeline/", headers=headers)).json()
+    assert [m["month"] for m in timeline["months"]] == ["2025-01-01", "2025-02-01"]
+    january = timeline["months"][0]
+    assert {(b["source"], b["category"]) for b in january["buckets"]} == {("loans", "Hipoteka"), ("fuel", "Skoda Octavia")}
+    assert Decimal(january["expense"]) == Decimal("360.00")
+    assert Decimal(timeline["months"][1]["cumulative_net"]) == Decimal("-460.00")
+
+    await client.post("/services/events", json={
+        "vehicle_id": vehicle_id, "service_date": "2025-02-05T09:00:00Z", "mileage_at_service": 101000,
+    }, headers=headers)
+    await client.post("/payments/", json={"loan_id": loan_id, "amount": 250, "type": "prepayment", "paid_at": "2025-02-20"}, headers=headers)
+
+    february = (await client.get("/timeline/", params={"date_from": "2025-02-01", "sources": ["loans"]}, headers=headers)).json()
+    assert len(february["months"]) == 1
+    assert Decimal(february["expense"]) == Decimal("350.00")
+
+    bad = await client.get("/timeline/", params={"sources": ["lottery"]}, headers=headers)
+    assert bad.status_code == 400
+
+@pytest.mark.anyio
+async def test_timeline_recomputes_only_touched_months(client: AsyncClient, db_session):
+    """Writes queue their months in the database; a read recomputes those and leaves the rest alone."""
+    headers, user_id = await get_auth_data(client)
+
+    loan_payload = {"name": "Raty", "total_amount": 1000, "installments_count": 10, "due_day": 10, "installment_amount": 100}
+    loan_id = (await client.post("/loans/", json=loan_payload, headers=headers)).json()["loan_id"]
+    await client.post("/payments/bulk", json=[
+        {"loan_id": loan_id, "amount": 100, "type": "installment", "paid_at": "2025-01-10"},
+        {"loan_id": loan_id, "amount": 100, "type": "installment", "paid_at": "2025-03-10"},
+    ], headers=headers)
+
+    async def stale_months():
+        result = await db_session.execute(select(TimelineStaleMonth.month).where(TimelineStaleMonth.user_id == uuid.UUID(user_id)))
+        return sorted(m.isoformat() for m in result.scalars())
+
+    assert await stale_months() == ["2025-01-01", "2025-03-01"]
+    await client.get("/timeline/", headers=headers)
+    assert await stale_months() == []
+
+    computed_at = dict((await db_session.execute(
+        select(TimelineMonthly.month, TimelineMonthly.computed_at).where(TimelineMonthly.user_id == uuid.UUID(user_id))
+    )).all())
+    payment_id = (await client.post("/payments/", json={"loan_id": loan_id, "amount": 50, "type": "prepayment", "paid_at": "2025-03-20"}, headers=headers)).json()["payment_id"]
+    await client.patch(f"/payments/{payment_id}", json={"paid_at": "2025-04-20"}, headers=headers)
+    assert await stale_months() == ["2025-03-01", "2025-04-01"]
+
+    timeline = (await client.get("/timeline/", headers=headers)).json()
+    assert [(m["month"], Decimal(m["expense"])) for m in timeline["months"]] == [
+        ("2025-01-01", Decimal("100.00")), ("2025-03-01", Decimal("100.00")), ("2025-04-01", Decimal("50.00")),
+    ]
+    db_session.expire_all()
+    january = (await db_session.execute(
+        select(TimelineMonthly.computed_at).where(TimelineMonthly.user_id == uuid.UUID(user_id), TimelineMonthly.month == date(2025, 1, 1))
+    )).scalar_one()
+    assert january == computed_at[date(2025, 1, 1)]
+
+    # Renaming the loan regroups every month it appears in.
+    await client.patch(f"/loans/{loan_id}", json={"name": "Kredyt"}, headers=headers)
+    assert await stale_months() == ["2025-01-01", "2025-03-01", "2025-04-01"]
+    timeline = (await client.get("/timeline/", params={"sources": ["loans"]}, headers=headers)).json()
+    assert {b["category"] for m in timeline["months"] for b in m["buckets"]} == {"Kredyt"}
@@ -1,6 +1,7 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import select
 from app.db.models.vehicle import Vehicle
 
@@ -139,4 +140,97 @@ async def test_delete_vehicle_cascades_to_services(client: AsyncClient, db_sessi
     await client.delete(f"/vehicles/{v_id}", headers=headers)
 
     history_res = await client.get(f"/services/vehicle/{v_id}", headers=headers)
-    assert history_res.status_code == 404 or history_res.json() == []
\ No newline at end of file
+    assert history_res.status_code == 404 or history_res.json() == []
+
+@pytest.mark.anyio
+async def test_vehicle_dashboard_aggregates_vehicle_data(client: AsyncClient):
+    """One request returns the vehicle with its fuel stats, policy, inspection and recent services."""
+    headers, _ = await get_auth_data(client)
+    v_res = await client.post("/vehicles/", headers=headers, json={
+        "brand": "Skoda", "model": "Octavia", "production_year": 2019,
+        "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"KR {uuid.uuid4().hex[:5]}",
+        "fuel_type": "Diesel", "current_mileage": 90000
+    })
+    v_id = v_res.json()["vehicle_id"]
+    now = datetime.now(timezone.utc)
+
+    for mileage, liters in [(90000, 45), (90800, 40)]:
+        await client.post(f"/vehicles/{v_id}/fuel/", headers=headers, json={
+            "vehicle_id": v_id, "date": (now - timedelta(days=(91000 - mileage) // 100)).isoformat(),
+            "mileage": mileage, "fuel_type": "Diesel", "liters": liters, "price_per_liter": 6
+        })
+    await client.post(f"/vehicles/{v_id}/insurance/", headers=headers, json={
+        "vehicle_id": v_id, "policy_number": "OC-1", "insurer_name": "PZU",
+        "start_date": (now - timedelta(days=30)).isoformat(), "end_date": (now + timedelta(days=335)).isoformat(),
+        "total_cost": 900, "policy_type": "OC"
+    })
+    await client.post(f"/vehicles/{v_id}/inspections/", headers=headers, json={
+        "vehicle_id": v_id, "inspection_date": now.isoformat(),
+        "expiration_date": (now + timedelta(days=365)).isoformat(), "current_mileage": 90800, "cost": 149
+    })
+    for mileage in [90100, 90500]:
+        await client.post("/services/events", headers=headers, json={
+            "vehicle_id": v_id, "service_date": (now - timedelta(days=(91000 - mileage) // 100)).isoformat(),
+            "mileage_at_service": mileage
+        })
+
+    res = await client.get(f"/vehicles/{v_id}/dashboard", params={"recent_services": 1}, headers=headers)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["vehicle"]["id"] == v_id
+    assert data["fuel_stats"]["entries_count"] == 2
+    assert data["fuel_stats"]["average_consumption"] == 5.0
+    assert data["insurance"]["policy_number"] == "OC-1"
+    assert data["insurance"]["status"] == "ACTIVE"
+    assert data["inspection"]["current_mileage"] == 90800
+    assert [s["mileage_at_service"] for s in data["recent_services"]] == [90500]
+
+    other_headers, _ = await get_auth_data(client)
+    forbidden = await client.get(f"/vehicles/{v_id}/dashboard", headers=other_headers)
+    assert forbidden.status_code == 404
+
+@pytest.mark.anyio
+async def test_vehicles_overview_lists_latest_data_per_vehicle(client: AsyncClient):
+    headers, _ = await get_auth_data(client)
+    now = datetime.now(timezone.utc)
+    vehicle_ids = []
+    for brand in ["Opel", "Kia"]:
+        v_res = await client.post("/vehicles/", headers=headers, json={
+            "brand": brand, "model": "Test", "production_year": 2018,
+            "vin": f"VIN{uuid.uuid4().hex[:14]}", "registration_number": f"WA {uuid.uuid4().hex[:5]}",
+            "fuel_type": "Petrol", "current_mileage": 50000
+        })
+        vehicle_ids.append(v_res.json()["vehicle_id"])
+    opel_id = vehicle_ids[0]
+
+    for days_ago, mileage in [(3, 50200), (1, 50600)]:
+        await client.post(f"/vehicles/{opel_id}/fuel/", headers=headers, json={
+            "vehicle_id": opel_id, "date": (now - timedelta(days=days_ago)).isoformat(),
+            "mileage": mileage, "fuel_type": "Petrol", "liters": 10, "price_per_liter": 6
+        })
+    await client.post(f"/vehicles/{opel_id}/insurance/", headers=headers, json={
+        "vehicle_id": opel_id, "policy_number": "OC-2", "insurer_name": "Warta",
+        "start_date": (now - timedelta(days=350)).isoformat(), "end_date": (now + timedelta(days=15)).isoformat(),
+        "total_cost": 800, "policy_type": "OC"
+    })
+    await client.post(f"/vehicles/{opel_id}/inspections/", headers=headers, json={
+        "vehicle_id": opel_id, "inspection_date": now.isoformat(),
+        "expiration_date": (now + timedelta(days=365)).isoformat(), "current_mileage": 50600, "cost": 149
+    })
+
+    res = await client.get("/vehicles/overview", headers=headers)
+    assert res.status_code == 200
+    overview = {v["id"]: v for v in res.json()}
+    assert set(overview) == set(vehicle_ids)
+
+    opel = overview[opel_id]
+    assert opel["insurance_status"] == "EXPIRING_SOON"
+    assert opel["inspection_days_to_expiry"] >= 364
+    assert opel["last_refuel_mileage"] == 50600
+    assert float(opel["ytd_fuel_spent"]) == (120.0 if (now - timedelta(days=3)).year == now.year else 60.0)
+    assert float(opel["ytd_inspection_spent"]) == 149.0
+
+    kia = overview[vehicle_ids[1]]
+    assert kia["insurance_status"] is None
+    assert kia["last_refuel_date"] is None
+    assert float(kia["ytd_spent"]) == 0.0
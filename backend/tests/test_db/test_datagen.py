@@ -0,0 +1,70 @@
+import random
+import uuid
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+import pytest
+from sqlalchemy import func, select
+from app.db.models.fuel import FuelLog, VehicleFuelStats
+from app.db.models.payment import LoanPaymentTotals, Payment
+from app.db.models.timeline import TimelineMonthly, TimelineStaleMonth
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.services.finance_service import FinanceService
+from benchmarks.datagen import Batch, Dictionaries, GeneratorConfig, bank_csv, generate, generate_user, statement_rows
+
+@pytest.mark.parametrize("bank", ["MBANK", "SANTANDER"])
+def test_bank_exports_parse_back(bank):
+    """Every generated operation survives the import parser with its date and amount."""
+    start, end = date(2025, 1, 1), date(2025, 3, 31)
+    content = bank_csv(bank, random.Random(7), 300, start, end)
+    expected = statement_rows(random.Random(7), 300, start, end)
+
+    parsed = FinanceService.parse_csv(content.encode("cp1250").decode("cp1250"), bank_type=bank)
+
+    assert len(parsed) == 300
+    assert sorted(Decimal(str(tx["amount"])) for tx in parsed) == sorted(row.amount for row in expected)
+    assert sorted(tx["date"].date() for tx in parsed) == [row.date for row in expected]
+    assert len({tx["raw_hash"] for tx in parsed}) == 300
+
+def test_users_are_generated_deterministically():
+    dictionaries = Dictionaries([uuid.uuid4()], [uuid.uuid4()], [uuid.uuid4() for _ in range(10)])
+    config = GeneratorConfig(seed=3, years=1, transactions_per_user=30, distribution="pareto")
+    first, second = Batch(), Batch()
+    generate_user(first, config, 0, "hash", dictionaries)
+    generate_user(second, config, 0, "hash", dictionaries)
+    assert first.records == second.records
+
+@pytest.mark.anyio
+async def test_generate_loads_consistent_data(db_session):
+    config = GeneratorConfig(users=3, seed=5, years=1, transactions_per_user=40, meals_per_user=8, weeks_per_user=4)
+    totals = await generate(db_session, config, users_per_commit=2, report=lambda _: None)
+
+    assert totals["users"] == 3
+    assert totals["transactions"] == 120
+    assert totals["week_meals"] == 3 * 4 * 7
+    assert totals["fuel_logs"] > 0
+
+    # The derived tables match what the repositories would have maintained.
+    fuel_stats = (await db_session.execute(select(VehicleFuelStats))).scalars().all()
+    assert len(fuel_stats) == totals["vehicles"]
+    logged = (await db_session.execute(select(func.count()).select_from(FuelLog))).scalar()
+    assert sum(s.entries_count for s in fuel_stats) == logged
+
+    paid = dict((await db_session.execute(select(Payment.loan_id, func.sum(Payment.amount)).group_by(Payment.loan_id))).all())
+    loan_totals = (await db_session.execute(select(LoanPaymentTotals))).scalars().all()
+    assert {t.loan_id: t.total_installments_paid + t.total_prepayments for t in loan_totals if t.payments_count} == paid
+
+    fuel_cost = (await db_session.execute(select(func.sum(FuelLog.total_price)))).scalar()
+    timeline_fuel = (await db_session.execute(
+        select(func.sum(TimelineMonthly.expense)).where(TimelineMonthly.source == "fuel")
+    )).scalar()
+    assert timeline_fuel == fuel_cost
+    assert (await db_session.execute(select(func.count()).select_from(TimelineStaleMonth))).scalar() == 0
+
+    # A re-run with more users only adds the missing ones.
+    again = await generate(db_session, replace(config, users=4), report=lambda _: None)
+    assert again["users"] == 1
+    vehicles = (await db_session.execute(select(func.count()).select_from(Vehicle))).scalar()
+    assert vehicles == totals["vehicles"] + again["vehicles"]
+    assert (await db_session.execute(select(func.count()).select_from(User))).scalar() == 4
@@ -0,0 +1,47 @@
+import json
+import uuid
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from app.db.models.fuel import FuelLog
+from app.db.models.service_event import ServiceEvent
+from app.db.models.inspection import TechnicalInspection
+from app.db.models.insurance import InsurancePolicy
+
+def history_query(model, *order_by):
+    return select(model).where(model.vehicle_id == uuid.uuid4()).order_by(*order_by).limit(20)
+
+HISTORY_QUERIES = [
+    ("ix_dmt_fuel_logs_vehicle_id_date_mileage", history_query(FuelLog, FuelLog.date.desc())),
+    ("ix_dmt_fuel_logs_vehicle_id_date_mileage", history_query(FuelLog, FuelLog.date, FuelLog.mileage)),
+    ("ix_dmt_service_events_vehicle_id_service_date", history_query(ServiceEvent, ServiceEvent.service_date.desc())),
+    (
+        "ix_dmt_service_events_vehicle_id_service_date",
+        history_query(ServiceEvent, ServiceEvent.service_date.desc(), ServiceEvent.mileage_at_service.desc()),
+    ),
+    ("ix_dmt_technical_inspections_vehicle_id_inspection_date", history_query(TechnicalInspection, TechnicalInspection.inspection_date.desc())),
+    ("ix_dmt_insurance_policies_vehicle_id_start_date", history_query(InsurancePolicy, InsurancePolicy.start_date.desc())),
+]
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("index_name,query", HISTORY_QUERIES)
+async def test_vehicle_history_uses_composite_index(db_session, index_name, query):
+    """Per-vehicle history is read in index order, without a separate sort step."""
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    # The test tables are empty, so the scan types that ignore index order are switched off
+    # to see which index the planner would pick once the history grows.
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    plan = (await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = list(plan_nodes(plan[0]["Plan"]))
+
+    assert any(n.get("Index Name") == index_name for n in nodes)
+    assert not any(n["Node Type"] in ("Sort", "Incremental Sort") for n in nodes)
@@ -0,0 +1,38 @@
+import uuid
+import pytest
+from app.db.models.finance import Account
+from app.db.models.user import User
+from app.db.models.vehicle import Vehicle
+from app.db.repositories.finance import FinanceRepository
+from app.db.repositories.user import UserRepository
+from app.db.repositories.vehicle import VehicleRepository
+
+@pytest.mark.anyio
+async def test_cached_statements_bind_each_calls_parameters(db_session):
+    """Lambda statements are compiled once, but every call still filters by its own arguments."""
+    users, vehicles, accounts = [], [], []
+    for i in range(2):
+        suffix = uuid.uuid4().hex[:8]
+        user = User(id=uuid.uuid4(), email=f"cache_{suffix}@wp.pl", login=f"cache_{suffix}", password_hash="x")
+        db_session.add(user)
+        await db_session.flush()
+        vehicle = Vehicle(
+            id=uuid.uuid4(), user_id=user.id, brand="Skoda", model="Fabia", production_year=2015,
+            vin=f"VIN{suffix}{i}", registration_number=f"KR{suffix[:5]}", fuel_type="PB95", current_mileage=1000,
+        )
+        account = Account(id=uuid.uuid4(), user_id=user.id, name="Konto", bank_type="MBANK")
+        db_session.add_all([vehicle, account])
+        users.append(user)
+        vehicles.append(vehicle)
+        accounts.append(account)
+    await db_session.flush()
+
+    for user, vehicle, account in zip(users, vehicles, accounts):
+        assert (await VehicleRepository.get_by_id(db_session, vehicle.id, user.id)).id == vehicle.id
+        assert await FinanceRepository.is_account_owner(db_session, account.id, user.id)
+        assert (await UserRepository.get_by_email_or_login(db_session, user.login)).id == user.id
+        assert (await UserRepository.get_by_email_or_login(db_session, user.email)).id == user.id
+
+    assert await VehicleRepository.get_by_id(db_session, vehicles[0].id, users[1].id) is None
+    assert not await FinanceRepository.is_account_owner(db_session, accounts[1].id, users[0].id)
+    assert await UserRepository.get_by_email_or_login(db_session, "nobody") is None
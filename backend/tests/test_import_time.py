@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use or in the lifespan, never while the app module is imported.
+DEFERRED_MODULES = ("jose", "passlib.context", "argon2", "asyncpg")
+# Cumulative import time of app.main, best of three runs; measured at about 0.5 s locally.
+IMPORT_BUDGET_MS = int(os.environ.get("IMPORT_BUDGET_MS", 1000))
+
+def import_profile(module: str) -> dict:
+    """Cumulative import time in microseconds per module, from `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split(":", 1)[1].split("|")
+            if cumulative.strip().isdigit():
+                profile[name.strip()] = int(cumulative)
+    return profile
+
+def test_app_import_defers_heavy_dependencies():
+    profile = import_profile("app.main")
+    assert "app.main" in profile
+    assert [m for m in DEFERRED_MODULES if m in profile] == []
+
+def test_app_import_within_budget():
+    best_ms = min(import_profile("app.main")["app.main"] for _ in range(3)) / 1000
+    assert best_ms < IMPORT_BUDGET_MS, f"importing app.main took {best_ms:.0f} ms, budget {IMPORT_BUDGET_MS} ms"
@@ -75,10 +75,10 @@ export function previewImport(accountId, file) {
   });
 }
 
-export function confirmImport(accountId, transactionsList) {
-  return request(`/finance/import/confirm/${accountId}`, {
+export function confirmImport(token, overrides = []) {
+  return request(`/finance/import/sessions/${token}/confirm`, {
     method: 'POST',
-    body: JSON.stringify(transactionsList),
+    body: JSON.stringify({ overrides }),
   });
 }
 
@@ -6,6 +6,7 @@ function ImportManager() {
   const [selectedAcc, setSelectedAcc] = useState('');
   const [file, setFile] = useState(null);
   const [previewData, setPreviewData] = useState([]);
+  const [importToken, setImportToken] = useState(null);
   const [loading, setLoading] = useState(false);
   const [message, setMessage] = useState(null);
 
@@ -24,12 +25,14 @@ function ImportManager() {
     setLoading(true);
     setMessage(null);
     setPreviewData([]);
+    setImportToken(null);
 
     const res = await financeApi.previewImport(selectedAcc, file);
     
     if (res.ok) {
-      setPreviewData(res.data);
-      if (res.data.length === 0) {
+      setPreviewData(res.data.transactions);
+      setImportToken(res.data.token);
+      if (res.data.transactions.length === 0) {
           setMessage({ type: 'error', text: 'Plik nie zawiera transakcji lub format jest niepoprawny.' });
       }
     } else {
@@ -44,7 +47,7 @@ function ImportManager() {
 
   const handleConfirm = async () => {
     setLoading(true);
-    const res = await financeApi.confirmImport(selectedAcc, previewData);
+    const res = await financeApi.confirmImport(importToken);
 
     if (res.ok) {
       setMessage({ 
@@ -52,6 +55,7 @@ function ImportManager() {
         text: `Pomyślnie zaimportowano ${previewData.length} transakcji!` 
       });
       setPreviewData([]);
+      setImportToken(null);
       setFile(null);
       if (document.querySelector('input[type="file"]')) {
         document.querySelector('input[type="file"]').value = '';
@@ -59,7 +63,12 @@ function ImportManager() {
     } else {
       const errorDetail = res.data?.detail || '';
       
-      if (errorDetail.includes('possible duplicates')) {
+      if (res.status === 404) {
+        setMessage({ 
+          type: 'error', 
+          text: 'Podgląd wygasł. Wygeneruj go ponownie.' 
+        });
+      } else if (errorDetail.includes('possible duplicates')) {
         setMessage({ 
           type: 'error', 
           text: 'Te dane zostały już wcześniej zaimportowane lub zawierają duplikaty.' 